@@ -43,3 +43,15 @@ result = otuc.process_spectra_tally(
     source_strength=1e9,
 )
 print(f"spectra per pulse = {result}", end="\n\n")
+
+
+# returns the energy group edges of the EnergyFilter instead of the lower
+# energy of each tally value, which has one more value than the number of groups
+result = otuc.process_spectra_tally(
+    tally=my_tally,
+    required_units="centimeter / second",
+    required_energy_units="MeV",
+    source_strength=1e9,
+    energy_group_edges=True,
+)
+print(f"spectra per second with energy group edges = {result}", end="\n\n")
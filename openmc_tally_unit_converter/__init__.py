@@ -4,9 +4,95 @@ from .utils import (
     check_for_dimentionality_difference,
     find_source_strength,
     compute_volume_of_voxels,
+    find_volumes_of_mesh_voxels,
+    expand_voxel_volumes,
+    get_voxel_index_of_tally_values,
+    find_integral_weights,
+    QUANTITY_TYPES,
     process_tally,
     process_dose_tally,
     process_spectra_tally,
     process_damage_energy_tally,
     scale_tally,
+    find_scaling_factors,
+    convert_tally_results,
+    get_tally_mean_and_std_dev,
+    set_tally_array_cache_size,
+    clear_tally_array_cache,
+    find_number_of_atoms_per_cm3,
+    ureg,
+)
+from .spectra import (
+    find_group_structure,
+    find_rebinning_matrix,
+    rebin_spectra,
+    rebin_spectra_tally,
+)
+from .dose import (
+    find_group_averages,
+    find_group_dose_coefficients,
+    process_dose_from_spectra_tally,
+)
+from .reaction_rates import (
+    find_macroscopic_cross_section_matrix,
+    process_reaction_rate_tally,
+)
+from .damage import (
+    DISPLACEMENT_ENERGIES,
+    ARC_DPA_PARAMETERS,
+    find_displacement_energy,
+    find_arc_dpa_parameters,
+    nrt_displacements,
+    arc_dpa_efficiency,
+    find_damage_model_factors,
+)
+from .scenario import IrradiationScenario, process_scenario_tally
+from .arithmetic import (
+    split_tally_result,
+    sum_tally_results,
+    add_tally_results,
+    subtract_tally_results,
+    multiply_tally_results,
+    divide_tally_results,
+)
+from .merge import merge_statepoint_tallies, process_merged_tally
+from .mesh import (
+    find_voxel_centres,
+    find_region_index,
+    find_region_statistics,
+    process_mesh_tally_regions,
+    find_voxel_indices,
+    find_line_points,
+    sample_mesh_tally_result,
+    sample_mesh_tally,
+    coarsen_mesh_tally_result,
+    coarsen_mesh_tally,
+)
+from .streaming import (
+    iter_tally_chunks,
+    iter_converted_chunks,
+    find_streaming_statistics,
+)
+from .sparse import SparseTallyResult, find_tally_sparsity, process_sparse_tally
+from .hdf5 import write_tally_to_hdf5, write_tally_result_to_hdf5, read_tally_from_hdf5
+from .arrow import find_filter_bin_columns, tally_to_arrow_table, write_tally_to_parquet
+from .vtk import write_mesh_tally_to_vtk
+from .npy import write_tally_to_npy, write_tally_result_to_npy, read_tally_from_npy
+from .cache import find_cache_key, cached_process_tally, clear_cache
+from .watch import StatepointWatcher, find_relative_error
+from .aio import (
+    get_executor,
+    set_executor,
+    run_async,
+    process_tally_async,
+    process_dose_tally_async,
+    process_spectra_tally_async,
+    process_damage_energy_tally_async,
+    process_sparse_tally_async,
+)
+from .shared import (
+    SharedArrayHandle,
+    SharedTallyResult,
+    share_tally_result,
+    process_tallies_with_shared_memory,
 )
@@ -0,0 +1,123 @@
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from .sparse import process_sparse_tally
+from .utils import (
+    process_damage_energy_tally,
+    process_dose_tally,
+    process_spectra_tally,
+    process_tally,
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    """Gets the executor that runs the async conversions, creating a thread
+    pool with one worker per core the first time. Threads share the tally
+    array, energy group and region caches and keep the event loop responsive,
+    but the pint unit handling holds the GIL so the conversions of a thread
+    pool do not scale with the number of cores. A ProcessPoolExecutor set
+    with set_executor runs conversions on several cores.
+
+    Returns:
+        The concurrent.futures.Executor
+    """
+
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="otuc"
+            )
+        return _executor
+
+
+def set_executor(executor: Executor) -> Executor:
+    """Sets the executor that runs the async conversions, for example a
+    ThreadPoolExecutor with a different number of workers or a
+    ProcessPoolExecutor. A ProcessPoolExecutor is the way to convert tallies
+    on several cores at once. Processes do not share the in memory caches,
+    and the tallies and results are pickled between the processes.
+
+    Args:
+        executor: The concurrent.futures.Executor. None creates the default
+            thread pool the next time it is needed.
+
+    Returns:
+        The previous executor, which is not shut down
+    """
+
+    global _executor
+    with _executor_lock:
+        previous_executor = _executor
+        _executor = executor
+    return previous_executor
+
+
+async def run_async(function, *args, executor: Executor = None, **kwargs):
+    """Runs a blocking function in the executor without blocking the event
+    loop. Cancelling the awaiting task cancels the call if it has not
+    started. A call that has started runs to completion and its result is
+    discarded.
+
+    Args:
+        function: The function to run, for example process_tally
+        args: The positional arguments of the function
+        executor: The executor to run the function in. Defaults to the
+            executor from get_executor.
+        kwargs: The keyword arguments of the function
+
+    Returns:
+        The result of the function
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or get_executor(), functools.partial(function, *args, **kwargs)
+    )
+
+
+async def process_tally_async(tally, executor: Executor = None, **kwargs):
+    """The async counterpart of process_tally, which takes the same keyword
+    arguments and runs in the executor"""
+
+    return await run_async(process_tally, tally=tally, executor=executor, **kwargs)
+
+
+async def process_dose_tally_async(tally, executor: Executor = None, **kwargs):
+    """The async counterpart of process_dose_tally, which takes the same
+    keyword arguments and runs in the executor"""
+
+    return await run_async(process_dose_tally, tally=tally, executor=executor, **kwargs)
+
+
+async def process_spectra_tally_async(tally, executor: Executor = None, **kwargs):
+    """The async counterpart of process_spectra_tally, which takes the same
+    keyword arguments and runs in the executor"""
+
+    return await run_async(
+        process_spectra_tally, tally=tally, executor=executor, **kwargs
+    )
+
+
+async def process_damage_energy_tally_async(tally, executor: Executor = None, **kwargs):
+    """The async counterpart of process_damage_energy_tally, which takes the
+    same keyword arguments and runs in the executor"""
+
+    return await run_async(
+        process_damage_energy_tally, tally=tally, executor=executor, **kwargs
+    )
+
+
+async def process_sparse_tally_async(tally, executor: Executor = None, **kwargs):
+    """The async counterpart of process_sparse_tally, which takes the same
+    keyword arguments and runs in the executor"""
+
+    return await run_async(
+        process_sparse_tally, tally=tally, executor=executor, **kwargs
+    )
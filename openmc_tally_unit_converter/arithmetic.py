@@ -0,0 +1,251 @@
+import numpy as np
+
+from .utils import ureg
+
+
+def split_tally_result(tally_result):
+    """Splits a converted tally result into the mean and std. dev.
+
+    Args:
+        tally_result: A pint Quantity of tally means or a tuple of the tally
+            mean and std. dev. as returned by the process functions
+
+    Returns:
+        The tally mean and std. dev. as pint Quantities. The std. dev. is None
+        when the tally result has no std. dev.
+    """
+
+    if isinstance(tally_result, tuple):
+        if len(tally_result) != 2:
+            msg = (
+                "tally results must be a Quantity or a tuple of the mean and "
+                f"std. dev. not a tuple of length {len(tally_result)}"
+            )
+            raise ValueError(msg)
+        tally_mean, tally_std_dev = tally_result
+    else:
+        tally_mean, tally_std_dev = tally_result, None
+
+    if not isinstance(tally_mean, ureg.Quantity):
+        tally_mean = ureg.Quantity(np.asarray(tally_mean), ureg.dimensionless)
+    if tally_std_dev is not None and not isinstance(tally_std_dev, ureg.Quantity):
+        tally_std_dev = ureg.Quantity(np.asarray(tally_std_dev), tally_mean.units)
+
+    return tally_mean, tally_std_dev
+
+
+def _get_magnitudes(tally_result, units=None):
+    """Gets the mean and std. dev. magnitudes of a tally result in the units
+    provided or in the units of the mean when units is None."""
+
+    tally_mean, tally_std_dev = split_tally_result(tally_result)
+
+    if units is None:
+        units = tally_mean.units
+    elif tally_mean.dimensionality != ureg.Quantity(1, units).dimensionality:
+        msg = (
+            f"tally results with units of {tally_mean.units} can't be combined "
+            f"with tally results with units of {units}"
+        )
+        raise ValueError(msg)
+
+    mean = np.asarray(tally_mean.to(units).magnitude)
+    if tally_std_dev is None:
+        std_dev = None
+    else:
+        std_dev = np.asarray(tally_std_dev.to(units).magnitude)
+
+    return mean, std_dev, units
+
+
+def _check_shapes(*arrays):
+    """Checks the tally results are aligned and returns the broadcast shape"""
+
+    try:
+        return np.broadcast_shapes(*[np.shape(array) for array in arrays])
+    except ValueError:
+        shapes = ", ".join(str(np.shape(array)) for array in arrays)
+        msg = f"tally results with shapes of {shapes} are not aligned"
+        raise ValueError(msg)
+
+
+def _build_tally_result(mean, std_dev, units):
+    """Builds a tally result with the same form as the process functions"""
+
+    if std_dev is None:
+        return ureg.Quantity(mean, units)
+    return ureg.Quantity(mean, units), ureg.Quantity(std_dev, units)
+
+
+def _convert_tally_result(mean, std_dev, units, required_units):
+    """Converts the mean and std. dev. magnitudes into the required units"""
+
+    if required_units is not None:
+        conversion = ureg.Quantity(1.0, units).to(required_units)
+        mean = mean * conversion.magnitude
+        if std_dev is not None:
+            std_dev = std_dev * conversion.magnitude
+        units = conversion.units
+
+    return _build_tally_result(mean, std_dev, units)
+
+
+def sum_tally_results(tally_results: list, required_units: str = None):
+    """Sums many converted tally results bin by bin. All the tally results are
+    converted into the same units once, stacked and summed in a single
+    vectorized operation. The std. devs. are combined in quadrature assuming
+    the tally results are independent.
+
+    Args:
+        tally_results: A list of pint Quantities or tuples of the tally mean and
+            std. dev. as returned by the process functions
+        required_units: The units of the sum. Defaults to the units of the
+            first tally result.
+
+    Returns:
+        The sum of the tally results and the std. dev. of the sum if any of the
+        tally results have a std. dev.
+    """
+
+    if len(tally_results) == 0:
+        raise ValueError("At least one tally result is required")
+
+    units = None if required_units is None else ureg[required_units].units
+
+    means = []
+    std_devs = []
+    for tally_result in tally_results:
+        mean, std_dev, units = _get_magnitudes(tally_result, units)
+        means.append(mean)
+        if std_dev is not None:
+            std_devs.append(std_dev)
+
+    shape = _check_shapes(*means, *std_devs)
+
+    total = np.sum([np.broadcast_to(mean, shape) for mean in means], axis=0)
+
+    if not std_devs:
+        return _build_tally_result(total, None, units)
+
+    variances = [np.broadcast_to(std_dev, shape) ** 2 for std_dev in std_devs]
+    return _build_tally_result(total, np.sqrt(np.sum(variances, axis=0)), units)
+
+
+def add_tally_results(tally_result_1, tally_result_2, required_units: str = None):
+    """Adds two converted tally results bin by bin.
+
+    Args:
+        tally_result_1: A pint Quantity or a tuple of the tally mean and std.
+            dev. as returned by the process functions
+        tally_result_2: The tally result to add, which must have units that
+            are compatible with tally_result_1
+        required_units: The units of the sum. Defaults to the units of
+            tally_result_1.
+
+    Returns:
+        The sum of the tally results and the std. dev. of the sum if either
+        tally result has a std. dev.
+    """
+
+    return sum_tally_results([tally_result_1, tally_result_2], required_units)
+
+
+def subtract_tally_results(tally_result_1, tally_result_2, required_units: str = None):
+    """Subtracts tally_result_2 from tally_result_1 bin by bin, for example to
+    remove a background run. The std. devs. are combined in quadrature
+    assuming the tally results are independent.
+
+    Args:
+        tally_result_1: A pint Quantity or a tuple of the tally mean and std.
+            dev. as returned by the process functions
+        tally_result_2: The tally result to subtract, which must have units
+            that are compatible with tally_result_1
+        required_units: The units of the difference. Defaults to the units of
+            tally_result_1.
+
+    Returns:
+        The difference of the tally results and the std. dev. of the
+        difference if either tally result has a std. dev.
+    """
+
+    tally_mean_2, tally_std_dev_2 = split_tally_result(tally_result_2)
+    negative_tally_result_2 = (-tally_mean_2, tally_std_dev_2)
+
+    return sum_tally_results([tally_result_1, negative_tally_result_2], required_units)
+
+
+def multiply_tally_results(tally_result_1, tally_result_2, required_units: str = None):
+    """Multiplies two converted tally results bin by bin. The relative std.
+    devs. are combined in quadrature assuming the tally results are
+    independent.
+
+    Args:
+        tally_result_1: A pint Quantity or a tuple of the tally mean and std.
+            dev. as returned by the process functions
+        tally_result_2: The tally result to multiply by
+        required_units: The units of the product. Defaults to the product of
+            the units of the tally results.
+
+    Returns:
+        The product of the tally results and the std. dev. of the product if
+        either tally result has a std. dev.
+    """
+
+    mean_1, std_dev_1, units_1 = _get_magnitudes(tally_result_1)
+    mean_2, std_dev_2, units_2 = _get_magnitudes(tally_result_2)
+    _check_shapes(mean_1, mean_2)
+
+    units = (ureg.Quantity(1, units_1) * ureg.Quantity(1, units_2)).units
+    mean = mean_1 * mean_2
+
+    if std_dev_1 is None and std_dev_2 is None:
+        std_dev = None
+    else:
+        variance = 0.0
+        if std_dev_1 is not None:
+            variance = variance + (std_dev_1 * mean_2) ** 2
+        if std_dev_2 is not None:
+            variance = variance + (mean_1 * std_dev_2) ** 2
+        std_dev = np.sqrt(variance)
+
+    return _convert_tally_result(mean, std_dev, units, required_units)
+
+
+def divide_tally_results(tally_result_1, tally_result_2, required_units: str = None):
+    """Divides tally_result_1 by tally_result_2 bin by bin, for example to find
+    the ratio between two design variants. The relative std. devs. are
+    combined in quadrature assuming the tally results are independent. Bins
+    where tally_result_2 is zero are set to nan.
+
+    Args:
+        tally_result_1: A pint Quantity or a tuple of the tally mean and std.
+            dev. as returned by the process functions
+        tally_result_2: The tally result to divide by
+        required_units: The units of the ratio. Defaults to the ratio of the
+            units of the tally results.
+
+    Returns:
+        The ratio of the tally results and the std. dev. of the ratio if either
+        tally result has a std. dev.
+    """
+
+    mean_1, std_dev_1, units_1 = _get_magnitudes(tally_result_1)
+    mean_2, std_dev_2, units_2 = _get_magnitudes(tally_result_2)
+    _check_shapes(mean_1, mean_2)
+
+    units = (ureg.Quantity(1, units_1) / ureg.Quantity(1, units_2)).units
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(mean_2 == 0, np.nan, mean_1 / mean_2)
+
+        if std_dev_1 is None and std_dev_2 is None:
+            std_dev = None
+        else:
+            variance = 0.0
+            if std_dev_1 is not None:
+                variance = variance + (std_dev_1 / mean_2) ** 2
+            if std_dev_2 is not None:
+                variance = variance + (mean_1 * std_dev_2 / mean_2**2) ** 2
+            std_dev = np.where(mean_2 == 0, np.nan, np.sqrt(variance))
+
+    return _convert_tally_result(mean, std_dev, units, required_units)
@@ -0,0 +1,173 @@
+import json
+
+import numpy as np
+import openmc
+
+from .utils import process_tally
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        msg = (
+            "pyarrow is required to export tallies to Arrow and Parquet. It "
+            "can be installed with 'pip install openmc_tally_unit_converter[parquet]'"
+        )
+        raise ImportError(msg)
+    return pyarrow
+
+
+def _bin_indices(number_of_bins: int, repeats: int, tiles: int) -> np.ndarray:
+    """Finds the bin index of each tally value for a filter, nuclide or
+    score axis in the flat tally order"""
+
+    return np.tile(np.repeat(np.arange(number_of_bins, dtype=np.int32), repeats), tiles)
+
+
+def find_filter_bin_columns(tally) -> dict:
+    """Finds the filter, nuclide and score of each tally value as dictionary
+    indices and dictionary values, in the flat tally order. The columns
+    follow the naming of the openmc tally pandas dataframe.
+
+    Args:
+        tally: The openmc.Tally object
+
+    Returns:
+        Dictionary with the column names as keys and tuples of the int32
+        dictionary indices and the dictionary values as values
+    """
+
+    axes = [(tally_filter, tally_filter.num_bins) for tally_filter in tally.filters]
+    axes.append(("nuclide", len(tally.nuclides)))
+    axes.append(("score", len(tally.scores)))
+    axis_sizes = [number_of_bins for _, number_of_bins in axes]
+
+    columns = {}
+    for axis_number, (axis, number_of_bins) in enumerate(axes):
+        repeats = int(np.prod(axis_sizes[axis_number + 1 :]))
+        tiles = int(np.prod(axis_sizes[:axis_number]))
+        indices = _bin_indices(number_of_bins, repeats, tiles)
+
+        if axis == "nuclide":
+            columns["nuclide"] = (indices, np.asarray(tally.nuclides, dtype=str))
+        elif axis == "score":
+            columns["score"] = (indices, np.asarray(tally.scores, dtype=str))
+        elif isinstance(axis, openmc.EnergyFilter):
+            columns["energy low [eV]"] = (indices, np.asarray(axis.values[:-1]))
+            columns["energy high [eV]"] = (indices, np.asarray(axis.values[1:]))
+        elif isinstance(axis, openmc.MeshFilter):
+            # the x index varies fastest and the indices start from 1
+            for direction, number in zip("xyz", axis.mesh.dimension):
+                columns[f"mesh {direction}"] = (
+                    (indices % number).astype(np.int32),
+                    np.arange(1, number + 1),
+                )
+                indices = indices // number
+        else:
+            name = type(axis).__name__.replace("Filter", "").lower()
+            bins = np.asarray(axis.bins)
+            if bins.ndim != 1:
+                bins = np.array([str(tally_bin) for tally_bin in axis.bins])
+            columns[name] = (indices, bins)
+
+    return columns
+
+
+def tally_to_arrow_table(tally, process_function=process_tally, **kwargs):
+    """Processes a tally into the required units and builds an Arrow table
+    directly from the converted NumPy arrays without copying them. The filter
+    bin columns are dictionary encoded and the units are stored in the field
+    metadata.
+
+    Args:
+        tally: The openmc.Tally object
+        process_function: The function used to process the tally, for example
+            process_tally or process_dose_tally. The function must return
+            the tally values in the flat tally order.
+        kwargs: Additional arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        The pyarrow.Table with a row for each tally value
+    """
+
+    pyarrow = _import_pyarrow()
+
+    tally_result = process_function(tally=tally, **kwargs)
+    if isinstance(tally_result, tuple):
+        tally_mean, tally_std_dev = tally_result
+    else:
+        tally_mean, tally_std_dev = tally_result, None
+
+    arrays = []
+    fields = []
+    for name, (indices, dictionary) in find_filter_bin_columns(tally).items():
+        array = pyarrow.DictionaryArray.from_arrays(
+            pyarrow.array(indices), pyarrow.array(dictionary)
+        )
+        arrays.append(array)
+        fields.append(pyarrow.field(name, array.type))
+
+    units_metadata = {"units": str(tally_mean.units)}
+    columns = {"mean": tally_mean}
+    if tally_std_dev is not None:
+        columns["std. dev."] = tally_std_dev.to(tally_mean.units)
+    for name, values in columns.items():
+        # float64 arrays without nulls are wrapped without a copy
+        values = np.ascontiguousarray(np.ravel(values.magnitude), dtype=np.float64)
+        arrays.append(pyarrow.array(values))
+        fields.append(pyarrow.field(name, pyarrow.float64(), metadata=units_metadata))
+
+    table_metadata = {
+        "tally_id": str(tally.id),
+        "tally_name": tally.name or "",
+        "conversion": json.dumps(
+            {
+                key: value
+                for key, value in kwargs.items()
+                if isinstance(value, (str, int, float))
+            }
+        ),
+    }
+
+    return pyarrow.Table.from_arrays(
+        arrays, schema=pyarrow.schema(fields, metadata=table_metadata)
+    )
+
+
+def write_tally_to_parquet(
+    filename,
+    tally,
+    process_function=process_tally,
+    row_group_size: int = 2**20,
+    compression: str = "zstd",
+    **kwargs,
+):
+    """Processes a tally into the required units and writes it to a Parquet
+    file in row groups.
+
+    Args:
+        filename: The path of the Parquet file
+        tally: The openmc.Tally object
+        process_function: The function used to process the tally, for example
+            process_tally or process_dose_tally
+        row_group_size: The maximum number of rows in each row group
+        compression: The Parquet compression codec
+        kwargs: Additional arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        The pyarrow.Table that was written
+    """
+
+    pyarrow = _import_pyarrow()
+
+    table = tally_to_arrow_table(tally, process_function, **kwargs)
+
+    pyarrow.parquet.write_table(
+        table, filename, row_group_size=row_group_size, compression=compression
+    )
+
+    return table
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pint
+
+from .npy import METADATA_FILENAME, read_tally_from_npy, write_tally_result_to_npy
+from .sparse import SparseTallyResult
+from .utils import get_tally_mean_and_std_dev, process_tally, ureg
+
+# increased when the layout of the cache entries changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_CACHE_SIZE = 2**30
+
+# temporary and evicted entries older than this in seconds were left by
+# processes that stopped before removing them
+STALE_ENTRY_AGE = 3600
+
+UNITS_DEFINITIONS_FILENAME = Path(__file__).parent / "neutronics_units.txt"
+
+
+@lru_cache(maxsize=1)
+def _find_units_version() -> str:
+    """Finds the version of the units registry from the pint version and the
+    contents of the units definitions file"""
+
+    definitions = hashlib.sha256(UNITS_DEFINITIONS_FILENAME.read_bytes()).hexdigest()
+    return f"{pint.__version__} {definitions}"
+
+
+@lru_cache(maxsize=64)
+def _hash_file(filename: str, mtime_ns: int, size: int) -> str:
+    """Finds the sha256 of a file. The modification time and size are part of
+    the lru_cache key so a changed file is hashed again."""
+
+    digest = hashlib.sha256()
+    with open(filename, "rb") as statepoint_file:
+        for block in iter(lambda: statepoint_file.read(2**20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _find_statepoint_key(tally, hash_statepoint: bool):
+    """Finds the part of the cache key that identifies the tally values"""
+
+    filename = getattr(tally, "_sp_filename", None)
+    if filename is None:
+        # tallies that were merged or built in memory are keyed by their values
+        digest = hashlib.sha256()
+        for values in get_tally_mean_and_std_dev(tally):
+            if values is not None:
+                digest.update(np.ascontiguousarray(values, dtype=np.float64))
+        return {"values": digest.hexdigest()}
+
+    filename = os.path.realpath(filename)
+    stat = os.stat(filename)
+    if hash_statepoint:
+        return {"sha256": _hash_file(filename, stat.st_mtime_ns, stat.st_size)}
+    return {"filename": filename, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _serialise_argument(value):
+    """Converts a conversion argument into a JSON compatible value that
+    changes whenever the argument changes"""
+
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, ureg.Quantity):
+        return [_serialise_argument(value.magnitude), str(value.units)]
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        return [
+            str(array.dtype),
+            list(array.shape),
+            hashlib.sha256(array.tobytes()).hexdigest(),
+        ]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_serialise_argument(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _serialise_argument(item) for key, item in value.items()}
+    # objects such as openmc.Material are keyed by their representation
+    return repr(value)
+
+
+def find_cache_key(
+    tally, process_function=process_tally, hash_statepoint: bool = False, **kwargs
+) -> str:
+    """Finds the key of a converted tally in the cache. The key changes when
+    the statepoint file, the tally, the process function, any of the
+    conversion arguments or the units registry change.
+
+    Args:
+        tally: The openmc.Tally object
+        process_function: The function used to process the tally, for example
+            process_tally or process_dose_tally
+        hash_statepoint: If True the statepoint file is identified by the
+            sha256 of its contents rather than its path, modification time
+            and size
+        kwargs: The arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        The hexadecimal sha256 key
+    """
+
+    key = {
+        "format": CACHE_FORMAT_VERSION,
+        "units": _find_units_version(),
+        "statepoint": _find_statepoint_key(tally, hash_statepoint),
+        "tally_id": tally.id,
+        "process_function": (
+            f"{process_function.__module__}.{process_function.__qualname__}"
+        ),
+        "arguments": {
+            name: _serialise_argument(value) for name, value in sorted(kwargs.items())
+        },
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def _find_result_type(tally_result) -> str:
+    """Finds the form of a tally result or None if it can't be cached"""
+
+    if isinstance(tally_result, SparseTallyResult):
+        return "sparse"
+    if isinstance(tally_result, ureg.Quantity):
+        return "quantity"
+    if (
+        isinstance(tally_result, tuple)
+        and len(tally_result) == 2
+        and all(isinstance(values, ureg.Quantity) for values in tally_result)
+    ):
+        return "tuple"
+    return None
+
+
+def _read_entry(entry: Path, mmap_mode: str):
+    """Reads a cache entry and marks it as recently used. None is returned
+    when the entry is missing or was removed by another process while it was
+    being read."""
+
+    try:
+        tally_result, metadata = read_tally_from_npy(entry, mmap_mode=mmap_mode)
+        os.utime(entry / METADATA_FILENAME)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if _find_result_type(tally_result) != metadata.get("result_type"):
+        return None
+    return tally_result
+
+
+def _write_entry(cache_directory: Path, key: str, tally_result, result_type: str):
+    """Writes a cache entry to a temporary directory which is then renamed,
+    so other processes only ever see complete entries"""
+
+    temporary_entry = cache_directory / f".{key}.{uuid.uuid4().hex}.tmp"
+    try:
+        write_tally_result_to_npy(
+            temporary_entry, tally_result, result_type=result_type
+        )
+        os.rename(temporary_entry, cache_directory / key)
+    except OSError:
+        # another process wrote the same entry first
+        shutil.rmtree(temporary_entry, ignore_errors=True)
+
+
+def _find_entry_size(entry: Path) -> int:
+    return sum(path.stat().st_size for path in entry.iterdir())
+
+
+def _evict_entries(cache_directory: Path, max_cache_size: int):
+    """Removes the least recently used entries until the cache is no larger
+    than max_cache_size. Entries are renamed before they are removed so
+    readers never see a partly removed entry."""
+
+    entries = []
+    for entry in cache_directory.iterdir():
+        try:
+            if entry.name.startswith("."):
+                if time.time() - entry.stat().st_mtime > STALE_ENTRY_AGE:
+                    shutil.rmtree(entry, ignore_errors=True)
+                continue
+            last_used = (entry / METADATA_FILENAME).stat().st_mtime
+            entries.append((last_used, _find_entry_size(entry), entry))
+        except OSError:
+            # the entry is being written or was removed by another process
+            continue
+
+    cache_size = 0
+    for _, size, entry in sorted(entries, key=lambda item: item[0], reverse=True):
+        cache_size += size
+        if cache_size <= max_cache_size:
+            continue
+        evicted_entry = cache_directory / f".{entry.name}.{uuid.uuid4().hex}.evict"
+        try:
+            os.rename(entry, evicted_entry)
+        except OSError:
+            continue
+        shutil.rmtree(evicted_entry, ignore_errors=True)
+
+
+def cached_process_tally(
+    tally,
+    cache_directory,
+    max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+    process_function=process_tally,
+    hash_statepoint: bool = False,
+    mmap_mode: str = None,
+    **kwargs,
+):
+    """Processes a tally into the required units, reusing the converted
+    arrays from a disk cache when the same tally was processed with the same
+    arguments before. Entries are written and evicted with atomic renames so
+    the cache can be shared by several processes. Results that are not a
+    pint Quantity, a tuple of the tally mean and std. dev. or a
+    SparseTallyResult are returned without being cached.
+
+    Args:
+        tally: The openmc.Tally object
+        cache_directory: The directory of the cache, which is created if it
+            does not exist
+        max_cache_size: The maximum size of the cache in bytes. The least
+            recently used entries are removed when a new entry makes the cache
+            larger than this. None does not limit the size.
+        process_function: The function used to process the tally, for example
+            process_tally or process_dose_tally
+        hash_statepoint: If True the statepoint file is identified by the
+            sha256 of its contents rather than its path, modification time
+            and size
+        mmap_mode: The np.load memory map mode used to read cached arrays.
+            None reads the arrays into memory.
+        kwargs: Additional arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        The tally result in the required units
+    """
+
+    cache_directory = Path(cache_directory)
+    cache_directory.mkdir(parents=True, exist_ok=True)
+
+    key = find_cache_key(tally, process_function, hash_statepoint, **kwargs)
+
+    tally_result = _read_entry(cache_directory / key, mmap_mode)
+    if tally_result is not None:
+        return tally_result
+
+    tally_result = process_function(tally=tally, **kwargs)
+
+    result_type = _find_result_type(tally_result)
+    if result_type is not None:
+        _write_entry(cache_directory, key, tally_result, result_type)
+        if max_cache_size is not None:
+            _evict_entries(cache_directory, max_cache_size)
+
+    return tally_result
+
+
+def clear_cache(cache_directory):
+    """Removes all the entries from a disk cache.
+
+    Args:
+        cache_directory: The directory of the cache
+    """
+
+    cache_directory = Path(cache_directory)
+    if cache_directory.is_dir():
+        _evict_entries(cache_directory, max_cache_size=-1)
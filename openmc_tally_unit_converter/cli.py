@@ -0,0 +1,412 @@
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import openmc
+
+from .arrow import write_tally_to_parquet
+from .hdf5 import write_tally_result_to_hdf5, write_tally_to_hdf5
+from .utils import process_damage_energy_tally, process_dose_tally, process_tally
+from .vtk import VTK_FILE_TYPES, write_mesh_tally_to_vtk
+
+PROCESSORS = {
+    "tally": process_tally,
+    "dose": process_dose_tally,
+    "damage_energy": process_damage_energy_tally,
+}
+
+OUTPUT_FORMATS = {"hdf5": ".h5", "parquet": ".parquet", "vtk": None}
+
+# the options of the tally processor that the streaming writers accept
+STREAMING_OPTIONS = {"required_units", "source_strength", "volume"}
+
+
+def _import_yaml():
+    try:
+        import yaml
+    except ImportError:
+        msg = (
+            "pyyaml is required to read YAML conversion specs. It can be "
+            "installed with 'pip install openmc_tally_unit_converter[yaml]' or "
+            "the spec can be written as JSON"
+        )
+        raise ImportError(msg)
+    return yaml
+
+
+def _convert_numbers(value):
+    """Converts strings such as '1e20', which YAML reads as strings, into
+    floats"""
+
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    if isinstance(value, list):
+        return [_convert_numbers(item) for item in value]
+    return value
+
+
+def load_conversion_spec(filename) -> dict:
+    """Loads a YAML or JSON conversion spec that maps tally names to the
+    options used to convert them. For example
+
+    .. code-block:: yaml
+
+        2_heating:
+          processor: tally
+          required_units: watts
+          source_strength: 1.0e+20
+        2_damage-energy:
+          processor: damage_energy
+          required_units: displacements per atom / second
+          source_strength: 1.0e+20
+          volume: 100
+          energy_per_displacement: 40
+          material:
+            elements: {Fe: 1.0}
+            density: 7.8
+            density_units: g/cm3
+
+    The processor is one of "tally", "dose" or "damage_energy" and defaults
+    to "tally". An optional format overrides the output format of the
+    command for that tally. The other options are passed to the processor.
+
+    Args:
+        filename: The path of the .yaml, .yml or .json spec file
+
+    Returns:
+        Dictionary with the tally names as keys and the options as values
+    """
+
+    filename = Path(filename)
+    text = filename.read_text()
+    if filename.suffix in [".yaml", ".yml"]:
+        spec = _import_yaml().safe_load(text)
+    else:
+        spec = json.loads(text)
+
+    if not isinstance(spec, dict):
+        raise ValueError(f"{filename} should map tally names to conversion options")
+
+    for tally_name, options in spec.items():
+        options = options or {}
+        if not isinstance(options, dict):
+            msg = f"The options of tally {tally_name} in {filename} should be a mapping"
+            raise ValueError(msg)
+        processor = options.get("processor", "tally")
+        if processor not in PROCESSORS:
+            msg = (
+                f"processor {processor} of tally {tally_name} is not supported. "
+                f"The supported processors are {list(PROCESSORS.keys())}"
+            )
+            raise ValueError(msg)
+        output_format = options.get("format")
+        if output_format is not None and output_format not in OUTPUT_FORMATS:
+            msg = (
+                f"format {output_format} of tally {tally_name} is not supported. "
+                f"The supported formats are {list(OUTPUT_FORMATS.keys())}"
+            )
+            raise ValueError(msg)
+        spec[tally_name] = options
+
+    return spec
+
+
+def make_material(material_spec: dict) -> openmc.Material:
+    """Makes the openmc.Material used by the damage_energy processor from the
+    material options of a conversion spec.
+
+    Args:
+        material_spec: Dictionary with "elements" and/or "nuclides" mapping
+            names to fractions, the "density", and optionally the
+            "density_units" (default "g/cm3") and "percent_type" (default
+            "ao")
+
+    Returns:
+        The openmc.Material
+    """
+
+    percent_type = material_spec.get("percent_type", "ao")
+    material = openmc.Material()
+    for element, fraction in material_spec.get("elements", {}).items():
+        material.add_element(element, float(fraction), percent_type=percent_type)
+    for nuclide, fraction in material_spec.get("nuclides", {}).items():
+        material.add_nuclide(nuclide, float(fraction), percent_type=percent_type)
+    if "density" not in material_spec:
+        raise ValueError("The material of a conversion spec needs a density")
+    material.set_density(
+        material_spec.get("density_units", "g/cm3"), float(material_spec["density"])
+    )
+    return material
+
+
+def parse_tally_options(options: dict):
+    """Finds the processor and the processor arguments from the options of a
+    tally in a conversion spec.
+
+    Args:
+        options: The conversion options of the tally from the conversion spec
+
+    Returns:
+        The name of the processor and a dictionary of the arguments to pass
+        to it
+    """
+
+    options = dict(options)
+    processor = options.pop("processor", "tally")
+    options.pop("format", None)
+    material_spec = options.pop("material", None)
+    kwargs = {
+        name: value if name == "required_units" else _convert_numbers(value)
+        for name, value in options.items()
+    }
+    if material_spec is not None:
+        kwargs["material"] = make_material(material_spec)
+    return processor, kwargs
+
+
+def _find_output_filename(
+    output_directory: Path, statepoint_filename, tally, output_format
+):
+    safe_tally_name = re.sub(r"[^\w.-]+", "_", tally.name or f"tally_{tally.id}")
+    if output_format == "vtk":
+        mesh = tally.find_filter(filter_type=openmc.MeshFilter).mesh
+        _, extension = VTK_FILE_TYPES[type(mesh).__name__]
+    else:
+        extension = OUTPUT_FORMATS[output_format]
+    return (
+        output_directory
+        / f"{Path(statepoint_filename).stem}_{safe_tally_name}{extension}"
+    )
+
+
+def convert_statepoint_tally(
+    statepoint_filename,
+    tally_name: str,
+    options: dict,
+    output_directory,
+    output_format: str = "hdf5",
+) -> Path:
+    """Converts a tally of a statepoint file with the options of a conversion
+    spec and writes the result. The statepoint is opened by this function so
+    it can be run in a separate process.
+
+    Args:
+        statepoint_filename: The path of the statepoint file
+        tally_name: The name of the tally to convert
+        options: The conversion options of the tally from the conversion spec
+        output_directory: The directory to write the result into
+        output_format: The output format, "hdf5", "parquet" or "vtk", which is
+            overridden by a format in the options
+
+    Returns:
+        The path of the file that was written
+    """
+
+    processor, kwargs = parse_tally_options(options)
+    output_format = options.get("format") or output_format
+
+    output_directory = Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    with openmc.StatePoint(filepath=str(statepoint_filename)) as statepoint:
+        tally = statepoint.get_tally(name=tally_name)
+        filename = _find_output_filename(
+            output_directory, statepoint_filename, tally, output_format
+        )
+        filename.unlink(missing_ok=True)
+
+        if output_format == "parquet":
+            write_tally_to_parquet(
+                filename, tally, process_function=PROCESSORS[processor], **kwargs
+            )
+        elif output_format == "vtk":
+            if processor != "tally" or not set(kwargs) <= STREAMING_OPTIONS:
+                msg = (
+                    "vtk output supports the tally processor with the "
+                    "required_units, source_strength and volume options"
+                )
+                raise ValueError(msg)
+            write_mesh_tally_to_vtk(filename, tally, **kwargs)
+        elif processor == "tally" and set(kwargs) <= STREAMING_OPTIONS:
+            # the converted values are streamed into the file in chunks
+            write_tally_to_hdf5(filename, tally, group_name=tally_name, **kwargs)
+        else:
+            tally_result = PROCESSORS[processor](tally=tally, **kwargs)
+            write_tally_result_to_hdf5(
+                filename,
+                tally_result,
+                group_name=tally_name,
+                tally_id=tally.id,
+                processor=processor,
+            )
+
+    return filename
+
+
+def run_conversions(
+    statepoint_filenames,
+    spec: dict,
+    output_directory,
+    output_format: str = "hdf5",
+    workers: int = 1,
+):
+    """Converts the tallies of a conversion spec in each statepoint file,
+    running the conversions in a pool of worker processes.
+
+    Args:
+        statepoint_filenames: The paths of the statepoint files
+        spec: The conversion spec from load_conversion_spec
+        output_directory: The directory to write the results into
+        output_format: The default output format, "hdf5", "parquet" or "vtk"
+        workers: The number of worker processes. 1 runs the conversions in
+            this process.
+
+    Returns:
+        A list with a tuple for each conversion of the statepoint filename,
+        the tally name and either the output filename or the exception that
+        stopped the conversion
+    """
+
+    if output_format not in OUTPUT_FORMATS:
+        msg = (
+            f"output_format {output_format} is not supported. The supported "
+            f"formats are {list(OUTPUT_FORMATS.keys())}"
+        )
+        raise ValueError(msg)
+
+    jobs = [
+        (statepoint_filename, tally_name, options, output_directory, output_format)
+        for statepoint_filename in statepoint_filenames
+        for tally_name, options in spec.items()
+    ]
+
+    results = []
+    if workers == 1:
+        for job in jobs:
+            try:
+                results.append((job[0], job[1], convert_statepoint_tally(*job)))
+            except Exception as error:
+                results.append((job[0], job[1], error))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(convert_statepoint_tally, *job) for job in jobs]
+        for job, future in zip(jobs, futures):
+            try:
+                results.append((job[0], job[1], future.result()))
+            except Exception as error:
+                results.append((job[0], job[1], error))
+    return results
+
+
+def main(args=None) -> int:
+    """The otuc console command"""
+
+    parser = argparse.ArgumentParser(
+        prog="otuc",
+        description=(
+            "Converts OpenMC tallies in statepoint files into user specified "
+            "units with a YAML or JSON conversion spec"
+        ),
+    )
+    parser.add_argument(
+        "statepoints",
+        nargs="+",
+        help="The statepoint files, or the directory to watch with --watch",
+    )
+    parser.add_argument(
+        "-s", "--spec", required=True, help="The YAML or JSON conversion spec"
+    )
+    parser.add_argument(
+        "-o",
+        "--output-directory",
+        default=".",
+        help="The directory to write the results into",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        default="hdf5",
+        choices=list(OUTPUT_FORMATS.keys()),
+        help="The default output format",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Watches the directory for statepoints written during a simulation "
+            "and publishes the latest results and relative error trends"
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=10.0,
+        help="The time between polls of the watched directory in seconds",
+    )
+    parser.add_argument(
+        "--stop-file",
+        default=None,
+        help="A file which stops the watcher when it exists",
+    )
+    parser.add_argument(
+        "--cache-directory",
+        default=None,
+        help="The directory of the conversion cache used by the watcher",
+    )
+    arguments = parser.parse_args(args)
+
+    spec = load_conversion_spec(arguments.spec)
+
+    if arguments.watch:
+        # imported here as the watcher uses the spec parsing of this module
+        from .watch import StatepointWatcher
+
+        if len(arguments.statepoints) != 1:
+            parser.error("--watch needs a single directory to watch")
+        watcher = StatepointWatcher(
+            arguments.statepoints[0],
+            spec,
+            arguments.output_directory,
+            cache_directory=arguments.cache_directory,
+        )
+        watcher.watch(interval=arguments.interval, stop_filename=arguments.stop_file)
+        return 0
+
+    results = run_conversions(
+        arguments.statepoints,
+        spec,
+        arguments.output_directory,
+        arguments.format,
+        arguments.workers,
+    )
+
+    number_of_errors = 0
+    for statepoint_filename, tally_name, output in results:
+        if isinstance(output, Exception):
+            number_of_errors += 1
+            print(
+                f"{statepoint_filename} {tally_name}: {output}",
+                file=sys.stderr,
+            )
+        else:
+            print(output)
+
+    return 1 if number_of_errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
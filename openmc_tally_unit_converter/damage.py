@@ -0,0 +1,256 @@
+import re
+
+import numpy as np
+
+# threshold displacement energies in eV. The values are the ASTM E521
+# recommendations, except for elements with arc-dpa parameters where the
+# threshold used in the arc-dpa fits of Nordlund et al. (2018) is used
+DISPLACEMENT_ENERGIES = {
+    "Be": 31.0,
+    "C": 31.0,
+    "Al": 27.0,
+    "Si": 25.0,
+    "Ti": 30.0,
+    "V": 40.0,
+    "Cr": 40.0,
+    "Mn": 40.0,
+    "Fe": 40.0,
+    "Co": 40.0,
+    "Ni": 39.0,
+    "Cu": 33.0,
+    "Zr": 40.0,
+    "Nb": 40.0,
+    "Mo": 60.0,
+    "Pd": 41.0,
+    "Ag": 39.0,
+    "Ta": 90.0,
+    "W": 70.0,
+    "Pt": 42.0,
+    "Pb": 25.0,
+}
+
+# arc-dpa efficiency parameters (b, c) from Nordlund et al. (2018)
+ARC_DPA_PARAMETERS = {
+    "Fe": (-0.568, 0.286),
+    "Ni": (-1.01, 0.23),
+    "Cu": (-0.68, 0.16),
+    "Pd": (-0.88, 0.15),
+    "Ag": (-1.06, 0.28),
+    "W": (-0.56, 0.12),
+    "Pt": (-1.12, 0.11),
+}
+
+DAMAGE_MODELS = ("nrt", "arc-dpa")
+
+
+def get_element_atom_fractions(material) -> dict:
+    """Finds the atom fraction of each element in an openmc.Material"""
+
+    element_densities = {}
+    for nuclide, density in material.get_nuclide_atom_densities().items():
+        # older versions of openmc return a tuple of (nuclide, density)
+        if isinstance(density, tuple):
+            density = density[1]
+        element = re.match(r"[A-Z][a-z]?", nuclide).group()
+        element_densities[element] = element_densities.get(element, 0.0) + density
+
+    total_density = sum(element_densities.values())
+    return {
+        element: density / total_density
+        for element, density in element_densities.items()
+    }
+
+
+def map_materials(function, material):
+    """Evaluates a function of a material for a single openmc.Material or for
+    a sequence of materials with one material per tally value. Each distinct
+    material of a sequence is evaluated once.
+
+    Args:
+        function: The function of an openmc.Material
+        material: The openmc.Material or the sequence of materials
+
+    Returns:
+        The value of the function, or an array with the value for each
+        material of the sequence
+    """
+
+    if not isinstance(material, (list, tuple, np.ndarray)):
+        return function(material)
+
+    values = {}
+    for item in material:
+        if id(item) not in values:
+            values[id(item)] = function(item)
+    return np.array([values[id(item)] for item in material], dtype=float)
+
+
+def find_displacement_energy(material) -> float:
+    """Finds the threshold displacement energy of a material by weighting the
+    threshold displacement energy of each element by its atom fraction.
+
+    Args:
+        material: The openmc.Material to find the displacement energy of
+
+    Returns:
+        The threshold displacement energy in eV
+    """
+
+    atom_fractions = get_element_atom_fractions(material)
+
+    missing_elements = set(atom_fractions) - set(DISPLACEMENT_ENERGIES)
+    if missing_elements:
+        msg = (
+            f"Displacement energies are not available for {sorted(missing_elements)}. "
+            "Please specify the displacement_energy argument"
+        )
+        raise ValueError(msg)
+
+    return sum(
+        fraction * DISPLACEMENT_ENERGIES[element]
+        for element, fraction in atom_fractions.items()
+    )
+
+
+def find_arc_dpa_parameters(material) -> tuple:
+    """Finds the arc-dpa efficiency parameters b and c of a material by
+    weighting the parameters of each element by its atom fraction.
+
+    Args:
+        material: The openmc.Material to find the arc-dpa parameters of
+
+    Returns:
+        Tuple of the b and c arc-dpa parameters
+    """
+
+    atom_fractions = get_element_atom_fractions(material)
+
+    missing_elements = set(atom_fractions) - set(ARC_DPA_PARAMETERS)
+    if missing_elements:
+        msg = (
+            f"arc-dpa parameters are not available for {sorted(missing_elements)}. "
+            f"Parameters are available for {sorted(ARC_DPA_PARAMETERS)}"
+        )
+        raise ValueError(msg)
+
+    b = sum(
+        fraction * ARC_DPA_PARAMETERS[element][0]
+        for element, fraction in atom_fractions.items()
+    )
+    c = sum(
+        fraction * ARC_DPA_PARAMETERS[element][1]
+        for element, fraction in atom_fractions.items()
+    )
+    return b, c
+
+
+def nrt_displacements(damage_energy, displacement_energy):
+    """Finds the number of displacements with the Norgett-Robinson-Torrens
+    (NRT) model. Vectorized over arrays of damage energies.
+
+    Args:
+        damage_energy: The damage energy of each recoil in eV
+        displacement_energy: The threshold displacement energy in eV
+
+    Returns:
+        The number of displacements
+    """
+
+    damage_energy = np.asarray(damage_energy, dtype=float)
+    linear_threshold = 2.0 * displacement_energy / 0.8
+
+    return np.where(
+        damage_energy < displacement_energy,
+        0.0,
+        np.where(
+            damage_energy < linear_threshold,
+            1.0,
+            0.8 * damage_energy / (2.0 * displacement_energy),
+        ),
+    )
+
+
+def arc_dpa_efficiency(damage_energy, displacement_energy, b, c):
+    """Finds the athermal recombination corrected (arc-dpa) efficiency which
+    is the ratio of arc-dpa displacements to NRT displacements. Vectorized
+    over arrays of damage energies.
+
+    Args:
+        damage_energy: The damage energy of each recoil in eV
+        displacement_energy: The threshold displacement energy in eV
+        b: The arc-dpa b parameter
+        c: The arc-dpa c parameter
+
+    Returns:
+        The arc-dpa efficiency
+    """
+
+    damage_energy = np.asarray(damage_energy, dtype=float)
+    linear_threshold = 2.0 * displacement_energy / 0.8
+
+    efficiency = (1.0 - c) / linear_threshold**b * np.maximum(
+        damage_energy, linear_threshold
+    ) ** b + c
+
+    return np.where(damage_energy < linear_threshold, 1.0, efficiency)
+
+
+def find_damage_model_factors(
+    damage_model: str,
+    material=None,
+    displacement_energy: float = None,
+    recoil_damage_energy=None,
+) -> tuple:
+    """Finds the energy per displacement and displacement efficiency of a
+    damage model. Damage-energy tallies sum the damage energy of all recoils
+    so the linear part of the NRT model is applied, which displaces one atom
+    per 2 * displacement_energy / 0.8 of damage energy.
+
+    Args:
+        damage_model: The damage model, either "nrt" or "arc-dpa"
+        material: The openmc.Material used to find the composition weighted
+            displacement energy and arc-dpa parameters. Can be a sequence with
+            one material per tally value.
+        displacement_energy: The threshold displacement energy in eV. This
+            optional argument overwrites the displacement energy found from
+            the material. Can be an array with one value per tally value.
+        recoil_damage_energy: The average damage energy per recoil in eV that
+            the arc-dpa efficiency is evaluated at. Can be an array with one
+            value per tally bin. Required for the arc-dpa model.
+
+    Returns:
+        Tuple of the energy per displacement in eV and the displacement
+        efficiency
+    """
+
+    if damage_model not in DAMAGE_MODELS:
+        msg = f"damage_model must be one of {DAMAGE_MODELS}, not {damage_model}"
+        raise ValueError(msg)
+
+    if displacement_energy is None:
+        if material is None:
+            msg = (
+                "The material or displacement_energy is required to find the "
+                f"displacements with the {damage_model} damage model"
+            )
+            raise ValueError(msg)
+        displacement_energy = map_materials(find_displacement_energy, material)
+
+    energy_per_displacement = 2.0 * displacement_energy / 0.8
+
+    if damage_model == "nrt":
+        return energy_per_displacement, 1.0
+
+    if recoil_damage_energy is None:
+        msg = "recoil_damage_energy is required for the arc-dpa damage model"
+        raise ValueError(msg)
+    if material is None:
+        msg = "The material is required to find the arc-dpa parameters"
+        raise ValueError(msg)
+
+    b, c = np.moveaxis(
+        np.asarray(map_materials(find_arc_dpa_parameters, material)), -1, 0
+    )
+    efficiency = arc_dpa_efficiency(recoil_damage_energy, displacement_energy, b, c)
+
+    return energy_per_displacement, efficiency
@@ -0,0 +1,212 @@
+from functools import lru_cache
+
+import numpy as np
+import openmc
+
+from .spectra import (
+    get_energy_filter_axis,
+    get_filter_bins_of_spectra,
+    get_spectra_arrays,
+)
+from .utils import (
+    check_for_energy_filter,
+    check_for_energy_function_filter,
+    convert_tally_results,
+    get_score_units,
+    get_tally_mean_and_std_dev,
+    ureg,
+)
+
+
+def find_group_averages(energy, values, energy_edges) -> np.ndarray:
+    """Finds the average of a linearly interpolated function over each energy
+    group. The function is taken to be zero outside of the tabulated energy
+    range, matching the behaviour of an openmc.EnergyFunctionFilter.
+
+    Args:
+        energy: The energies the function is tabulated at
+        values: The values of the function at each energy
+        energy_edges: The energy group edges to average the function over
+
+    Returns:
+        The group averaged values with one entry per energy group
+    """
+
+    energy = np.asarray(energy, dtype=float)
+    values = np.asarray(values, dtype=float)
+    energy_edges = np.asarray(energy_edges, dtype=float)
+
+    # integral of the piecewise linear function from the first energy point
+    widths = np.diff(energy)
+    slopes = np.diff(values) / widths
+    cumulative = np.concatenate(
+        [[0.0], np.cumsum(0.5 * (values[1:] + values[:-1]) * widths)]
+    )
+
+    clipped_edges = np.clip(energy_edges, energy[0], energy[-1])
+    index = np.searchsorted(energy, clipped_edges, side="right") - 1
+    index = np.clip(index, 0, energy.size - 2)
+    offset = clipped_edges - energy[index]
+    integral = (
+        cumulative[index] + values[index] * offset + 0.5 * slopes[index] * offset**2
+    )
+
+    return np.diff(integral) / np.diff(energy_edges)
+
+
+@lru_cache(maxsize=64)
+def _cached_group_dose_coefficients(
+    energy_edges: bytes, particle: str, geometries: tuple
+):
+    energy_edges = np.frombuffer(energy_edges)
+
+    coefficients = []
+    for geometry in geometries:
+        energy, dose_coefficients = openmc.data.dose_coefficients(
+            particle=particle, geometry=geometry
+        )
+        coefficients.append(
+            find_group_averages(energy, dose_coefficients, energy_edges)
+        )
+
+    coefficients = np.column_stack(coefficients)
+    coefficients.setflags(write=False)
+    return coefficients
+
+
+def find_group_dose_coefficients(
+    energy_edges, particle: str = "neutron", geometry="AP"
+) -> np.ndarray:
+    """Finds the ICRP effective dose coefficients averaged over each energy
+    group. Coefficients are cached and keyed by the group structure, particle
+    and irradiation geometries.
+
+    Args:
+        energy_edges: The energy group edges in eV
+        particle: The particle type of the dose coefficients, for example
+            "neutron" or "photon"
+        geometry: The irradiation geometry ("AP", "PA", "LLAT", "RLAT", "ROT"
+            or "ISO") or a list of geometries
+
+    Returns:
+        The dose coefficients in pSv cm^2 with a shape of (energy groups,
+        geometries)
+    """
+
+    if isinstance(geometry, str):
+        geometry = [geometry]
+
+    energy_edges = np.ascontiguousarray(energy_edges, dtype=float)
+
+    return _cached_group_dose_coefficients(
+        energy_edges.tobytes(), particle, tuple(geometry)
+    )
+
+
+def get_particle_from_tally_filters(tally) -> str:
+    """Finds the single particle type from the ParticleFilter of a tally"""
+
+    for tally_filter in tally.filters:
+        if isinstance(tally_filter, openmc.filter.ParticleFilter):
+            if len(tally_filter.bins) == 1:
+                return tally_filter.bins[0]
+    msg = (
+        "particle could not be found from a ParticleFilter with a single "
+        "particle. Please specify the particle argument"
+    )
+    raise ValueError(msg)
+
+
+def process_dose_from_spectra_tally(
+    tally,
+    particle: str = None,
+    geometry="AP",
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
+):
+    """Processes a spectra tally into a dose by folding the spectra with the
+    ICRP dose coefficients after the simulation. This allows the dose for any
+    irradiation geometry to be found from a single simulation. The tally with
+    default units obtained during simulation is converted into the user
+    specified units. Base units are 'picosievert cm^3 / source_particle'
+
+    Args:
+        tally: The openmc.Tally object which should be a spectra tally. With a
+            score of flux and an EnergyFilter
+        particle: The particle type of the dose coefficients. If not specified
+            the particle is found from the ParticleFilter of the tally
+        geometry: The irradiation geometry ("AP", "PA", "LLAT", "RLAT", "ROT"
+            or "ISO") or a list of geometries. When a list is provided the
+            results have an additional last axis with one entry per geometry
+        required_units: The units to convert the dose into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units. This optional
+            argument allows the user to specify the source_strength when needed
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found. This optional argument allows the
+            user to specify the volume when needed or overwrite the
+            automatically calculated volume.
+        source_strength_std_dev: The std. dev. of the source_strength. It is
+            combined in quadrature with the tally std. dev. when the
+            source_strength is used in the conversion.
+        volume_std_dev: The std. dev. of the volume in cm3. It is combined in
+            quadrature with the tally std. dev. when the volume is used in the
+            conversion.
+
+    Returns:
+        The dose tally result in the required units
+    """
+
+    if not check_for_energy_filter(tally):
+        raise ValueError("EnergyFilter was not found in spectra tally")
+
+    if check_for_energy_function_filter(tally):
+        raise ValueError("EnergyFunctionFilter was found in spectra tally")
+
+    if tally.scores != ["flux"]:
+        raise ValueError(
+            "dose can only be found from spectra tallies with a flux score"
+        )
+
+    if particle is None:
+        particle = get_particle_from_tally_filters(tally)
+
+    energy_filter = tally.filters[get_energy_filter_axis(tally)]
+    coefficients = find_group_dose_coefficients(
+        energy_filter.values, particle, geometry
+    )
+    if isinstance(geometry, str):
+        coefficients = coefficients[:, 0]
+
+    # checks for user provided base units
+    base_units = get_score_units(tally)
+    base_units = base_units * ureg.picosievert * ureg.centimeter**2
+
+    tally_mean, tally_std_dev = get_tally_mean_and_std_dev(tally)
+
+    spectra, _ = get_spectra_arrays(tally, tally_mean)
+
+    if tally_std_dev is None:
+        folded_std_dev = None
+    else:
+        # groups are independent so the variances are folded with the squared
+        # coefficients
+        spectra_std_dev, _ = get_spectra_arrays(tally, tally_std_dev)
+        folded_std_dev = np.sqrt(spectra_std_dev**2 @ coefficients**2)
+
+    return convert_tally_results(
+        tally,
+        spectra @ coefficients,
+        folded_std_dev,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+        source_strength_std_dev=source_strength_std_dev,
+        volume_std_dev=volume_std_dev,
+        filter_bins=get_filter_bins_of_spectra(tally, 1),
+    )
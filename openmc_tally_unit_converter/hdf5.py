@@ -0,0 +1,249 @@
+import h5py
+import numpy as np
+import openmc
+
+from .sparse import SparseTallyResult
+from .streaming import DEFAULT_CHUNK_SIZE, iter_converted_chunks
+from .utils import ureg
+
+
+def _write_filter_axes(group, tally):
+    """Writes the filter bins of a tally and the geometry of a RegularMesh
+    into a filters group"""
+
+    filters_group = group.create_group("filters")
+    for filter_number, tally_filter in enumerate(tally.filters):
+        filter_group = filters_group.create_group(f"filter {filter_number}")
+        filter_group.attrs["type"] = type(tally_filter).__name__
+        filter_group.attrs["num_bins"] = tally_filter.num_bins
+
+        if isinstance(tally_filter, openmc.MeshFilter):
+            mesh = tally_filter.mesh
+            filter_group.attrs["lower_left"] = np.asarray(mesh.lower_left, float)
+            filter_group.attrs["upper_right"] = np.asarray(mesh.upper_right, float)
+            filter_group.attrs["dimension"] = np.asarray(mesh.dimension, int)
+        elif isinstance(tally_filter, openmc.EnergyFilter):
+            filter_group.create_dataset("values", data=tally_filter.values)
+        else:
+            bins = np.asarray(tally_filter.bins)
+            if bins.dtype.kind in "iuf":
+                filter_group.create_dataset("bins", data=bins)
+            else:
+                filter_group.create_dataset("bins", data=bins.astype("S"))
+
+
+def _create_result_datasets(
+    group, names, size, chunk_size, compression, compression_opts, dtype=np.float64
+) -> list:
+    if compression is None:
+        # contiguous datasets can be memory mapped by the reader
+        options = {}
+    else:
+        options = {
+            "chunks": (max(1, min(chunk_size, size)),),
+            "compression": compression,
+            "compression_opts": compression_opts,
+            "shuffle": True,
+        }
+    return [
+        group.create_dataset(name, shape=(size,), dtype=dtype, **options)
+        for name in names
+    ]
+
+
+def write_tally_to_hdf5(
+    filename,
+    tally,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    group_name: str = None,
+    compression: str = "gzip",
+    compression_opts: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Converts a tally into the required units and writes the mean and std.
+    dev. to chunked and compressed HDF5 datasets. The tally is converted and
+    written one chunk at a time. The units, scores, filter axes, mesh geometry
+    and conversion inputs are written as attributes.
+
+    Args:
+        filename: The path of the HDF5 file, which is appended to if it exists
+        tally: The openmc.Tally object
+        required_units: The units to convert the tally into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units.
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found.
+        group_name: The name of the HDF5 group to write. Defaults to the tally
+            name or "tally {id}" when the tally has no name.
+        compression: The HDF5 compression filter. None writes contiguous
+            datasets that can be memory mapped when read.
+        compression_opts: The compression level
+        chunk_size: The number of values in each HDF5 chunk and each
+            conversion chunk
+
+    Returns:
+        The name of the HDF5 group that was written
+    """
+
+    if group_name is None:
+        group_name = tally.name if tally.name else f"tally {tally.id}"
+
+    size = int(np.prod(tally.shape))
+
+    with h5py.File(filename, "a") as hdf5_file:
+        group = hdf5_file.create_group(group_name)
+        group.attrs["tally_id"] = tally.id
+        group.attrs["tally_name"] = tally.name or ""
+        group.attrs["scores"] = list(tally.scores)
+        group.attrs["shape"] = np.asarray(tally.shape, int)
+        if source_strength is not None:
+            group.attrs["source_strength"] = source_strength
+        if volume is not None:
+            group.attrs["volume"] = volume
+        _write_filter_axes(group, tally)
+
+        datasets = None
+        for start, tally_mean, tally_std_dev in iter_converted_chunks(
+            tally, required_units, source_strength, volume, chunk_size
+        ):
+            if datasets is None:
+                group.attrs["units"] = str(tally_mean.units)
+                names = ["mean"] if tally_std_dev is None else ["mean", "std_dev"]
+                datasets = _create_result_datasets(
+                    group, names, size, chunk_size, compression, compression_opts
+                )
+
+            stop = start + tally_mean.size
+            datasets[0][start:stop] = tally_mean.magnitude
+            if tally_std_dev is not None:
+                datasets[1][start:stop] = tally_std_dev.magnitude
+
+    return group_name
+
+
+def write_tally_result_to_hdf5(
+    filename,
+    tally_result,
+    group_name: str,
+    compression: str = "gzip",
+    compression_opts: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **attributes,
+):
+    """Writes a converted tally result to HDF5 datasets with the units as an
+    attribute.
+
+    Args:
+        filename: The path of the HDF5 file, which is appended to if it exists
+        tally_result: A pint Quantity, a tuple of the tally mean and std. dev.
+            or a SparseTallyResult
+        group_name: The name of the HDF5 group to write
+        compression: The HDF5 compression filter. None writes contiguous
+            datasets that can be memory mapped when read.
+        compression_opts: The compression level
+        chunk_size: The number of values in each HDF5 chunk
+        attributes: Additional attributes to write, for example the
+            source_strength or volume used in the conversion
+    """
+
+    if isinstance(tally_result, SparseTallyResult):
+        arrays = {
+            "indices": tally_result.indices,
+            "mean": tally_result.mean,
+            "std_dev": tally_result.std_dev,
+        }
+    elif isinstance(tally_result, tuple):
+        arrays = {"mean": tally_result[0], "std_dev": tally_result[1]}
+    else:
+        arrays = {"mean": tally_result}
+    units = arrays["mean"].units
+
+    with h5py.File(filename, "a") as hdf5_file:
+        group = hdf5_file.create_group(group_name)
+        group.attrs["units"] = str(units)
+        if isinstance(tally_result, SparseTallyResult):
+            group.attrs["size"] = tally_result.size
+        for key, value in attributes.items():
+            group.attrs[key] = value
+
+        for name, array in arrays.items():
+            if array is None:
+                continue
+            if isinstance(array, ureg.Quantity):
+                array = array.to(units).magnitude
+            array = np.ravel(array)
+            (dataset,) = _create_result_datasets(
+                group,
+                [name],
+                array.size,
+                chunk_size,
+                compression,
+                compression_opts,
+                array.dtype,
+            )
+            dataset[...] = array
+
+
+def _read_dataset(filename, dataset, memory_map: bool):
+    """Memory maps a contiguous uncompressed dataset or reads the dataset"""
+
+    offset = dataset.id.get_offset()
+    if memory_map and dataset.chunks is None and offset is not None:
+        return np.memmap(
+            filename,
+            dtype=dataset.dtype,
+            mode="r",
+            offset=offset,
+            shape=dataset.shape,
+        )
+    return dataset[...]
+
+
+def read_tally_from_hdf5(filename, group_name: str, memory_map: bool = True):
+    """Reads a converted tally result written by write_tally_to_hdf5 or
+    write_tally_result_to_hdf5.
+
+    Args:
+        filename: The path of the HDF5 file
+        group_name: The name of the HDF5 group to read
+        memory_map: If True contiguous uncompressed datasets are memory mapped
+            rather than read into memory. Compressed datasets are always read.
+
+    Returns:
+        The tally result with the same form that was written, and a dictionary
+        of the attributes of the group
+    """
+
+    with h5py.File(filename, "r") as hdf5_file:
+        group = hdf5_file[group_name]
+        attributes = dict(group.attrs)
+        units = ureg[attributes["units"]].units
+
+        arrays = {
+            name: _read_dataset(filename, group[name], memory_map)
+            for name in ["indices", "mean", "std_dev"]
+            if name in group
+        }
+
+    tally_mean = ureg.Quantity(arrays["mean"], units)
+    if "std_dev" in arrays:
+        tally_std_dev = ureg.Quantity(arrays["std_dev"], units)
+    else:
+        tally_std_dev = None
+
+    if "indices" in arrays:
+        tally_result = SparseTallyResult(
+            indices=np.asarray(arrays["indices"]).astype(np.intp),
+            mean=tally_mean,
+            std_dev=tally_std_dev,
+            size=int(attributes["size"]),
+        )
+    elif tally_std_dev is None:
+        tally_result = tally_mean
+    else:
+        tally_result = (tally_mean, tally_std_dev)
+
+    return tally_result, attributes
@@ -0,0 +1,103 @@
+import numpy as np
+import openmc
+
+from .utils import process_tally
+
+
+def merge_statepoint_tallies(
+    statepoint_filenames, tally_name: str = None, tally_id: int = None
+):
+    """Merges a tally from independent statepoint files, for example runs of
+    the same model with different seeds. The statepoints are read one at a
+    time and particle weighted sums and sums of squares of the realizations
+    are accumulated so the memory used does not grow with the number of
+    statepoints.
+
+    Args:
+        statepoint_filenames: The paths of the statepoint files to merge
+        tally_name: The name of the tally to merge
+        tally_id: The id of the tally to merge
+
+    Returns:
+        An openmc.Tally with the merged sum, sum of squares and number of
+        realizations, from which the mean and std. dev. are found, that can
+        be passed to the process functions
+    """
+
+    if tally_name is None and tally_id is None:
+        raise ValueError("tally_name or tally_id must be specified")
+
+    merged_tally = None
+    for statepoint_filename in statepoint_filenames:
+
+        with openmc.StatePoint(filepath=statepoint_filename) as statepoint:
+            tally = statepoint.get_tally(name=tally_name, id=tally_id)
+            particles_per_realization = statepoint.n_particles
+
+            # each realization is weighted by the number of particles
+            weighted_sum = particles_per_realization * np.asarray(tally.sum)
+            weighted_sum_sq = particles_per_realization * np.asarray(tally.sum_sq)
+            weight = particles_per_realization * tally.num_realizations
+
+        if merged_tally is None:
+            merged_tally = tally
+            total_sum = weighted_sum
+            total_sum_sq = weighted_sum_sq
+            total_weight = weight
+            total_realizations = tally.num_realizations
+            continue
+
+        if weighted_sum.shape != total_sum.shape or tally.scores != merged_tally.scores:
+            msg = (
+                f"The tally in {statepoint_filename} has a shape of "
+                f"{weighted_sum.shape} and scores of {tally.scores} which do not "
+                f"match the shape of {total_sum.shape} and scores of "
+                f"{merged_tally.scores} of the first statepoint"
+            )
+            raise ValueError(msg)
+
+        total_sum += weighted_sum
+        total_sum_sq += weighted_sum_sq
+        total_weight += weight
+        total_realizations += tally.num_realizations
+
+    if merged_tally is None:
+        raise ValueError("At least one statepoint filename is required")
+
+    # the merged sums replace the sums of the first statepoint, whose results
+    # have been read, and openmc finds the merged mean and std. dev. from them
+    merged_tally.num_realizations = total_realizations
+    merged_tally.sum = total_sum / (total_weight / total_realizations)
+    merged_tally.sum_sq = total_sum_sq / (total_weight / total_realizations)
+
+    return merged_tally
+
+
+def process_merged_tally(
+    statepoint_filenames,
+    tally_name: str = None,
+    tally_id: int = None,
+    process_function=process_tally,
+    **kwargs,
+):
+    """Merges a tally from independent statepoint files and processes the
+    merged tally into the required units.
+
+    Args:
+        statepoint_filenames: The paths of the statepoint files to merge
+        tally_name: The name of the tally to merge
+        tally_id: The id of the tally to merge
+        process_function: The function used to process the merged tally, for
+            example process_tally or process_damage_energy_tally
+        kwargs: Additional arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        The merged tally processed by the process_function
+    """
+
+    merged_tally = merge_statepoint_tallies(
+        statepoint_filenames, tally_name=tally_name, tally_id=tally_id
+    )
+
+    return process_function(tally=merged_tally, **kwargs)
@@ -0,0 +1,696 @@
+from functools import lru_cache
+
+import numpy as np
+import openmc
+
+from .utils import (
+    QUANTITY_TYPES,
+    compute_volume_of_voxels,
+    find_integral_weights,
+    find_volumes_of_mesh_voxels,
+    process_tally,
+    ureg,
+)
+
+REGION_TYPES = ["box", "cylinder"]
+
+
+def get_mesh_from_tally(tally):
+    """Gets the RegularMesh of a mesh tally"""
+
+    if not tally.contains_filter(openmc.MeshFilter):
+        raise ValueError(f"MeshFilter was not found in tally {tally.id}")
+
+    return tally.find_filter(filter_type=openmc.MeshFilter).mesh
+
+
+def find_voxel_centres(mesh) -> np.ndarray:
+    """Finds the centres of the voxels of a RegularMesh in the same order as
+    the tally results, with the x index varying fastest.
+
+    Args:
+        mesh: The openmc.RegularMesh
+
+    Returns:
+        The x, y, z coordinates of the voxel centres with a shape of
+        (number of voxels, 3)
+    """
+
+    return _find_voxel_centres(*_get_mesh_key(mesh))
+
+
+def _find_voxel_centres(lower_left, upper_right, dimension) -> np.ndarray:
+    axes = []
+    for lower, upper, number in zip(lower_left, upper_right, dimension):
+        edges = np.linspace(lower, upper, number + 1)
+        axes.append(0.5 * (edges[:-1] + edges[1:]))
+
+    # z, y, x ordering so that x varies fastest when flattened
+    z, y, x = np.meshgrid(axes[2], axes[1], axes[0], indexing="ij")
+
+    return np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+
+
+def _get_mesh_key(mesh) -> tuple:
+    return (
+        tuple(float(value) for value in mesh.lower_left),
+        tuple(float(value) for value in mesh.upper_right),
+        tuple(int(value) for value in mesh.dimension),
+    )
+
+
+def _get_regions_key(regions: dict) -> tuple:
+    regions_key = []
+    for name, region in regions.items():
+        region_key = tuple(
+            (key, tuple(np.atleast_1d(value).tolist()))
+            for key, value in sorted(region.items())
+        )
+        regions_key.append((name, region_key))
+    return tuple(regions_key)
+
+
+def _find_voxels_in_region(voxel_centres: np.ndarray, region: dict) -> np.ndarray:
+    """Finds which voxel centres are inside a box or cylinder region"""
+
+    region_type = region.get("type")
+
+    if region_type == "box":
+        lower_left = np.asarray(region["lower_left"], dtype=float)
+        upper_right = np.asarray(region["upper_right"], dtype=float)
+        return np.all(
+            (voxel_centres >= lower_left) & (voxel_centres <= upper_right), axis=1
+        )
+
+    if region_type == "cylinder":
+        # cylinders are aligned with the z axis
+        origin = np.asarray(region.get("origin", (0.0, 0.0)), dtype=float)
+        radial_distance = np.hypot(
+            voxel_centres[:, 0] - origin[0], voxel_centres[:, 1] - origin[1]
+        )
+        return (
+            (radial_distance >= region.get("inner_radius", 0.0))
+            & (radial_distance <= region["radius"])
+            & (voxel_centres[:, 2] >= region.get("z_min", -np.inf))
+            & (voxel_centres[:, 2] <= region.get("z_max", np.inf))
+        )
+
+    msg = f"region type must be one of {REGION_TYPES} not {region_type}"
+    raise ValueError(msg)
+
+
+@lru_cache(maxsize=32)
+def _cached_region_index(mesh_key: tuple, regions_key: tuple) -> np.ndarray:
+    """Finds the region index of each voxel. Cached on the mesh geometry and
+    the region definitions as the same regions are reused for many tallies."""
+
+    voxel_centres = _find_voxel_centres(*mesh_key)
+
+    region_index = np.full(len(voxel_centres), -1, dtype=np.intp)
+
+    for index, (_, region_key) in enumerate(regions_key):
+        region = {
+            key: value[0] if len(value) == 1 else value for key, value in region_key
+        }
+        in_region = _find_voxels_in_region(voxel_centres, region)
+        # voxels are assigned to the first region that contains them
+        region_index[in_region & (region_index == -1)] = index
+
+    region_index.flags.writeable = False
+
+    return region_index
+
+
+def find_region_index(mesh, regions: dict = None, labels=None):
+    """Finds the region that each voxel of a RegularMesh is assigned to. The
+    regions can be boxes or cylinders, which are matched against the voxel
+    centres, or a labelled integer array.
+
+    Args:
+        mesh: The openmc.RegularMesh
+        regions: Dictionary with region names as keys and region definitions
+            as values. Boxes are defined with {"type": "box", "lower_left":
+            (x, y, z), "upper_right": (x, y, z)}. Cylinders aligned with the z
+            axis are defined with {"type": "cylinder", "radius": r} and the
+            optional keys "inner_radius", "z_min", "z_max" and "origin". Voxels
+            inside several regions are assigned to the first region.
+        labels: Integer array with a label for each voxel, either flat in the
+            tally order or with the shape of the mesh dimension. Negative
+            labels are not assigned to a region.
+
+    Returns:
+        The region index of each voxel with -1 for voxels outside all regions
+        and the region names in index order
+    """
+
+    if (regions is None) == (labels is None):
+        raise ValueError("Either regions or labels must be specified")
+
+    if regions is not None:
+        region_index = _cached_region_index(
+            _get_mesh_key(mesh), _get_regions_key(regions)
+        )
+        return region_index, list(regions.keys())
+
+    labels = np.asarray(labels)
+    if not np.issubdtype(labels.dtype, np.integer):
+        raise ValueError(f"labels must be integers not {labels.dtype}")
+
+    dimension = tuple(mesh.dimension)
+    if labels.shape == dimension:
+        # the x index varies fastest in the tally results
+        labels = labels.ravel(order="F")
+    elif labels.shape != (np.prod(dimension),):
+        msg = (
+            f"labels has a shape of {labels.shape} which does not match the "
+            f"mesh dimension of {dimension}"
+        )
+        raise ValueError(msg)
+
+    region_names, region_index = np.unique(labels[labels >= 0], return_inverse=True)
+    full_region_index = np.full(labels.shape, -1, dtype=np.intp)
+    full_region_index[labels >= 0] = region_index
+
+    return full_region_index, region_names.tolist()
+
+
+def find_region_statistics(
+    tally_result,
+    region_index: np.ndarray,
+    region_names: list,
+    voxel_volume,
+    quantity: str,
+) -> dict:
+    """Finds the integral, maximum and volume of each region of a converted
+    mesh tally in a single pass over the voxels. Intensive results (e.g. a
+    flux, dose rate, DPA or W / m ** 3) are integrated over the voxel volumes
+    and extensive results (e.g. the heating deposited in each voxel) are
+    summed.
+
+    Args:
+        tally_result: A pint Quantity or a tuple of the tally mean and std.
+            dev. with a value for each voxel, or a SparseTallyResult
+        region_index: The region index of each voxel from find_region_index
+        region_names: The region names in index order
+        voxel_volume: The volume in cm3 of every voxel or an array with the
+            volume of each voxel, from compute_volume_of_voxels
+        quantity: "intensive" or "extensive", see find_integral_weights
+
+    Returns:
+        Dictionary with the region names as keys and a dictionary with the
+        "integral", "maximum" and "volume" of the region as values. The
+        integral and maximum include the std. dev. when the tally result has
+        a std. dev.
+    """
+
+    if hasattr(tally_result, "indices"):
+        # a SparseTallyResult only has the values of the non-zero voxels
+        voxels = tally_result.indices
+        number_of_voxels = tally_result.size
+        tally_mean, tally_std_dev = tally_result.mean, tally_result.std_dev
+    else:
+        if isinstance(tally_result, tuple):
+            tally_mean, tally_std_dev = tally_result
+        else:
+            tally_mean, tally_std_dev = tally_result, None
+        number_of_voxels = np.size(tally_mean.magnitude)
+        voxels = np.arange(number_of_voxels)
+
+    units = tally_mean.units
+    mean = np.asarray(tally_mean.magnitude).ravel()
+    std_dev = None if tally_std_dev is None else tally_std_dev.to(units).magnitude
+
+    if number_of_voxels != region_index.size:
+        msg = (
+            f"The tally result has {number_of_voxels} values but the mesh has "
+            f"{region_index.size} voxels"
+        )
+        raise ValueError(msg)
+
+    weight, integral_units = find_integral_weights(units, quantity, voxel_volume)
+
+    number_of_regions = len(region_names)
+    in_any_region = region_index >= 0
+    voxel_counts = np.bincount(region_index[in_any_region], minlength=number_of_regions)
+    region_volumes = np.bincount(
+        region_index[in_any_region],
+        weights=np.broadcast_to(voxel_volume, region_index.shape)[in_any_region],
+        minlength=number_of_regions,
+    )
+
+    index = region_index[voxels]
+    in_region = index >= 0
+    index = index[in_region]
+    mean = mean[in_region]
+    if np.ndim(weight) > 0:
+        weight = weight[voxels][in_region]
+
+    integrals = np.bincount(index, weights=mean * weight, minlength=number_of_regions)
+    value_counts = np.bincount(index, minlength=number_of_regions)
+
+    # the values are sorted by region and then value so the last value of each
+    # region is the maximum value
+    order = np.lexsort((mean, index))
+    last_of_region = np.cumsum(value_counts) - 1
+    maximum_values = order[last_of_region[value_counts > 0]]
+    maxima = np.full(number_of_regions, np.nan)
+    maxima[value_counts > 0] = mean[maximum_values]
+
+    if std_dev is not None:
+        std_dev = np.asarray(std_dev).ravel()[in_region]
+        integral_std_devs = np.sqrt(
+            np.bincount(
+                index, weights=(std_dev * weight) ** 2, minlength=number_of_regions
+            )
+        )
+        maxima_std_devs = np.full(number_of_regions, np.nan)
+        maxima_std_devs[value_counts > 0] = std_dev[maximum_values]
+
+    # regions with voxels that are not in a sparse result have zero values
+    has_zeros = value_counts < voxel_counts
+    zero_is_maximum = has_zeros & ~(maxima > 0)
+    maxima[zero_is_maximum] = 0.0
+    if std_dev is not None:
+        maxima_std_devs[zero_is_maximum] = 0.0
+
+    region_statistics = {}
+    for region_number, region_name in enumerate(region_names):
+        integral = ureg.Quantity(integrals[region_number], integral_units)
+        maximum = ureg.Quantity(maxima[region_number], units)
+        if std_dev is not None:
+            integral = (
+                integral,
+                ureg.Quantity(integral_std_devs[region_number], integral_units),
+            )
+            maximum = (maximum, ureg.Quantity(maxima_std_devs[region_number], units))
+        region_statistics[region_name] = {
+            "integral": integral,
+            "maximum": maximum,
+            "volume": ureg.Quantity(region_volumes[region_number], "centimeter ** 3"),
+        }
+
+    return region_statistics
+
+
+def process_mesh_tally_regions(
+    tally,
+    regions: dict = None,
+    labels=None,
+    process_function=process_tally,
+    *,
+    quantity: str,
+    **kwargs,
+) -> dict:
+    """Processes a mesh tally into the required units and finds the integral,
+    maximum and volume of each region, for example the heating of each
+    component.
+
+    Args:
+        tally: The openmc.Tally object which should have a RegularMesh filter
+        regions: Dictionary with region names as keys and box or cylinder
+            region definitions as values. See find_region_index.
+        labels: Integer array with a region label for each voxel
+        process_function: The function used to process the tally, for example
+            process_tally or process_damage_energy_tally
+        quantity: "intensive" for results that are integrated over the voxel
+            volumes, such as W / m ** 3 or DPA, or "extensive" for results
+            that are summed, such as W. See find_integral_weights.
+        kwargs: Additional arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        Dictionary with the region names as keys and a dictionary with the
+        "integral", "maximum" and "volume" of the region as values
+    """
+
+    mesh = get_mesh_from_tally(tally)
+
+    region_index, region_names = find_region_index(mesh, regions, labels)
+
+    tally_result = process_function(tally=tally, **kwargs)
+
+    return find_region_statistics(
+        tally_result,
+        region_index,
+        region_names,
+        compute_volume_of_voxels(tally),
+        quantity,
+    )
+
+
+def find_voxel_indices(mesh, points) -> np.ndarray:
+    """Finds the voxels of a RegularMesh that contain each point.
+
+    Args:
+        mesh: The openmc.RegularMesh
+        points: Array of x, y, z coordinates with a shape of (points, 3)
+
+    Returns:
+        The flat voxel index of each point in the tally order, with the x
+        index varying fastest, and -1 for points outside the mesh
+    """
+
+    lower_left, upper_right, dimension = (
+        np.asarray(value, dtype=float) for value in _get_mesh_key(mesh)
+    )
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    if points.shape[1] != 3:
+        raise ValueError(f"points must have a shape of (points, 3) not {points.shape}")
+
+    voxel_width = (upper_right - lower_left) / dimension
+    indices = np.floor((points - lower_left) / voxel_width).astype(np.intp)
+
+    # points on the upper boundary are in the last voxel
+    on_upper_boundary = points == upper_right
+    indices[on_upper_boundary] = (
+        np.broadcast_to(dimension, indices.shape)[on_upper_boundary] - 1
+    )
+
+    dimension = dimension.astype(np.intp)
+    inside = np.all((indices >= 0) & (indices < dimension), axis=1)
+    flat_indices = np.ravel_multi_index(indices[inside].T, dimension, order="F")
+
+    voxel_indices = np.full(len(points), -1, dtype=np.intp)
+    voxel_indices[inside] = flat_indices
+
+    return voxel_indices
+
+
+def _find_trilinear_weights(mesh, points):
+    """Finds the flat indices and weights of the eight voxel centres that
+    surround each point. Points between the outer voxel centres and the mesh
+    boundary take the value of the outer voxel centres."""
+
+    lower_left, upper_right, dimension = (
+        np.asarray(value, dtype=float) for value in _get_mesh_key(mesh)
+    )
+    voxel_width = (upper_right - lower_left) / dimension
+    dimension = dimension.astype(np.intp)
+
+    # the position of each point in units of voxels from the first centre
+    position = (points - lower_left) / voxel_width - 0.5
+    position = np.clip(position, 0, dimension - 1)
+    lower_index = np.minimum(np.floor(position).astype(np.intp), dimension - 2)
+    lower_index = np.maximum(lower_index, 0)
+    fraction = np.clip(position - lower_index, 0, 1)
+
+    indices = []
+    weights = []
+    for corner in np.ndindex(2, 2, 2):
+        corner = np.asarray(corner)
+        corner_index = np.minimum(lower_index + corner, dimension - 1)
+        indices.append(np.ravel_multi_index(corner_index.T, dimension, order="F"))
+        weights.append(np.prod(np.where(corner == 1, fraction, 1 - fraction), axis=1))
+
+    return np.column_stack(indices), np.column_stack(weights)
+
+
+def sample_mesh_tally_result(
+    tally_result, mesh, points, interpolation: str = "nearest"
+):
+    """Samples a converted mesh tally result at many points at once.
+
+    Args:
+        tally_result: A pint Quantity or a tuple of the tally mean and std.
+            dev. with a value for each voxel
+        mesh: The openmc.RegularMesh of the tally
+        points: Array of x, y, z coordinates with a shape of (points, 3)
+        interpolation: "nearest" uses the value of the voxel that contains the
+            point and "linear" interpolates trilinearly between the voxel
+            centres. The std. devs. of the voxels are combined in quadrature
+            with the interpolation weights.
+
+    Returns:
+        The sampled values in the units of the tally result and the std. dev.
+        of the sampled values when the tally result has a std. dev. Points
+        outside the mesh are nan.
+    """
+
+    if isinstance(tally_result, tuple):
+        tally_mean, tally_std_dev = tally_result
+    else:
+        tally_mean, tally_std_dev = tally_result, None
+
+    units = tally_mean.units
+    mean = np.asarray(tally_mean.magnitude).ravel()
+    std_dev = None if tally_std_dev is None else tally_std_dev.to(units).magnitude
+
+    number_of_voxels = int(np.prod(mesh.dimension))
+    if mean.size != number_of_voxels:
+        msg = (
+            f"The tally result has {mean.size} values but the mesh has "
+            f"{number_of_voxels} voxels"
+        )
+        raise ValueError(msg)
+
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    voxel_indices = find_voxel_indices(mesh, points)
+    inside = voxel_indices >= 0
+
+    sampled_mean = np.full(len(points), np.nan)
+    sampled_std_dev = np.full(len(points), np.nan)
+
+    if interpolation == "nearest":
+        sampled_mean[inside] = mean[voxel_indices[inside]]
+        if std_dev is not None:
+            std_dev = np.asarray(std_dev).ravel()
+            sampled_std_dev[inside] = std_dev[voxel_indices[inside]]
+    elif interpolation == "linear":
+        indices, weights = _find_trilinear_weights(mesh, points[inside])
+        sampled_mean[inside] = np.sum(mean[indices] * weights, axis=1)
+        if std_dev is not None:
+            std_dev = np.asarray(std_dev).ravel()
+            sampled_std_dev[inside] = np.sqrt(
+                np.sum((std_dev[indices] * weights) ** 2, axis=1)
+            )
+    else:
+        msg = f'interpolation must be "nearest" or "linear" not {interpolation}'
+        raise ValueError(msg)
+
+    if std_dev is None:
+        return ureg.Quantity(sampled_mean, units)
+    return ureg.Quantity(sampled_mean, units), ureg.Quantity(sampled_std_dev, units)
+
+
+def find_line_points(start, end, number_of_points: int):
+    """Finds evenly spaced points along a straight line, for example a radial
+    line through a mesh.
+
+    Args:
+        start: The x, y, z coordinates of the start of the line
+        end: The x, y, z coordinates of the end of the line
+        number_of_points: The number of points including the start and end
+
+    Returns:
+        The distance of each point from the start and the x, y, z coordinates
+        of the points with a shape of (points, 3)
+    """
+
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    fractions = np.linspace(0, 1, number_of_points)
+    points = start + fractions[:, np.newaxis] * (end - start)
+
+    return fractions * np.linalg.norm(end - start), points
+
+
+def sample_mesh_tally(
+    tally,
+    points,
+    interpolation: str = "nearest",
+    process_function=process_tally,
+    **kwargs,
+):
+    """Processes a mesh tally into the required units and samples the result
+    at many points at once, for example detector positions or the points of a
+    line from find_line_points.
+
+    Args:
+        tally: The openmc.Tally object which should have a RegularMesh filter
+        points: Array of x, y, z coordinates with a shape of (points, 3)
+        interpolation: "nearest" or "linear". See sample_mesh_tally_result.
+        process_function: The function used to process the tally, for example
+            process_tally or process_dose_tally
+        kwargs: Additional arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        The sampled values in the required units and the std. dev. of the
+        sampled values when the tally has a std. dev.
+    """
+
+    mesh = get_mesh_from_tally(tally)
+
+    tally_result = process_function(tally=tally, **kwargs)
+
+    return sample_mesh_tally_result(tally_result, mesh, points, interpolation)
+
+
+def _find_coarse_mesh(mesh, factor):
+    """Makes a mesh of the same type with every factor-th grid edge"""
+
+    if isinstance(mesh, openmc.RegularMesh):
+        lower_left, upper_right, dimension = _get_mesh_key(mesh)
+        coarse_mesh = openmc.RegularMesh()
+        coarse_mesh.lower_left = lower_left
+        coarse_mesh.upper_right = upper_right
+        coarse_mesh.dimension = tuple((np.asarray(dimension) // factor).tolist())
+    elif isinstance(mesh, openmc.RectilinearMesh):
+        coarse_mesh = openmc.RectilinearMesh()
+        coarse_mesh.x_grid = np.asarray(mesh.x_grid)[:: factor[0]]
+        coarse_mesh.y_grid = np.asarray(mesh.y_grid)[:: factor[1]]
+        coarse_mesh.z_grid = np.asarray(mesh.z_grid)[:: factor[2]]
+    else:
+        coarse_mesh = openmc.CylindricalMesh()
+        coarse_mesh.r_grid = np.asarray(mesh.r_grid)[:: factor[0]]
+        coarse_mesh.phi_grid = np.asarray(mesh.phi_grid)[:: factor[1]]
+        coarse_mesh.z_grid = np.asarray(mesh.z_grid)[:: factor[2]]
+        coarse_mesh.origin = mesh.origin
+
+    return coarse_mesh
+
+
+def coarsen_mesh_tally_result(
+    tally_result, mesh, factor, quantity: str, voxel_volumes=None
+):
+    """Coarsens a converted mesh tally result by merging blocks of voxels.
+    Intensive results (e.g. a flux, dose rate, DPA or W / m ** 3) are averaged
+    over the voxels of each block weighted by the voxel volumes, and extensive
+    results (e.g. the heating deposited in each voxel) are summed. The std.
+    devs. are combined in quadrature with the same weights.
+
+    Args:
+        tally_result: A pint Quantity or a tuple of the tally mean and std.
+            dev. with a value for each voxel
+        mesh: The openmc.RegularMesh, openmc.RectilinearMesh or
+            openmc.CylindricalMesh of the tally
+        factor: The number of voxels merged along each axis. A single value
+            merges blocks of factor x factor x factor voxels.
+        quantity: "intensive" or "extensive"
+        voxel_volumes: The volume of each voxel from compute_volume_of_voxels.
+            Defaults to the volumes of the mesh voxels.
+
+    Returns:
+        The coarsened result in the units of the tally result, and the mesh
+        of the coarse voxels, which has the same type as the mesh
+    """
+
+    if quantity not in QUANTITY_TYPES:
+        msg = (
+            f"quantity must be one of {QUANTITY_TYPES} not {quantity}. Intensive "
+            "quantities are averaged over the voxels and extensive quantities "
+            "are summed"
+        )
+        raise ValueError(msg)
+
+    if not isinstance(
+        mesh, (openmc.RegularMesh, openmc.RectilinearMesh, openmc.CylindricalMesh)
+    ):
+        msg = (
+            "Only Regular, Rectilinear and Cylindrical meshes can be coarsened "
+            f"not a {type(mesh).__name__}"
+        )
+        raise ValueError(msg)
+
+    if isinstance(tally_result, tuple):
+        tally_mean, tally_std_dev = tally_result
+    else:
+        tally_mean, tally_std_dev = tally_result, None
+
+    dimension = tuple(int(value) for value in mesh.dimension)
+    factor = np.broadcast_to(np.asarray(factor, dtype=np.intp), (3,))
+
+    if np.any(factor < 1) or np.any(np.asarray(dimension) % factor != 0):
+        msg = (
+            f"The mesh dimension of {dimension} must be divisible by the "
+            f"coarsening factor of {tuple(factor.tolist())}"
+        )
+        raise ValueError(msg)
+
+    units = tally_mean.units
+    mean = np.asarray(tally_mean.magnitude)
+    if mean.size != np.prod(dimension):
+        msg = (
+            f"The tally result has {mean.size} values but the mesh has "
+            f"{np.prod(dimension)} voxels"
+        )
+        raise ValueError(msg)
+
+    coarse_dimension = tuple((np.asarray(dimension) // factor).tolist())
+    # the first mesh index varies fastest so the flat values reshape to
+    # (z, y, x) and each axis is split into the coarse index and the index
+    # within a block
+    blocks_shape = (
+        coarse_dimension[2],
+        factor[2],
+        coarse_dimension[1],
+        factor[1],
+        coarse_dimension[0],
+        factor[0],
+    )
+    block_axes = (1, 3, 5)
+
+    if quantity == "intensive":
+        if voxel_volumes is None:
+            if isinstance(mesh, openmc.RegularMesh):
+                # the voxels of a RegularMesh all have the same volume
+                voxel_volumes = 1.0
+            else:
+                voxel_volumes = find_volumes_of_mesh_voxels(mesh)
+        weights = np.broadcast_to(
+            np.asarray(voxel_volumes, dtype=float), (mean.size,)
+        ).reshape(blocks_shape)
+        block_volumes = weights.sum(axis=block_axes)
+        coarse_mean = (mean.reshape(blocks_shape) * weights).sum(
+            axis=block_axes
+        ) / block_volumes
+    else:
+        weights = 1.0
+        block_volumes = 1.0
+        coarse_mean = mean.reshape(blocks_shape).sum(axis=block_axes)
+
+    coarse_mesh = _find_coarse_mesh(mesh, factor)
+
+    coarse_mean = ureg.Quantity(coarse_mean.ravel(), units)
+    if tally_std_dev is None:
+        return coarse_mean, coarse_mesh
+
+    std_dev = np.asarray(tally_std_dev.to(units).magnitude).reshape(blocks_shape)
+    coarse_std_dev = (
+        np.sqrt(((weights * std_dev) ** 2).sum(axis=block_axes)) / block_volumes
+    )
+    coarse_std_dev = ureg.Quantity(coarse_std_dev.ravel(), units)
+
+    return (coarse_mean, coarse_std_dev), coarse_mesh
+
+
+def coarsen_mesh_tally(
+    tally, factor, process_function=process_tally, *, quantity: str, **kwargs
+):
+    """Processes a mesh tally into the required units and coarsens the result
+    by merging blocks of voxels, for example for visualisation or storage.
+
+    Args:
+        tally: The openmc.Tally object which should have a Regular,
+            Rectilinear or Cylindrical mesh filter
+        factor: The number of voxels merged along each axis
+        process_function: The function used to process the tally, for example
+            process_tally or process_dose_tally
+        quantity: "intensive" for results that are averaged over the voxels,
+            such as a flux, dose rate or W / m ** 3, or "extensive" for
+            results that are summed, such as W
+        kwargs: Additional arguments passed to the process_function such as
+            required_units, source_strength or volume
+
+    Returns:
+        The coarsened result in the required units, and the mesh of the
+        coarse voxels
+    """
+
+    mesh = get_mesh_from_tally(tally)
+
+    tally_result = process_function(tally=tally, **kwargs)
+
+    return coarsen_mesh_tally_result(
+        tally_result, mesh, factor, quantity, compute_volume_of_voxels(tally)
+    )
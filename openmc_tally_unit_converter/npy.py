@@ -0,0 +1,209 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .sparse import SparseTallyResult
+from .streaming import DEFAULT_CHUNK_SIZE, iter_converted_chunks
+from .utils import ureg
+
+METADATA_FILENAME = "metadata.json"
+
+
+def _to_json_value(value):
+    """Converts NumPy arrays and scalars, such as an array of per cell
+    volumes, into lists and numbers that can be written to JSON"""
+
+    if isinstance(value, (np.ndarray, np.generic)):
+        return np.asarray(value).tolist()
+    raise TypeError(f"{type(value).__name__} can't be written to the metadata")
+
+
+def _write_metadata(directory: Path, metadata: dict):
+    """Writes the metadata sidecar, which is written last so a complete
+    sidecar means the arrays are complete"""
+
+    temporary_filename = directory / f"{METADATA_FILENAME}.tmp"
+    temporary_filename.write_text(
+        json.dumps(metadata, indent=2, default=_to_json_value)
+    )
+    temporary_filename.replace(directory / METADATA_FILENAME)
+
+
+def _prepare_directory(directory) -> Path:
+    """Creates the directory and removes a previous result from it, starting
+    with the sidecar so an interrupted write is never read as complete"""
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in [METADATA_FILENAME, "indices.npy", "mean.npy", "std_dev.npy"]:
+        (directory / name).unlink(missing_ok=True)
+    return directory
+
+
+def write_tally_to_npy(
+    directory,
+    tally,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Path:
+    """Converts a tally into the required units and writes the mean and std.
+    dev. to .npy files with a JSON sidecar of the units and conversion
+    inputs. The tally is converted and written one chunk at a time through
+    memory mapped .npy files.
+
+    Args:
+        directory: The directory to write mean.npy, std_dev.npy and
+            metadata.json into, which is created if it does not exist
+        tally: The openmc.Tally object
+        required_units: The units to convert the tally into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units.
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found.
+        chunk_size: The approximate number of tally values in each chunk
+
+    Returns:
+        The directory that was written
+    """
+
+    directory = _prepare_directory(directory)
+
+    size = int(np.prod(tally.shape))
+    arrays = None
+    for start, tally_mean, tally_std_dev in iter_converted_chunks(
+        tally, required_units, source_strength, volume, chunk_size
+    ):
+        if arrays is None:
+            units = str(tally_mean.units)
+            names = ["mean"] if tally_std_dev is None else ["mean", "std_dev"]
+            arrays = [
+                np.lib.format.open_memmap(
+                    directory / f"{name}.npy",
+                    mode="w+",
+                    dtype=np.float64,
+                    shape=(size,),
+                )
+                for name in names
+            ]
+
+        stop = start + tally_mean.size
+        arrays[0][start:stop] = tally_mean.magnitude
+        if tally_std_dev is not None:
+            arrays[1][start:stop] = tally_std_dev.magnitude
+
+    for array in arrays:
+        array.flush()
+    del arrays
+
+    metadata = {
+        "units": units,
+        "shape": [int(value) for value in tally.shape],
+        "tally_id": tally.id,
+        "tally_name": tally.name or "",
+        "scores": list(tally.scores),
+        "source_strength": source_strength,
+        "volume": volume,
+    }
+    _write_metadata(directory, metadata)
+
+    return directory
+
+
+def write_tally_result_to_npy(directory, tally_result, **metadata) -> Path:
+    """Writes a converted tally result to .npy files with a JSON sidecar of
+    the units.
+
+    Args:
+        directory: The directory to write the .npy files and metadata.json
+            into, which is created if it does not exist
+        tally_result: A pint Quantity, a tuple of the tally mean and std. dev.
+            or a SparseTallyResult
+        metadata: Additional values to write to the JSON sidecar, for example
+            the source_strength or volume used in the conversion
+
+    Returns:
+        The directory that was written
+    """
+
+    directory = _prepare_directory(directory)
+
+    if isinstance(tally_result, SparseTallyResult):
+        arrays = {
+            "indices": tally_result.indices,
+            "mean": tally_result.mean,
+            "std_dev": tally_result.std_dev,
+        }
+        metadata["size"] = tally_result.size
+    elif isinstance(tally_result, tuple):
+        arrays = {"mean": tally_result[0], "std_dev": tally_result[1]}
+    else:
+        arrays = {"mean": tally_result}
+    units = arrays["mean"].units
+
+    for name, array in arrays.items():
+        if array is None:
+            continue
+        if isinstance(array, ureg.Quantity):
+            array = array.to(units).magnitude
+        np.save(directory / f"{name}.npy", np.asarray(array))
+
+    metadata["units"] = str(units)
+    _write_metadata(directory, metadata)
+
+    return directory
+
+
+def read_tally_from_npy(directory, mmap_mode: str = "r"):
+    """Reads a converted tally result written by write_tally_to_npy or
+    write_tally_result_to_npy. The arrays are memory mapped by default so
+    several processes reading the same result share pages through the
+    operating system cache.
+
+    Args:
+        directory: The directory containing the .npy files and metadata.json
+        mmap_mode: The np.load memory map mode. None reads the arrays into
+            memory.
+
+    Returns:
+        The tally result with the same form that was written, and a dictionary
+        of the metadata
+    """
+
+    directory = Path(directory)
+    metadata_filename = directory / METADATA_FILENAME
+    if not metadata_filename.is_file():
+        msg = f"{metadata_filename} was not found, the result may be incomplete"
+        raise FileNotFoundError(msg)
+
+    metadata = json.loads(metadata_filename.read_text())
+    units = ureg[metadata["units"]].units
+
+    arrays = {
+        name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode)
+        for name in ["indices", "mean", "std_dev"]
+        if (directory / f"{name}.npy").is_file()
+    }
+
+    tally_mean = ureg.Quantity(arrays["mean"], units)
+    if "std_dev" in arrays:
+        tally_std_dev = ureg.Quantity(arrays["std_dev"], units)
+    else:
+        tally_std_dev = None
+
+    if "indices" in arrays:
+        tally_result = SparseTallyResult(
+            indices=arrays["indices"],
+            mean=tally_mean,
+            std_dev=tally_std_dev,
+            size=int(metadata["size"]),
+        )
+    elif tally_std_dev is None:
+        tally_result = tally_mean
+    else:
+        tally_result = (tally_mean, tally_std_dev)
+
+    return tally_result, metadata
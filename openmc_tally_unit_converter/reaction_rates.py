@@ -0,0 +1,170 @@
+import numpy as np
+
+from .spectra import (
+    get_energy_filter_axis,
+    get_filter_bins_of_spectra,
+    get_spectra_arrays,
+)
+from .utils import (
+    check_for_energy_filter,
+    check_for_energy_function_filter,
+    convert_tally_results,
+    find_number_of_atoms_per_cm3,
+    get_tally_mean_and_std_dev,
+    ureg,
+)
+
+
+def find_macroscopic_cross_section_matrix(
+    cross_sections: dict, number_of_groups: int, material=None
+) -> np.ndarray:
+    """Stacks a bank of group-wise cross sections into a single matrix of
+    macroscopic cross sections in units of 1 / cm.
+
+    Args:
+        cross_sections: Dictionary with reaction names as keys and group-wise
+            cross sections as values. Values without units are assumed to be
+            macroscopic cross sections in 1 / cm. Values can also be pint
+            Quantities of macroscopic (e.g. 1 / cm) or microscopic (e.g. barn)
+            cross sections.
+        number_of_groups: The number of energy groups in the spectra
+        material: The openmc.Material used to find the number of atoms per
+            cm3 when microscopic cross sections are provided
+
+    Returns:
+        The macroscopic cross sections with a shape of (energy groups,
+        reactions)
+    """
+
+    macroscopic_cross_sections = []
+    for reaction, cross_section in cross_sections.items():
+
+        if not isinstance(cross_section, ureg.Quantity):
+            cross_section = np.asarray(cross_section) * ureg["1 / centimeter"]
+
+        if cross_section.check("[length] ** 2"):
+            if material is None:
+                msg = (
+                    f"The cross section for {reaction} is microscopic. The "
+                    "material is required to find the number of atoms per cm3"
+                )
+                raise ValueError(msg)
+            atoms_per_cm3 = find_number_of_atoms_per_cm3(material)
+            cross_section = cross_section * atoms_per_cm3 * ureg["1 / centimeter ** 3"]
+
+        if not cross_section.check("1 / [length]"):
+            msg = (
+                f"The cross section for {reaction} has units of "
+                f"{cross_section.units} which are not macroscopic or "
+                "microscopic cross section units"
+            )
+            raise ValueError(msg)
+
+        cross_section = cross_section.to("1 / centimeter").magnitude
+        if np.shape(cross_section) != (number_of_groups,):
+            msg = (
+                f"The cross section for {reaction} has {np.size(cross_section)} "
+                f"values but the spectra tally has {number_of_groups} energy groups"
+            )
+            raise ValueError(msg)
+
+        macroscopic_cross_sections.append(cross_section)
+
+    return np.column_stack(macroscopic_cross_sections)
+
+
+def process_reaction_rate_tally(
+    tally,
+    cross_sections: dict,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    material=None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
+) -> dict:
+    """Processes a spectra tally into reaction rates by collapsing the spectra
+    with a bank of group-wise cross sections. All the reactions for every cell
+    or voxel are found with a single matrix product. The tally with default
+    units obtained during simulation is converted into the user specified
+    units. Base units are 'reaction / source_particle'
+
+    Args:
+        tally: The openmc.Tally object which should be a spectra tally. With a
+            score of flux and an EnergyFilter
+        cross_sections: Dictionary with reaction names as keys and group-wise
+            cross sections as values. Values without units are assumed to be
+            macroscopic cross sections in 1 / cm.
+        required_units: The units to convert the reaction rates into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units. This optional
+            argument allows the user to specify the source_strength when needed
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found. This optional argument allows the
+            user to specify the volume when needed or overwrite the
+            automatically calculated volume.
+        material: The openmc.Material used to find the number of atoms per
+            cm3 when microscopic cross sections are provided
+        source_strength_std_dev: The std. dev. of the source_strength. It is
+            combined in quadrature with the tally std. dev. when the
+            source_strength is used in the conversion.
+        volume_std_dev: The std. dev. of the volume in cm3. It is combined in
+            quadrature with the tally std. dev. when the volume is used in the
+            conversion.
+
+    Returns:
+        Dictionary with the reaction names as keys and the reaction rates in
+        the required units as values
+    """
+
+    if not check_for_energy_filter(tally):
+        raise ValueError("EnergyFilter was not found in spectra tally")
+
+    if check_for_energy_function_filter(tally):
+        raise ValueError("EnergyFunctionFilter was found in spectra tally")
+
+    if tally.scores != ["flux"]:
+        msg = "reaction rates can only be found from spectra tallies with a flux score"
+        raise ValueError(msg)
+
+    energy_filter = tally.filters[get_energy_filter_axis(tally)]
+    cross_section_matrix = find_macroscopic_cross_section_matrix(
+        cross_sections, energy_filter.num_bins, material
+    )
+
+    # flux [particle cm / source_particle] multiplied by the macroscopic
+    # cross section [1 / cm] gives reactions per source particle
+    base_units = ureg.reaction / ureg.source_particle
+
+    tally_mean, tally_std_dev = get_tally_mean_and_std_dev(tally)
+
+    spectra, _ = get_spectra_arrays(tally, tally_mean)
+
+    if tally_std_dev is None:
+        collapsed_std_dev = None
+    else:
+        spectra_std_dev, _ = get_spectra_arrays(tally, tally_std_dev)
+        collapsed_std_dev = np.sqrt(spectra_std_dev**2 @ cross_section_matrix**2)
+
+    results = convert_tally_results(
+        tally,
+        spectra @ cross_section_matrix,
+        collapsed_std_dev,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+        source_strength_std_dev=source_strength_std_dev,
+        volume_std_dev=volume_std_dev,
+        filter_bins=get_filter_bins_of_spectra(tally, 1),
+    )
+
+    reaction_rates = {}
+    for index, reaction in enumerate(cross_sections.keys()):
+        if isinstance(results, tuple):
+            reaction_rates[reaction] = tuple(result[..., index] for result in results)
+        else:
+            reaction_rates[reaction] = results[..., index]
+
+    return reaction_rates
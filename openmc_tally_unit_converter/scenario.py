@@ -0,0 +1,149 @@
+import numpy as np
+
+from .utils import process_tally, ureg
+
+SECONDS_PER_YEAR = 365.25 * 24 * 60 * 60
+
+
+class IrradiationScenario:
+    """An irradiation schedule made of pulses. Each pulse has a source
+    strength and a duration and can be followed by a dwell time.
+
+    Args:
+        source_strengths: The source strength of each pulse in particles per
+            second. A single value is used for every pulse.
+        durations: The duration of each pulse in seconds
+        dwell_times: The time between the end of each pulse and the start of
+            the next pulse in seconds. A single value is used for every pulse.
+        availability: The fraction of each pulse that the plant is available
+            for. A single value is used for every pulse.
+    """
+
+    def __init__(
+        self,
+        source_strengths,
+        durations,
+        dwell_times=0.0,
+        availability=1.0,
+    ):
+        (
+            self.source_strengths,
+            self.durations,
+            self.dwell_times,
+            self.availability,
+        ) = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(source_strengths, dtype=float)),
+            np.atleast_1d(np.asarray(durations, dtype=float)),
+            np.atleast_1d(np.asarray(dwell_times, dtype=float)),
+            np.atleast_1d(np.asarray(availability, dtype=float)),
+        )
+
+        if self.source_strengths.ndim != 1:
+            raise ValueError("The scenario must be a one dimensional list of pulses")
+        if np.any(self.durations < 0) or np.any(self.dwell_times < 0):
+            raise ValueError("durations and dwell_times can't be negative")
+        if np.any(self.availability < 0) or np.any(self.availability > 1):
+            raise ValueError("availability must be between 0 and 1")
+
+    @property
+    def number_of_pulses(self) -> int:
+        return self.source_strengths.size
+
+    @property
+    def source_particles_per_pulse(self) -> np.ndarray:
+        """The number of source particles emitted in each pulse"""
+        return self.source_strengths * self.durations * self.availability
+
+    @property
+    def total_source_particles(self) -> float:
+        """The number of source particles emitted over the whole scenario"""
+        return self.source_particles_per_pulse.sum()
+
+    @property
+    def pulse_end_times(self) -> np.ndarray:
+        """The time in seconds at the end of each pulse measured from the start
+        of the first pulse"""
+        return np.cumsum(self.durations + self.dwell_times) - self.dwell_times
+
+    def find_full_power_years(self, source_strength: float) -> float:
+        """Finds the number of full power years of the scenario.
+
+        Args:
+            source_strength: The source strength at full power in particles per
+                second.
+
+        Returns:
+            The number of years at full power that emit the same number of
+            source particles as the scenario
+        """
+        return self.total_source_particles / (source_strength * SECONDS_PER_YEAR)
+
+
+def process_scenario_tally(
+    tally,
+    scenario: IrradiationScenario,
+    required_units: str,
+    time_series: bool = False,
+    process_function=process_tally,
+    **kwargs,
+):
+    """Processes a tally into the total over an irradiation scenario, for
+    example the cumulative DPA, fluence or dose. The tally is converted once
+    per source particle and then scaled by the source particles of the
+    scenario in a single vectorized operation over all tally bins.
+
+    Args:
+        tally: The openmc.Tally object to process
+        scenario: The IrradiationScenario to integrate the tally over
+        required_units: The units to convert the tally into. These should be
+            time integrated units (e.g. "displacements / atom" or
+            "neutron / cm ** 2") without a time or pulse dimension.
+        time_series: If True the cumulative result at the end of each pulse is
+            returned with a shape of (pulses, tally bins). Otherwise the total
+            at the end of the scenario is returned.
+        process_function: The function used to process the tally, for example
+            process_tally or process_damage_energy_tally
+        kwargs: Additional arguments passed to the process_function such as
+            volume, material or energy_per_displacement
+
+    Returns:
+        The tally result integrated over the scenario in the required units
+    """
+
+    if "source_strength" in kwargs:
+        msg = (
+            "source_strength can't be specified as the source strengths are "
+            "taken from the scenario"
+        )
+        raise ValueError(msg)
+
+    units = ureg[required_units]
+    for dimension in ["[time]", "[pulse]"]:
+        if units.dimensionality.get(dimension) != 0:
+            msg = (
+                f"required_units {required_units} has a {dimension} dimension. "
+                "The scenario integrates the tally over time so required_units "
+                "must not have a time or pulse dimension"
+            )
+            raise ValueError(msg)
+
+    # source_particle is dimensionless so the tally can be converted to the
+    # required units per source particle without a source strength
+    results = process_function(
+        tally=tally,
+        required_units=f"({required_units}) / source_particle",
+        **kwargs,
+    )
+
+    if time_series:
+        source_particles = np.cumsum(scenario.source_particles_per_pulse)
+        source_particles = source_particles.reshape(-1, 1)
+    else:
+        source_particles = scenario.total_source_particles
+    source_particles = source_particles * ureg.source_particle
+
+    if isinstance(results, tuple):
+        return tuple(
+            (result * source_particles).to(required_units) for result in results
+        )
+    return (results * source_particles).to(required_units)
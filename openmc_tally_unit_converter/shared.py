@@ -0,0 +1,272 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import openmc
+
+from .cli import PROCESSORS, parse_tally_options
+from .sparse import SparseTallyResult
+from .utils import ureg
+
+
+class SharedArrayHandle(
+    namedtuple("SharedArrayHandle", ["name", "shape", "dtype", "units"])
+):
+    """A reference to an array in a shared memory block, which is small
+    enough to pass between processes in place of the array.
+
+    Args:
+        name: The name of the shared memory block
+        shape: The shape of the array
+        dtype: The NumPy dtype string of the array
+        units: The units of the array or None for arrays without units such
+            as the indices of a SparseTallyResult
+    """
+
+    __slots__ = ()
+
+
+def _create_shared_memory(size: int) -> shared_memory.SharedMemory:
+    """Creates a shared memory block that is owned by the process which
+    attaches to it rather than the process that created it"""
+
+    # blocks can't be empty
+    size = max(size, 1)
+    try:
+        # Python 3.13 and newer
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    except TypeError:
+        block = shared_memory.SharedMemory(create=True, size=size)
+        # stops the resource tracker removing the block when this process ends
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def _share_array(values) -> SharedArrayHandle:
+    if isinstance(values, ureg.Quantity):
+        units = str(values.units)
+        values = np.asarray(values.magnitude)
+    else:
+        units = None
+        values = np.asarray(values)
+
+    block = _create_shared_memory(values.nbytes)
+    try:
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[...] = values
+    except Exception:
+        block.close()
+        block.unlink()
+        raise
+    handle = SharedArrayHandle(
+        name=block.name, shape=values.shape, dtype=values.dtype.str, units=units
+    )
+    block.close()
+    return handle
+
+
+def _unlink_shared_arrays(handles):
+    for handle in handles:
+        try:
+            block = shared_memory.SharedMemory(name=handle.name)
+        except FileNotFoundError:
+            continue
+        block.close()
+        block.unlink()
+
+
+def share_tally_result(tally_result):
+    """Copies the arrays of a converted tally result into shared memory
+    blocks. The blocks are not removed when this process ends, so the
+    process that receives the handles should map them with
+    SharedTallyResult and release them. When an array can't be shared the
+    blocks already created are removed.
+
+    Args:
+        tally_result: A pint Quantity, a tuple of the tally mean and std. dev.
+            or a SparseTallyResult
+
+    Returns:
+        The tally result with each array replaced by a SharedArrayHandle
+    """
+
+    handles = []
+
+    def share(values):
+        handle = _share_array(values)
+        handles.append(handle)
+        return handle
+
+    try:
+        if isinstance(tally_result, SparseTallyResult):
+            return SparseTallyResult(
+                indices=share(tally_result.indices),
+                mean=share(tally_result.mean),
+                std_dev=(
+                    None
+                    if tally_result.std_dev is None
+                    else share(tally_result.std_dev)
+                ),
+                size=tally_result.size,
+            )
+        if isinstance(tally_result, tuple):
+            return tuple(share(values) for values in tally_result)
+        return share(tally_result)
+    except Exception:
+        # the blocks are not tracked so they would outlive this process
+        _unlink_shared_arrays(handles)
+        raise
+
+
+class SharedTallyResult:
+    """Maps the shared memory blocks of a tally result shared with
+    share_tally_result without copying the arrays. The blocks stay allocated
+    until release is called, which can be done with a with statement.
+
+    Args:
+        handles: The tally result of SharedArrayHandle from
+            share_tally_result
+
+    Attributes:
+        result: The tally result with the same form that was shared, with
+            arrays that use the shared memory
+    """
+
+    def __init__(self, handles):
+        self.handles = handles
+        self._blocks = []
+        self.result = self._attach(handles)
+
+    def _attach_array(self, handle: SharedArrayHandle):
+        block = shared_memory.SharedMemory(name=handle.name)
+        self._blocks.append(block)
+        values = np.ndarray(
+            handle.shape, dtype=np.dtype(handle.dtype), buffer=block.buf
+        )
+        if handle.units is None:
+            return values
+        return ureg.Quantity(values, handle.units)
+
+    def _attach(self, handles):
+        try:
+            if isinstance(handles, SparseTallyResult):
+                return SparseTallyResult(
+                    indices=self._attach_array(handles.indices),
+                    mean=self._attach_array(handles.mean),
+                    std_dev=(
+                        None
+                        if handles.std_dev is None
+                        else self._attach_array(handles.std_dev)
+                    ),
+                    size=handles.size,
+                )
+            if isinstance(handles, tuple) and not isinstance(
+                handles, SharedArrayHandle
+            ):
+                return tuple(self._attach_array(handle) for handle in handles)
+            return self._attach_array(handles)
+        except Exception:
+            self.release()
+            raise
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the mapped shared memory blocks in bytes"""
+        return sum(block.size for block in self._blocks)
+
+    def release(self):
+        """Removes the shared memory blocks. The memory is returned to the
+        operating system once the arrays of the result are no longer
+        referenced, so the result should not be used after releasing it."""
+
+        self.result = None
+        for block in self._blocks:
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+            try:
+                block.close()
+            except BufferError:
+                # arrays of the result are still referenced elsewhere
+                pass
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.release()
+
+
+def process_statepoint_tally_to_shared_memory(
+    statepoint_filename, tally_name: str, options: dict
+):
+    """Converts a tally of a statepoint file with the options of a conversion
+    spec and shares the result. This is the function run by each worker
+    process of process_tallies_with_shared_memory.
+
+    Args:
+        statepoint_filename: The path of the statepoint file
+        tally_name: The name of the tally to convert
+        options: The conversion options of the tally from the conversion spec
+
+    Returns:
+        The tally result with each array replaced by a SharedArrayHandle
+    """
+
+    processor, kwargs = parse_tally_options(options)
+    with openmc.StatePoint(filepath=str(statepoint_filename)) as statepoint:
+        tally = statepoint.get_tally(name=tally_name)
+        tally_result = PROCESSORS[processor](tally=tally, **kwargs)
+    return share_tally_result(tally_result)
+
+
+def process_tallies_with_shared_memory(
+    statepoint_filenames, spec: dict, workers: int = None
+) -> dict:
+    """Converts the tallies of a conversion spec in each statepoint file in a
+    pool of worker processes. The workers return the results in shared
+    memory, so the converted arrays are not pickled back to this process.
+
+    Args:
+        statepoint_filenames: The paths of the statepoint files
+        spec: The conversion spec from load_conversion_spec
+        workers: The number of worker processes. Defaults to the number of
+            cores.
+
+    Returns:
+        Dictionary with tuples of the statepoint filename and tally name as
+        keys and SharedTallyResult as values. Each SharedTallyResult should be
+        released once its result is no longer needed.
+    """
+
+    jobs = [
+        (statepoint_filename, tally_name, options)
+        for statepoint_filename in statepoint_filenames
+        for tally_name, options in spec.items()
+    ]
+
+    shared_results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(process_statepoint_tally_to_shared_memory, *job)
+            for job in jobs
+        ]
+        error = None
+        for (statepoint_filename, tally_name, _), future in zip(jobs, futures):
+            try:
+                handles = future.result()
+            except Exception as exception:
+                error = error or exception
+                continue
+            shared_results[(statepoint_filename, tally_name)] = SharedTallyResult(
+                handles
+            )
+
+    if error is not None:
+        for shared_result in shared_results.values():
+            shared_result.release()
+        raise error
+
+    return shared_results
@@ -0,0 +1,128 @@
+from collections import namedtuple
+
+import numpy as np
+import scipy.sparse
+
+from .streaming import DEFAULT_CHUNK_SIZE, iter_converted_chunks, iter_tally_chunks
+from .utils import ureg
+
+
+class SparseTallyResult(
+    namedtuple("SparseTallyResult", ["indices", "mean", "std_dev", "size"])
+):
+    """A converted tally result that only stores the non-zero bins.
+
+    Args:
+        indices: The flat indices of the non-zero bins in the tally order
+        mean: pint Quantity of the tally mean of the non-zero bins
+        std_dev: pint Quantity of the tally std. dev. of the non-zero bins or
+            None when the tally has no std. dev.
+        size: The total number of tally bins
+    """
+
+    __slots__ = ()
+
+    @property
+    def units(self):
+        return self.mean.units
+
+    @property
+    def density(self) -> float:
+        """The fraction of the tally bins that are non-zero"""
+        return self.indices.size / self.size if self.size else 0.0
+
+    def to_dense(self):
+        """Converts the sparse result into dense arrays with the same form as
+        the result of process_tally"""
+
+        mean = np.zeros(self.size)
+        mean[self.indices] = self.mean.magnitude
+        if self.std_dev is None:
+            return ureg.Quantity(mean, self.units)
+
+        std_dev = np.zeros(self.size)
+        std_dev[self.indices] = self.std_dev.to(self.units).magnitude
+        return ureg.Quantity(mean, self.units), ureg.Quantity(std_dev, self.units)
+
+    def to_csr(self, std_dev: bool = False) -> scipy.sparse.csr_matrix:
+        """Converts the mean, or the std. dev., into a CSR matrix with a
+        single row over the flattened tally bins. The units are not included."""
+
+        values = self.std_dev.to(self.units) if std_dev else self.mean
+        return scipy.sparse.csr_matrix(
+            (values.magnitude, (np.zeros_like(self.indices), self.indices)),
+            shape=(1, self.size),
+        )
+
+
+def find_tally_sparsity(tally, chunk_size: int = DEFAULT_CHUNK_SIZE) -> float:
+    """Finds the fraction of the tally bins that are zero in a streaming pass
+    over the tally.
+
+    Args:
+        tally: The openmc.Tally object
+        chunk_size: The approximate number of tally values in each chunk
+
+    Returns:
+        The fraction of the tally bins with a mean of zero
+    """
+
+    number_of_zeros = 0
+    number_of_values = 0
+    for _, tally_mean, _ in iter_tally_chunks(tally, chunk_size):
+        number_of_zeros += tally_mean.size - np.count_nonzero(tally_mean)
+        number_of_values += tally_mean.size
+
+    return number_of_zeros / number_of_values if number_of_values else 0.0
+
+
+def process_sparse_tally(
+    tally,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SparseTallyResult:
+    """Processes a tally into the required units keeping only the non-zero
+    bins. The tally is converted in chunks so the memory used scales with the
+    number of non-zero bins rather than the number of tally bins.
+
+    Args:
+        tally: The openmc.Tally object
+        required_units: The units to convert the tally into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units.
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found.
+        chunk_size: The approximate number of tally values in each chunk
+
+    Returns:
+        The SparseTallyResult with the non-zero bins in the required units
+    """
+
+    indices = []
+    means = []
+    std_devs = []
+    size = 0
+    units = None
+    for start, tally_mean, tally_std_dev in iter_converted_chunks(
+        tally, required_units, source_strength, volume, chunk_size
+    ):
+        units = tally_mean.units
+        non_zero = np.flatnonzero(tally_mean.magnitude)
+        indices.append(non_zero + start)
+        means.append(tally_mean.magnitude[non_zero])
+        if tally_std_dev is not None:
+            std_devs.append(tally_std_dev.magnitude[non_zero])
+        size += tally_mean.size
+
+    if units is None:
+        raise ValueError(f"tally {tally.id} has no values")
+
+    return SparseTallyResult(
+        indices=np.concatenate(indices).astype(np.intp),
+        mean=ureg.Quantity(np.concatenate(means), units),
+        std_dev=ureg.Quantity(np.concatenate(std_devs), units) if std_devs else None,
+        size=size,
+    )
@@ -0,0 +1,278 @@
+from functools import lru_cache
+
+import numpy as np
+import openmc
+import scipy.sparse
+
+from .utils import (
+    check_for_energy_filter,
+    check_for_energy_function_filter,
+    convert_tally_results,
+    get_score_units,
+    get_tally_mean_and_std_dev,
+    ureg,
+)
+
+
+def find_group_structure(group_structure) -> np.ndarray:
+    """Finds the energy group edges of a group structure.
+
+    Args:
+        group_structure: Either the name of a group structure known to OpenMC
+            (e.g. "VITAMIN-J-175", "CCFE-709") or an iterable of energy group
+            edges in eV.
+
+    Returns:
+        The energy group edges in eV as a numpy array
+    """
+
+    if isinstance(group_structure, str):
+        if group_structure not in openmc.mgxs.GROUP_STRUCTURES:
+            msg = (
+                f"group_structure {group_structure} was not found. Options "
+                f"are {sorted(openmc.mgxs.GROUP_STRUCTURES.keys())}"
+            )
+            raise ValueError(msg)
+        edges = openmc.mgxs.GROUP_STRUCTURES[group_structure]
+    else:
+        edges = group_structure
+
+    edges = np.asarray(edges, dtype=float)
+
+    if edges.ndim != 1 or edges.size < 2:
+        raise ValueError("group_structure must contain at least two energy edges")
+    if np.any(np.diff(edges) <= 0):
+        raise ValueError("group_structure energy edges must be strictly increasing")
+
+    return edges
+
+
+@lru_cache(maxsize=32)
+def _cached_rebinning_matrix(source_edges: bytes, target_edges: bytes):
+    source_edges = np.frombuffer(source_edges)
+    target_edges = np.frombuffer(target_edges)
+
+    # every segment of the union grid lies in exactly one source group and at
+    # most one target group, so the overlaps are found without a double loop
+    union_edges = np.union1d(source_edges, target_edges)
+    segment_widths = np.diff(union_edges)
+    segment_middles = 0.5 * (union_edges[1:] + union_edges[:-1])
+
+    source_index = np.searchsorted(source_edges, segment_middles, side="right") - 1
+    target_index = np.searchsorted(target_edges, segment_middles, side="right") - 1
+
+    in_both = (
+        (source_index >= 0)
+        & (source_index < source_edges.size - 1)
+        & (target_index >= 0)
+        & (target_index < target_edges.size - 1)
+    )
+    source_index = source_index[in_both]
+    target_index = target_index[in_both]
+
+    # fraction of each source group that falls in the target group, assuming
+    # the tally is uniformly distributed in energy within a source group
+    source_widths = np.diff(source_edges)
+    fractions = segment_widths[in_both] / source_widths[source_index]
+
+    matrix = scipy.sparse.coo_matrix(
+        (fractions, (target_index, source_index)),
+        shape=(target_edges.size - 1, source_edges.size - 1),
+    ).tocsr()
+    matrix.sum_duplicates()
+
+    return matrix
+
+
+def find_rebinning_matrix(source_edges, target_edges):
+    """Finds the sparse overlap matrix that rebins values tallied on the source
+    energy groups onto the target energy groups. Each entry is the fraction of
+    a source group that overlaps a target group. Matrices are cached and keyed
+    by the pair of edge sets so repeated rebinning reuses the same matrix.
+
+    Args:
+        source_edges: The energy group edges of the tally in eV
+        target_edges: The energy group edges to rebin onto in eV
+
+    Returns:
+        A scipy.sparse.csr_matrix with a shape of (target groups, source groups)
+    """
+
+    source_edges = np.ascontiguousarray(source_edges, dtype=float)
+    target_edges = np.ascontiguousarray(target_edges, dtype=float)
+
+    return _cached_rebinning_matrix(source_edges.tobytes(), target_edges.tobytes())
+
+
+def get_energy_filter_axis(tally) -> int:
+    """Finds the position of the EnergyFilter in the filters of the tally"""
+
+    for axis, tally_filter in enumerate(tally.filters):
+        if isinstance(tally_filter, openmc.filter.EnergyFilter):
+            return axis
+    raise ValueError("EnergyFilter was not found in spectra tally")
+
+
+def get_spectra_arrays(tally, values):
+    """Reshapes flat tally values so that each row is the spectrum of one
+    cell, voxel or other combination of the non energy filter bins.
+
+    Args:
+        tally: The openmc.Tally object that contains an EnergyFilter
+        values: The flat array of tally values in the tally bin order
+
+    Returns:
+        A view of the values with a shape of (spectra, energy groups) and the
+        shape of the filter bins before and after the energy filter
+    """
+
+    energy_axis = get_energy_filter_axis(tally)
+    filter_bins = [tally_filter.num_bins for tally_filter in tally.filters]
+
+    bins_before = int(np.prod(filter_bins[:energy_axis]))
+    number_of_groups = filter_bins[energy_axis]
+
+    values = np.asarray(values).reshape(bins_before, number_of_groups, -1)
+    bins_after = values.shape[2]
+
+    spectra = np.moveaxis(values, 1, 2).reshape(-1, number_of_groups)
+
+    return spectra, (bins_before, bins_after)
+
+
+def get_filter_bins_of_spectra(tally, number_of_groups: int) -> list:
+    """Finds the number of bins of each filter of a spectra tally after the
+    energy axis has been rebinned onto number_of_groups groups or collapsed
+    with number_of_groups set to 1. See expand_voxel_volumes."""
+
+    filter_bins = [tally_filter.num_bins for tally_filter in tally.filters]
+    filter_bins[get_energy_filter_axis(tally)] = number_of_groups
+    return filter_bins
+
+
+def get_tally_values_from_spectra(spectra, bin_shape):
+    """Reverses get_spectra_arrays returning flat values in the tally bin
+    order, the number of energy groups is allowed to have changed"""
+
+    bins_before, bins_after = bin_shape
+    values = spectra.reshape(bins_before, bins_after, -1)
+    return np.moveaxis(values, 2, 1).ravel()
+
+
+def rebin_spectra(values, source_edges, target_edges, std_dev=None):
+    """Rebins spectra onto a new group structure with a single sparse
+    matrix product over all the spectra. The standard deviation is propagated
+    assuming the source groups are independent.
+
+    Args:
+        values: Array of spectra with a shape of (spectra, source groups)
+        source_edges: The energy group edges of the values in eV
+        target_edges: The energy group edges to rebin onto in eV
+        std_dev: Optional array of standard deviations with the same shape as
+            values
+
+    Returns:
+        The rebinned values with a shape of (spectra, target groups) and the
+        rebinned standard deviation if std_dev was provided
+    """
+
+    matrix = find_rebinning_matrix(source_edges, target_edges)
+
+    rebinned_values = np.asarray(matrix @ np.asarray(values).T).T
+
+    if std_dev is None:
+        return rebinned_values
+
+    variance = np.asarray(std_dev) ** 2
+    rebinned_variance = np.asarray(matrix.multiply(matrix) @ variance.T).T
+
+    return rebinned_values, np.sqrt(rebinned_variance)
+
+
+def rebin_spectra_tally(
+    tally,
+    group_structure,
+    required_units: str = None,
+    required_energy_units: str = "eV",
+    source_strength: float = None,
+    volume: float = None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
+) -> tuple:
+    """Rebins a spectra tally onto a different energy group structure and
+    converts the tally with default units obtained during simulation into the
+    user specified units. Base units are 'centimeters / source_particle'
+
+    Args:
+        tally: The openmc.Tally object which should be a spectra tally. With a
+            score of flux or current and an EnergyFilter
+        group_structure: The name of a group structure known to OpenMC (e.g.
+            "VITAMIN-J-175") or an iterable of energy group edges in eV
+        required_units: The units to convert the tally into
+        required_energy_units: The units to convert the energy group edges into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units. This optional
+            argument allows the user to specify the source_strength when needed
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found. This optional argument allows the
+            user to specify the volume when needed or overwrite the
+            automatically calculated volume.
+        source_strength_std_dev: The std. dev. of the source_strength. It is
+            combined in quadrature with the tally std. dev. when the
+            source_strength is used in the conversion.
+        volume_std_dev: The std. dev. of the volume in cm3. It is combined in
+            quadrature with the tally std. dev. when the volume is used in the
+            conversion.
+
+    Returns:
+        Tuple of the new energy group edges and rebinned tally results
+    """
+
+    if not check_for_energy_filter(tally):
+        raise ValueError("EnergyFilter was not found in spectra tally")
+
+    if check_for_energy_function_filter(tally):
+        raise ValueError("EnergyFunctionFilter was found in spectra tally")
+
+    energy_filter = tally.filters[get_energy_filter_axis(tally)]
+    source_edges = np.asarray(energy_filter.values, dtype=float)
+    target_edges = find_group_structure(group_structure)
+
+    energy_base = target_edges * ureg.electron_volt
+    energy_in_required_units = energy_base.to(required_energy_units)
+
+    # checks for user provided base units
+    base_units = get_score_units(tally)
+
+    tally_mean, tally_std_dev = get_tally_mean_and_std_dev(tally)
+
+    spectra, bin_shape = get_spectra_arrays(tally, tally_mean)
+
+    if tally_std_dev is None:
+        rebinned_spectra = rebin_spectra(spectra, source_edges, target_edges)
+        rebinned_std_dev = None
+    else:
+        spectra_std_dev, _ = get_spectra_arrays(tally, tally_std_dev)
+        rebinned_spectra, rebinned_std_dev = rebin_spectra(
+            spectra, source_edges, target_edges, spectra_std_dev
+        )
+        rebinned_std_dev = get_tally_values_from_spectra(rebinned_std_dev, bin_shape)
+
+    results = convert_tally_results(
+        tally,
+        get_tally_values_from_spectra(rebinned_spectra, bin_shape),
+        rebinned_std_dev,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+        source_strength_std_dev=source_strength_std_dev,
+        volume_std_dev=volume_std_dev,
+        filter_bins=get_filter_bins_of_spectra(tally, len(target_edges) - 1),
+    )
+
+    if isinstance(results, tuple):
+        return (energy_in_required_units,) + results
+    else:
+        return energy_in_required_units, results
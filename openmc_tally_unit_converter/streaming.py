@@ -0,0 +1,336 @@
+import h5py
+import numpy as np
+import openmc
+
+from .utils import (
+    compute_volume_of_voxels,
+    convert_tally_results,
+    find_integral_weights,
+    find_scaling_factors,
+    get_score_units,
+    get_voxel_index_of_tally_values,
+    ureg,
+)
+
+DEFAULT_CHUNK_SIZE = 2**20
+
+
+def iter_tally_chunks(tally, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Iterates over the flat tally mean and std. dev. in chunks. When the
+    tally was loaded from a statepoint the sums and sums of squares are read
+    from the statepoint file one chunk at a time so the full tally results
+    are never held in memory.
+
+    Args:
+        tally: The openmc.Tally object
+        chunk_size: The approximate number of tally values in each chunk
+
+    Returns:
+        A generator of the index of the first value of the chunk, the chunk of
+        the tally mean and the chunk of the tally std. dev. The std. dev. is
+        None when the tally has a single realization.
+    """
+
+    number_of_realizations = tally.num_realizations
+    statepoint_filename = getattr(tally, "_sp_filename", None)
+
+    if not statepoint_filename:
+        tally_mean = np.asarray(tally.mean).ravel()
+        if number_of_realizations > 1:
+            tally_std_dev = np.asarray(tally.std_dev).ravel()
+        for start in range(0, tally_mean.size, chunk_size):
+            stop = start + chunk_size
+            if number_of_realizations > 1:
+                yield start, tally_mean[start:stop], tally_std_dev[start:stop]
+            else:
+                yield start, tally_mean[start:stop], None
+        return
+
+    with h5py.File(statepoint_filename, "r") as statepoint_file:
+        # results have a shape of (filter bins, nuclides * scores, 2) with the
+        # sum and the sum of squares in the last axis
+        results = statepoint_file[f"tallies/tally {tally.id}/results"]
+        values_per_row = results.shape[1]
+        rows_per_chunk = max(1, chunk_size // values_per_row)
+
+        for start_row in range(0, results.shape[0], rows_per_chunk):
+            chunk = results[start_row : start_row + rows_per_chunk]
+            tally_sum = chunk[..., 0].ravel()
+            tally_sum_sq = chunk[..., 1].ravel()
+
+            tally_mean = tally_sum / number_of_realizations
+            if number_of_realizations > 1:
+                variance = (tally_sum_sq / number_of_realizations - tally_mean**2) / (
+                    number_of_realizations - 1
+                )
+                tally_std_dev = np.sqrt(np.clip(variance, 0, None))
+            else:
+                tally_std_dev = None
+
+            yield start_row * values_per_row, tally_mean, tally_std_dev
+
+
+def iter_converted_chunks(
+    tally,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Iterates over the tally mean and std. dev. converted into the required
+    units in chunks. The conversion factor is found once and applied to each
+    chunk.
+
+    Args:
+        tally: The openmc.Tally object
+        required_units: The units to convert the tally into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units.
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found.
+        chunk_size: The approximate number of tally values in each chunk
+
+    Returns:
+        A generator of the index of the first value of the chunk, the chunk of
+        the tally mean and the chunk of the tally std. dev. in the required
+        units.
+    """
+
+    if np.ndim(source_strength) > 0:
+        raise ValueError("A single source_strength is required to stream a tally")
+
+    base_units = get_score_units(tally)
+
+    # the voxels of rectilinear and cylindrical meshes have different volumes
+    # so the conversion factor is found per unit volume and the voxel volumes
+    # are applied to each chunk
+    voxel_volumes = None
+    volume_power = 0
+    if volume is None and required_units is not None:
+        if tally.contains_filter(openmc.MeshFilter):
+            mesh_volumes = compute_volume_of_voxels(tally)
+            if np.ndim(mesh_volumes) > 0:
+                voxel_volumes = mesh_volumes
+                volume = 1.0
+                scaling_factors = find_scaling_factors(
+                    tally, base_units, ureg[required_units], source_strength, volume
+                )
+                if "volume" in scaling_factors:
+                    length_power = scaling_factors["volume"].dimensionality["[length]"]
+                    volume_power = length_power // 3
+
+    conversion = convert_tally_results(
+        tally,
+        np.ones(1),
+        None,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+    )
+    factor = conversion.magnitude[0]
+    units = conversion.units
+
+    for start, tally_mean, tally_std_dev in iter_tally_chunks(tally, chunk_size):
+        if volume_power == 0:
+            chunk_factor = factor
+        else:
+            voxel_index = get_voxel_index_of_tally_values(
+                tally, start, start + tally_mean.size
+            )
+            chunk_volumes = voxel_volumes[voxel_index]
+            chunk_factor = factor * chunk_volumes**volume_power
+
+        if tally_std_dev is None:
+            yield start, ureg.Quantity(tally_mean * chunk_factor, units), None
+        else:
+            yield (
+                start,
+                ureg.Quantity(tally_mean * chunk_factor, units),
+                ureg.Quantity(tally_std_dev * np.abs(chunk_factor), units),
+            )
+
+
+def find_streaming_statistics(
+    tally,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    percentiles=(50, 90, 99),
+    number_of_histogram_bins: int = 1000,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    quantity: str,
+) -> dict:
+    """Finds summary statistics of a tally in the required units in a
+    streaming pass over the tally values. The peak value is found with its
+    index and std. dev., the integral is found over the tally bins and the
+    percentiles are approximated from a histogram with logarithmic bins
+    between the smallest positive value and the peak value, which requires a
+    second pass.
+
+    Args:
+        tally: The openmc.Tally object
+        required_units: The units to convert the tally into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units.
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. In the case of a regular mesh the
+            volume is automatically found.
+        percentiles: The percentiles to approximate between 0 and 100
+        number_of_histogram_bins: The number of logarithmic histogram bins used
+            to approximate the percentiles
+        chunk_size: The approximate number of tally values in each chunk
+        quantity: "intensive" for results that are integrated over the mesh
+            voxel volumes, such as W / m ** 3 or DPA, or "extensive" for
+            results that are summed, such as W. See find_integral_weights.
+
+    Returns:
+        Dictionary with the "maximum" (mean and std. dev. when available),
+        the "maximum_index" into the flat tally results, the "integral" (mean
+        and std. dev. when available), the "number_of_values" and the
+        approximate "percentiles" as a dictionary.
+    """
+
+    for percentile in percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"percentiles must be between 0 and 100 not {percentile}")
+
+    maximum = -np.inf
+    maximum_std_dev = None
+    maximum_index = None
+    minimum_positive = np.inf
+    total = 0.0
+    total_variance = 0.0
+    number_of_values = 0
+    has_std_dev = False
+    weights = None
+
+    for start, tally_mean, tally_std_dev in iter_converted_chunks(
+        tally, required_units, source_strength, volume, chunk_size
+    ):
+        units = tally_mean.units
+        mean = tally_mean.magnitude
+        if mean.size == 0:
+            continue
+
+        chunk_maximum_index = int(np.argmax(mean))
+        if mean[chunk_maximum_index] > maximum:
+            maximum = mean[chunk_maximum_index]
+            maximum_index = start + chunk_maximum_index
+            if tally_std_dev is not None:
+                maximum_std_dev = tally_std_dev.magnitude[chunk_maximum_index]
+
+        positive = mean[mean > 0]
+        if positive.size:
+            minimum_positive = min(minimum_positive, positive.min())
+
+        if weights is None:
+            voxel_volumes = None
+            if quantity == "intensive":
+                voxel_volumes = compute_volume_of_voxels(tally)
+            weights, integral_units = find_integral_weights(
+                units, quantity, voxel_volumes
+            )
+        if np.ndim(weights) == 0:
+            chunk_weights = weights
+        else:
+            # the weights of Rectilinear and Cylindrical meshes are per voxel
+            voxel_index = get_voxel_index_of_tally_values(
+                tally, start, start + mean.size
+            )
+            chunk_weights = weights[voxel_index]
+
+        total += np.sum(mean * chunk_weights)
+        if tally_std_dev is not None:
+            has_std_dev = True
+            total_variance += np.sum((tally_std_dev.magnitude * chunk_weights) ** 2)
+        number_of_values += mean.size
+
+    if number_of_values == 0:
+        raise ValueError(f"tally {tally.id} has no values")
+
+    integral = ureg.Quantity(total, integral_units)
+    peak = ureg.Quantity(maximum, units)
+    if has_std_dev:
+        integral = (
+            integral,
+            ureg.Quantity(np.sqrt(total_variance), integral_units),
+        )
+        peak = (peak, ureg.Quantity(maximum_std_dev, units))
+
+    approximate_percentiles = _find_histogram_percentiles(
+        tally,
+        required_units,
+        source_strength,
+        volume,
+        percentiles,
+        number_of_histogram_bins,
+        chunk_size,
+        minimum_positive,
+        maximum,
+        number_of_values,
+    )
+
+    return {
+        "maximum": peak,
+        "maximum_index": maximum_index,
+        "integral": integral,
+        "number_of_values": number_of_values,
+        "percentiles": {
+            percentile: ureg.Quantity(value, units)
+            for percentile, value in zip(percentiles, approximate_percentiles)
+        },
+    }
+
+
+def _find_histogram_percentiles(
+    tally,
+    required_units,
+    source_strength,
+    volume,
+    percentiles,
+    number_of_histogram_bins,
+    chunk_size,
+    minimum_positive,
+    maximum,
+    number_of_values,
+) -> np.ndarray:
+    """Approximates percentiles by streaming the converted tally values into a
+    histogram with logarithmic bins. Values that are not positive are counted
+    below the first bin and are reported as zero."""
+
+    if maximum <= 0:
+        return np.zeros(len(percentiles))
+
+    if minimum_positive == maximum:
+        edges = np.array([maximum, maximum])
+    else:
+        edges = np.geomspace(minimum_positive, maximum, number_of_histogram_bins + 1)
+
+    counts = np.zeros(len(edges) - 1, dtype=np.int64)
+    number_not_positive = 0
+    for _, tally_mean, _ in iter_converted_chunks(
+        tally, required_units, source_strength, volume, chunk_size
+    ):
+        mean = tally_mean.magnitude
+        positive = mean[mean > 0]
+        number_not_positive += mean.size - positive.size
+        bin_index = np.searchsorted(edges, positive, side="right") - 1
+        bin_index = np.clip(bin_index, 0, len(counts) - 1)
+        counts += np.bincount(bin_index, minlength=len(counts))
+
+    cumulative_counts = number_not_positive + np.cumsum(counts)
+
+    values = []
+    for percentile in percentiles:
+        rank = percentile / 100 * number_of_values
+        if rank <= number_not_positive:
+            values.append(0.0)
+            continue
+        bin_index = min(int(np.searchsorted(cumulative_counts, rank)), len(counts) - 1)
+        # the geometric centre of the logarithmic bin
+        values.append(np.sqrt(edges[bin_index] * edges[bin_index + 1]))
+
+    return np.array(values)
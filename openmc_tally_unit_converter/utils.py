@@ -1,3 +1,7 @@
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
@@ -6,9 +10,26 @@ import openmc
 import pandas as pd
 import pint
 
+from .damage import find_damage_model_factors, map_materials
+
 ureg = pint.UnitRegistry()
 ureg.load_definitions(str(Path(__file__).parent / "neutronics_units.txt"))
 
+# arrays extracted from each tally, keyed by the id of the tally as the hash
+# of an openmc.Tally is found from its repr. Entries are removed when the
+# tally is garbage collected or, least recently used first, when the arrays
+# are larger than _tally_array_cache_max_bytes. The re-entrant lock allows a
+# finalizer to run during garbage collection in a thread holding the lock, so
+# the size of the cache is kept as a running total instead of iterating over
+# entries that a finalizer can remove.
+_tally_array_cache = OrderedDict()
+_tally_array_cache_max_bytes = 2**30
+_tally_array_cache_nbytes = 0
+_tally_array_cache_lock = threading.RLock()
+
+# intensive quantities are integrated over volumes and extensive ones summed
+QUANTITY_TYPES = ("intensive", "extensive")
+
 
 def process_damage_energy_tally(
     tally,
@@ -18,6 +39,13 @@ def process_damage_energy_tally(
     energy_per_displacement: float = None,
     recombination_fraction: float = 0,
     material: float = None,
+    damage_model: str = None,
+    displacement_energy: float = None,
+    recoil_damage_energy=None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
+    density_std_dev: float = None,
+    energy_per_displacement_std_dev: float = None,
 ):
     """Processes a damage-energy tally converting the tally with default units
     obtained during simulation into the user specified units. Can be processed
@@ -38,7 +66,38 @@ def process_damage_energy_tally(
             along with the material to find number of atoms.
         energy_per_displacement: the energy required to displace an atom. The
             total damage-energy depositied is divided by this value to get
-            number of atoms displaced. Assumed units are eV
+            number of atoms displaced. Assumed units are eV. Can be an array
+            with one value per tally value.
+        recombination_fraction: the fraction of displaced atoms that
+            recombine. Applied to the tally result and the std. dev. Can be an
+            array with one value per tally value.
+        material: The openmc.Material used to find the number of atoms and
+            the displacement energy of the damage models. Can be a sequence
+            with one material per tally value, for example the material of
+            each voxel of a mesh tally.
+        damage_model: The damage model used to find the energy per
+            displacement, either "nrt" or "arc-dpa". Can't be used with the
+            energy_per_displacement argument.
+        displacement_energy: The threshold displacement energy in eV used by
+            the damage model. When not specified it is found from the
+            composition of the material. Can be an array with one value per
+            tally value.
+        recoil_damage_energy: The average damage energy per recoil in eV that
+            the arc-dpa efficiency is evaluated at. Can be an array with one
+            value per tally bin.
+        source_strength_std_dev: The std. dev. of the source_strength. It is
+            combined in quadrature with the tally std. dev. when the
+            source_strength is used in the conversion.
+        volume_std_dev: The std. dev. of the volume in cm3. It is combined in
+            quadrature with the tally std. dev. when the volume is used in the
+            conversion.
+        density_std_dev: The std. dev. of the material density in g/cm3. It
+            is combined in quadrature with the tally std. dev. when the number
+            of atoms is used in the conversion.
+        energy_per_displacement_std_dev: The std. dev. of the energy per
+            displacement in eV. It is combined in quadrature with the tally
+            std. dev. when the energy per displacement is used in the
+            conversion.
 
     Returns:
         The dpa tally result in the required units
@@ -47,71 +106,76 @@ def process_damage_energy_tally(
     if check_for_energy_function_filter(tally):
         raise ValueError("EnergyFunctionFilter found in a damage-energy tally")
 
-    # checks for user provided base units
-    base_units = get_score_units(tally)
+    # the surviving fraction of displacements is applied to every bin of the
+    # tally result and the std. dev.
+    damage_efficiency = 1.0
 
-    data_frame = tally.get_pandas_dataframe()
-
-    tally_result = np.array(data_frame["mean"])
-
-    if recombination_fraction:
-        if recombination_fraction < 0:
+    if np.any(np.asarray(recombination_fraction) != 0):
+        if np.any(np.asarray(recombination_fraction) < 0):
             raise ValueError(
                 f"recombination_fraction can't be smaller than 1. recombination_fraction is {recombination_fraction}"
             )
-        if recombination_fraction > 1:
+        if np.any(np.asarray(recombination_fraction) > 1):
             raise ValueError(
                 f"recombination_fraction can't be larger than 1. recombination_fraction is {recombination_fraction}"
             )
 
-        tally_result = tally_result * (1.0 - recombination_fraction)
+        damage_efficiency = 1.0 - np.asarray(recombination_fraction)
 
-    tally_result = tally_result * base_units
+    if damage_model is not None:
+        if energy_per_displacement is not None:
+            msg = (
+                "energy_per_displacement can't be specified when a damage_model "
+                "is used as the damage model finds the energy per displacement"
+            )
+            raise ValueError(msg)
+        energy_per_displacement, model_efficiency = find_damage_model_factors(
+            damage_model=damage_model,
+            material=material,
+            displacement_energy=displacement_energy,
+            recoil_damage_energy=recoil_damage_energy,
+        )
+        damage_efficiency = damage_efficiency * model_efficiency
 
-    if material:
-        atomic_mass_in_g = material.average_molar_mass * 1.66054e-24
-        density_in_g_per_cm3 = material.get_mass_density()
-        number_of_atoms_per_cm3 = density_in_g_per_cm3 / atomic_mass_in_g
-    else:
-        number_of_atoms_per_cm3 = None
+    # checks for user provided base units
+    base_units = get_score_units(tally)
 
-    if required_units is None:
-        tally_in_required_units = tally_result
-    else:
-        scaled_tally_result = scale_tally(
-            tally,
-            tally_result,
-            ureg[required_units],
-            source_strength,
-            volume,
-            number_of_atoms_per_cm3,
-            energy_per_displacement,
-        )
+    tally_mean, tally_std_dev = get_tally_mean_and_std_dev(tally)
 
-        tally_in_required_units = scaled_tally_result.to(required_units)
+    tally_mean = tally_mean * damage_efficiency
+    if tally_std_dev is not None:
+        tally_std_dev = tally_std_dev * damage_efficiency
 
-    if "std. dev." in get_data_frame_columns(data_frame):
-        tally_std_dev_base = np.array(data_frame["std. dev."]) * base_units
-        if required_units is None:
-            tally_std_dev_in_required_units = tally_std_dev_base
-        else:
-            scaled_tally_std_dev = scale_tally(
-                tally,
-                tally_std_dev_base,
-                ureg[required_units],
-                source_strength,
-                volume,
-                number_of_atoms_per_cm3,
-                energy_per_displacement,
-            )
-            tally_std_dev_in_required_units = scaled_tally_std_dev.to(required_units)
+    if material is not None:
+        number_of_atoms_per_cm3 = find_number_of_atoms_per_cm3(material)
+    else:
+        number_of_atoms_per_cm3 = None
 
-        # TODO add recombination_fraction scaling
-        # if recombination_fraction:
-        #     scaled_tally_std_dev = scaled_tally_std_dev * recombination_fraction
-        return tally_in_required_units, tally_std_dev_in_required_units
+    if material is not None and density_std_dev is not None:
+        # the number of atoms is proportional to the density of the material
+        atoms_std_dev = (
+            number_of_atoms_per_cm3
+            * density_std_dev
+            / map_materials(lambda item: item.get_mass_density(), material)
+        )
     else:
-        return tally_in_required_units
+        atoms_std_dev = None
+
+    return convert_tally_results(
+        tally,
+        tally_mean,
+        tally_std_dev,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+        number_of_atoms_per_cm3,
+        energy_per_displacement,
+        source_strength_std_dev=source_strength_std_dev,
+        volume_std_dev=volume_std_dev,
+        atoms_std_dev=atoms_std_dev,
+        energy_per_displacement_std_dev=energy_per_displacement_std_dev,
+    )
 
 
 def process_spectra_tally(
@@ -120,6 +184,9 @@ def process_spectra_tally(
     required_energy_units: str = "eV",
     source_strength: float = None,
     volume: float = None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
+    energy_group_edges: bool = False,
 ) -> tuple:
     """Processes a spectra tally converting the tally with default units
     obtained during simulation into the user specified units. Base units are
@@ -128,7 +195,8 @@ def process_spectra_tally(
     Args:
         tally: The openmc.Tally object which should be a spectra tally. With a
             score of flux or current and an EnergyFilter
-        required_units: A tuple of the units to convert the energy and tally
+        required_units: The units to convert the tally into
+        required_energy_units: The units to convert the energy group edges
             into
         source_strength: In some cases the source_strength will be required
             to convert the base units into the required units. This optional
@@ -138,9 +206,20 @@ def process_spectra_tally(
             volume is automatically found. This optional argument allows the
             user to specify the volume when needed or overwrite the
             automatically calculated volume.
+        source_strength_std_dev: The std. dev. of the source_strength. It is
+            combined in quadrature with the tally std. dev. when the
+            source_strength is used in the conversion.
+        volume_std_dev: The std. dev. of the volume in cm3. It is combined in
+            quadrature with the tally std. dev. when the volume is used in the
+            conversion.
+        energy_group_edges: When False the energy axis is the lower energy of
+            the group of each tally value, which repeats for every cell or
+            mesh bin. When True the energy axis is the group edges of the
+            EnergyFilter, which has one more value than the number of groups
+            and is cached.
 
     Returns:
-        Tuple of spectra energies and tally results
+        Tuple of spectra energy axis and tally results
     """
 
     if not check_for_energy_filter(tally):
@@ -149,52 +228,36 @@ def process_spectra_tally(
     if check_for_energy_function_filter(tally):
         raise ValueError("EnergyFunctionFilter was found in spectra tally")
 
-    data_frame = tally.get_pandas_dataframe()
-
     # checks for user provided base units
     base_units = get_score_units(tally)
 
-    # numpy array is needed as a pandas series can't have units
-
-    energy_base = np.array(data_frame["energy low [eV]"]) * ureg.electron_volt
-    energy_in_required_units = energy_base.to(required_energy_units)
-
-    tally_result = np.array(data_frame["mean"]) * base_units
-    if required_units is None:
-        tally_in_required_units = tally_result
-    else:
-        scaled_tally_result = scale_tally(
-            tally,
-            tally_result,
-            ureg[required_units],
-            source_strength,
-            volume,
+    # the energy axis is found from the EnergyFilter group edges instead of
+    # the energy column of the tally dataframe
+    energy_in_required_units = get_energy_group_edges(tally, required_energy_units)
+    if not energy_group_edges:
+        energy_in_required_units = get_energy_low_of_tally_values(
+            tally, energy_in_required_units
         )
-        tally_in_required_units = scaled_tally_result.to(required_units)
 
-    if "std. dev." in get_data_frame_columns(data_frame):
-        tally_std_dev_base = np.array(data_frame["std. dev."]) * base_units
-        if required_units is None:
-            tally_std_dev_in_required_units = tally_std_dev_base
-        else:
-            scaled_tally_std_dev = scale_tally(
-                tally,
-                tally_std_dev_base,
-                ureg[required_units],
-                source_strength,
-                volume,
-            )
-            tally_std_dev_in_required_units = scaled_tally_std_dev.to(required_units)
-
-        return (
-            energy_in_required_units,
-            tally_in_required_units,
-            tally_std_dev_in_required_units,
-        )
+    # the flat arrays avoid building the pandas dataframe
+    tally_mean, tally_std_dev = get_tally_mean_and_std_dev(tally)
+
+    results = convert_tally_results(
+        tally,
+        tally_mean,
+        tally_std_dev,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+        source_strength_std_dev=source_strength_std_dev,
+        volume_std_dev=volume_std_dev,
+    )
 
+    if isinstance(results, tuple):
+        return (energy_in_required_units,) + results
     else:
-
-        return energy_in_required_units, tally_in_required_units
+        return energy_in_required_units, results
 
 
 def process_dose_tally(
@@ -202,6 +265,8 @@ def process_dose_tally(
     required_units: str = None,
     source_strength: float = None,
     volume: float = None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
 ):
     """Processes a dose tally converting the tally with default units
     obtained during simulation into the user specified units. Base units are
@@ -219,6 +284,12 @@ def process_dose_tally(
             volume is automatically found. This optional argument allows the
             user to specify the volume when needed or overwrite the
             automatically calculated volume.
+        source_strength_std_dev: The std. dev. of the source_strength. It is
+            combined in quadrature with the tally std. dev. when the
+            source_strength is used in the conversion.
+        volume_std_dev: The std. dev. of the volume in cm3. It is combined in
+            quadrature with the tally std. dev. when the volume is used in the
+            conversion.
 
     Returns:
         The dose tally result in the required units
@@ -236,39 +307,19 @@ def process_dose_tally(
     # dose on a volume uses a flux score and the EnergyFunctionFilter with dose coefficients
     # dose on a volume has [pSv*cm^3/source_particle] units
 
-    data_frame = tally.get_pandas_dataframe()
-
-    tally_result = np.array(data_frame["mean"]) * base_units
-
-    if required_units is None:
-        tally_in_required_units = tally_result
-    else:
-        scaled_tally_result = scale_tally(
-            tally,
-            tally_result,
-            ureg[required_units],
-            source_strength,
-            volume,
-        )
-        tally_in_required_units = scaled_tally_result.to(required_units)
-
-    if "std. dev." in get_data_frame_columns(data_frame):
-        tally_std_dev_base = np.array(data_frame["std. dev."]) * base_units
-        if required_units is None:
-            tally_std_dev_in_required_units = tally_std_dev_base
-        else:
-            scaled_tally_std_dev = scale_tally(
-                tally,
-                tally_std_dev_base,
-                ureg[required_units],
-                source_strength,
-                volume,
-            )
-            tally_std_dev_in_required_units = scaled_tally_std_dev.to(required_units)
-
-        return tally_in_required_units, tally_std_dev_in_required_units
-    else:
-        return tally_in_required_units
+    tally_mean, tally_std_dev = get_tally_mean_and_std_dev(tally)
+
+    return convert_tally_results(
+        tally,
+        tally_mean,
+        tally_std_dev,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+        source_strength_std_dev=source_strength_std_dev,
+        volume_std_dev=volume_std_dev,
+    )
 
 
 def process_tally(
@@ -276,6 +327,8 @@ def process_tally(
     required_units: str = None,
     source_strength: float = None,
     volume: float = None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
 ):
     """Processes a tally converting the tally with default units obtained
      during simulation into the user specified units.
@@ -285,12 +338,20 @@ def process_tally(
         required_units: The units to convert the energy and tally into
         source_strength: In some cases the source_strength will be required
             to convert the base units into the required units. This optional
-            argument allows the user to specify the source_strength when needed
+            argument allows the user to specify the source_strength when needed.
+            An array of source strengths adds a leading axis to the result
+            with one entry per source strength.
         volume: In some cases the volume will be required to convert the base
             units into the required units. In the case of a regular mesh the
             volume is automatically found. This optional argument allows the
             user to specify the volume when needed or overwrite the
             automatically calculated volume.
+        source_strength_std_dev: The std. dev. of the source_strength. It is
+            combined in quadrature with the tally std. dev. when the
+            source_strength is used in the conversion.
+        volume_std_dev: The std. dev. of the volume in cm3. It is combined in
+            quadrature with the tally std. dev. when the volume is used in the
+            conversion.
 
     Returns:
         The dose tally result in the required units
@@ -308,43 +369,21 @@ def process_tally(
         )
         raise ValueError(msg)
 
-    data_frame = tally.get_pandas_dataframe()
-
     base_units = get_score_units(tally)
 
-    tally_result = np.array(data_frame["mean"]) * base_units
-
-    if required_units is None:
-        tally_in_required_units = tally_result
-    else:
-        scaled_tally_result = scale_tally(
-            tally,
-            tally_result,
-            ureg[required_units],
-            source_strength,
-            volume,
-        )
-        tally_in_required_units = scaled_tally_result.to(required_units)
-
-    if "std. dev." in get_data_frame_columns(data_frame):
-        tally_std_dev_base = np.array(data_frame["std. dev."]) * base_units
-        if required_units is None:
-            tally_std_dev_in_required_units = tally_std_dev_base
-        else:
-            scaled_tally_std_dev = scale_tally(
-                tally,
-                tally_std_dev_base,
-                ureg[required_units],
-                source_strength,
-                volume,
-            )
-            tally_std_dev_in_required_units = scaled_tally_std_dev.to(required_units)
-
-        return tally_in_required_units, tally_std_dev_in_required_units
-
-    else:
-
-        return tally_in_required_units
+    tally_mean, tally_std_dev = get_tally_mean_and_std_dev(tally)
+
+    return convert_tally_results(
+        tally,
+        tally_mean,
+        tally_std_dev,
+        base_units,
+        required_units,
+        source_strength,
+        volume,
+        source_strength_std_dev=source_strength_std_dev,
+        volume_std_dev=volume_std_dev,
+    )
 
 
 def scale_tally(
@@ -357,62 +396,113 @@ def scale_tally(
     energy_per_displacement: float = None,
 ):
 
-    # energy_per_displacement
-    time_diff = check_for_dimentionality_difference(
-        tally_result.units, required_units, "[time]"
+    source_strength = reshape_source_strength(
+        source_strength, np.ndim(tally_result.magnitude)
     )
-    length_diff = check_for_dimentionality_difference(
-        tally_result.units, required_units, "[length]"
-    )
-    mass_diff = check_for_dimentionality_difference(
-        tally_result.units, required_units, "[mass]"
-    )
-    displacement_diff = check_for_dimentionality_difference(
-        tally_result.units, required_units, "[displacements]"
+
+    scaling_factors = find_scaling_factors(
+        tally,
+        tally_result.units,
+        required_units,
+        source_strength,
+        volume,
+        atoms,
+        energy_per_displacement,
     )
 
-    if (
-        time_diff == -2
-        and mass_diff == 1
-        and length_diff == 2
-        and displacement_diff == -1
-    ):
+    for scaling_factor in scaling_factors.values():
+        tally_result = tally_result * scaling_factor
 
-        if energy_per_displacement:
-            energy_per_displacement = (
-                energy_per_displacement * ureg.electron_volt / ureg["displacements"]
-            )
-            tally_result = tally_result / energy_per_displacement
-        else:
-            raise ValueError(
-                f"energy_per_displacement is required but currently set to {energy_per_displacement}"
-            )
+    return tally_result
+
+
+def reshape_source_strength(source_strength, ndim: int):
+    """Adds trailing axes to an array of source strengths so that a sweep of
+    source strengths adds leading axes to a tally result with ndim axes."""
+
+    if source_strength is not None and np.ndim(source_strength) > 0:
+        source_strength = np.asarray(source_strength, dtype=float)
+        source_strength = source_strength.reshape(source_strength.shape + (1,) * ndim)
+    return source_strength
+
+
+def find_scaling_factors(
+    tally,
+    units,
+    required_units,
+    source_strength: float,
+    volume: float,
+    atoms: float = None,
+    energy_per_displacement: float = None,
+) -> dict:
+    """Finds the factors that scale a tally from its units into the
+    dimensionality of the required units. The factors only depend on the units
+    so they are found once and applied to the tally mean and std. dev.
+
+    Args:
+        tally: The openmc.Tally object, used to find the volume of mesh voxels
+        units: The units of the tally result
+        required_units: The units to scale the tally into
+        source_strength: The source strength in particles per second or per
+            pulse. An array with trailing axes (see reshape_source_strength)
+            can be used for a sweep of source strengths.
+        volume: The volume in cm3. When needed and not specified the volume
+            is found from the mesh.
+        atoms: The number of atoms. Can be an array with one value per tally
+            value.
+        energy_per_displacement: The energy required to displace an atom in
+            eV. Can be an array with one value per tally value.
+
+    Returns:
+        Dictionary with the name of the input each factor comes from as keys
+        and the scaling factors as values
+    """
+
+    scaling_factors = {}
+    tally_result = 1.0 * units
 
-    # per_displacement
+    # energy_per_displacement
     displacement_diff = check_for_dimentionality_difference(
         tally_result.units, required_units, "[displacements]"
     )
     if displacement_diff == -1:
-        if energy_per_displacement:
+        if energy_per_displacement is not None:
             energy_per_displacement = (
-                energy_per_displacement * ureg.electron_volt / ureg["displacements"]
+                np.asarray(energy_per_displacement, dtype=float)
+                * ureg.electron_volt
+                / ureg["displacements"]
             )
+            scaling_factors["energy_per_displacement"] = 1 / energy_per_displacement
             tally_result = tally_result / energy_per_displacement
         else:
             raise ValueError(
                 f"energy_per_displacement is required but currently set to {energy_per_displacement}"
             )
 
+    if source_strength is not None and np.ndim(source_strength) > 0:
+        source_strength_specified = True
+    else:
+        source_strength_specified = bool(source_strength)
+
     time_diff = check_for_dimentionality_difference(
         tally_result.units, required_units, "[time]"
     )
     if time_diff != 0:
-        if source_strength:
+        if source_strength_specified:
             source_strength = source_strength * ureg["1 / second"]
             if time_diff == -1:
-                tally_result = tally_result / source_strength
-            if time_diff == 1:
-                tally_result = tally_result * source_strength
+                scaling_factors["source_strength"] = 1 / source_strength
+            elif time_diff == 1:
+                scaling_factors["source_strength"] = source_strength
+            else:
+                msg = (
+                    f"A time dimensionality difference of {time_diff} was "
+                    f"detected between {tally_result.units} and "
+                    f"{ureg.Quantity(required_units).units}. Only a "
+                    "difference of 1 or -1 can be scaled with the source_strength"
+                )
+                raise ValueError(msg)
+            tally_result = tally_result * scaling_factors["source_strength"]
         else:
             raise ValueError(
                 f"source_strength is required but currently set to {source_strength}"
@@ -422,12 +512,21 @@ def scale_tally(
         tally_result.units, required_units, "[pulse]"
     )
     if time_diff != 0:
-        if source_strength:
+        if source_strength_specified:
             source_strength = source_strength * ureg["1 / pulse"]
             if time_diff == -1:
-                tally_result = tally_result / source_strength
+                scaling_factors["source_strength"] = 1 / source_strength
             elif time_diff == 1:
-                tally_result = tally_result * source_strength
+                scaling_factors["source_strength"] = source_strength
+            else:
+                msg = (
+                    f"A pulse dimensionality difference of {time_diff} was "
+                    f"detected between {tally_result.units} and "
+                    f"{ureg.Quantity(required_units).units}. Only a "
+                    "difference of 1 or -1 can be scaled with the source_strength"
+                )
+                raise ValueError(msg)
+            tally_result = tally_result * scaling_factors["source_strength"]
         else:
             raise ValueError(
                 f"source_strength is required but currently set to {source_strength}"
@@ -437,13 +536,16 @@ def scale_tally(
         tally_result.units, required_units, "[length]"
     )
     if length_diff != 0:
-        if volume:
-            volume_with_units = volume * ureg["centimeter ** 3"]
+        if volume is not None:
+            volume_with_units = (
+                np.asarray(volume, dtype=float) * ureg["centimeter ** 3"]
+            )
         else:
             # volume required but not provided so it is found from the mesh
             volume_from_mesh = compute_volume_of_voxels(tally)
 
-            if volume_from_mesh:
+            if volume_from_mesh is not False:
+                volume_from_mesh = expand_voxel_volumes(tally, volume_from_mesh)
                 volume_with_units = volume_from_mesh * ureg["centimeter ** 3"]
             else:
                 msg = (
@@ -455,21 +557,23 @@ def scale_tally(
                 raise ValueError(msg)
 
         if length_diff == 3:
-            tally_result = tally_result / volume_with_units
+            scaling_factors["volume"] = 1 / volume_with_units
         elif length_diff == -3:
-            tally_result = tally_result * volume_with_units
+            scaling_factors["volume"] = volume_with_units
+        if "volume" in scaling_factors:
+            tally_result = tally_result * scaling_factors["volume"]
 
     atom_diff = check_for_dimentionality_difference(
         tally_result.units, required_units, "[atom]"
     )
     if atom_diff != 0:
-        if atoms:
-            atoms = atoms * ureg["atom"]
+        if atoms is not None:
+            atoms = np.asarray(atoms, dtype=float) * ureg["atom"]
 
             if atom_diff == 1:
-                tally_result = tally_result / atoms
+                scaling_factors["atoms"] = 1 / atoms
             elif atom_diff == -1:
-                tally_result = tally_result * atoms
+                scaling_factors["atoms"] = atoms
 
         else:
             msg = (
@@ -478,16 +582,159 @@ def scale_tally(
                 "inputs"
             )
             raise ValueError(msg)
-    return tally_result
+
+    return scaling_factors
+
+
+def convert_tally_results(
+    tally,
+    tally_mean,
+    tally_std_dev,
+    base_units,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    atoms: float = None,
+    energy_per_displacement: float = None,
+    source_strength_std_dev: float = None,
+    volume_std_dev: float = None,
+    atoms_std_dev: float = None,
+    energy_per_displacement_std_dev: float = None,
+    filter_bins=None,
+):
+    """Converts the tally mean and std. dev. into the required units in a
+    single pass. The scaling factors are found once from the units and
+    applied to both arrays. The relative uncertainties of the inputs that are
+    used by the scaling factors are combined in quadrature with the tally
+    std. dev.
+
+    Args:
+        tally: The openmc.Tally object the results come from
+        tally_mean: Array of tally means in the base units
+        tally_std_dev: Array of tally standard deviations in the base units,
+            or None when the tally has no std. dev.
+        base_units: The units of the tally mean and std. dev.
+        required_units: The units to convert the tally into
+        source_strength: The source strength in particles per second or per
+            pulse
+        volume: The volume in cm3
+        atoms: The number of atoms
+        energy_per_displacement: The energy required to displace an atom in eV
+        source_strength_std_dev: The std. dev. of the source strength
+        volume_std_dev: The std. dev. of the volume in cm3
+        atoms_std_dev: The std. dev. of the number of atoms
+        energy_per_displacement_std_dev: The std. dev. of the energy per
+            displacement in eV
+        filter_bins: The number of bins of each filter in the layout of the
+            tally mean when it differs from the tally filters. Used to find
+            the volume of each value of Rectilinear and Cylindrical mesh
+            tallies, see expand_voxel_volumes.
+
+    Returns:
+        The tally mean in the required units and the std. dev. in the
+        required units if the tally or inputs have a std. dev.
+    """
+
+    tally_mean = np.asarray(tally_mean)
+
+    if (
+        volume is None
+        and required_units is not None
+        and tally.contains_filter(openmc.MeshFilter)
+    ):
+        voxel_volumes = compute_volume_of_voxels(tally)
+        if np.ndim(voxel_volumes) > 0:
+            # the voxels of Rectilinear and Cylindrical meshes have different
+            # volumes, which are broadcast to the layout of the tally mean
+            volume = expand_voxel_volumes(
+                tally, voxel_volumes, tally_mean.shape, filter_bins
+            )
+
+    scaling_factors = {}
+    scale = 1.0 * base_units
+    if required_units is not None:
+        source_strength = reshape_source_strength(source_strength, tally_mean.ndim)
+        scaling_factors = find_scaling_factors(
+            tally,
+            base_units,
+            ureg[required_units],
+            source_strength,
+            volume,
+            atoms,
+            energy_per_displacement,
+        )
+        for scaling_factor in scaling_factors.values():
+            scale = scale * scaling_factor
+
+    # the scaling factors are applied before the unit conversion factor
+    # matching the order of operations of scale_tally followed by .to()
+    if required_units is None:
+        units = scale.units
+        unit_conversion = 1.0
+    else:
+        units = ureg[required_units].units
+        unit_conversion = ureg.Quantity(1.0, scale.units).to(units).magnitude
+
+    def convert(values):
+        values = np.asarray(values) * scale.magnitude
+        if unit_conversion != 1.0:
+            values = values * unit_conversion
+        return ureg.Quantity(values, units)
+
+    tally_in_required_units = convert(tally_mean)
+
+    # relative uncertainties of the inputs used by the conversion
+    if "volume" in scaling_factors and volume_std_dev is not None and volume is None:
+        volume = compute_volume_of_voxels(tally)
+    input_std_devs = {
+        "source_strength": (source_strength, source_strength_std_dev),
+        "volume": (volume, volume_std_dev),
+        "atoms": (atoms, atoms_std_dev),
+        "energy_per_displacement": (
+            energy_per_displacement,
+            energy_per_displacement_std_dev,
+        ),
+    }
+    relative_variance = 0.0
+    for name, (value, std_dev) in input_std_devs.items():
+        if name in scaling_factors and std_dev is not None:
+            relative_variance = relative_variance + (std_dev / np.asarray(value)) ** 2
+
+    if tally_std_dev is None and np.all(relative_variance == 0):
+        return tally_in_required_units
+
+    if tally_std_dev is None:
+        variance = 0.0
+    else:
+        variance = np.abs(convert(tally_std_dev).magnitude) ** 2
+    variance = variance + tally_in_required_units.magnitude**2 * relative_variance
+
+    tally_std_dev_in_required_units = ureg.Quantity(np.sqrt(variance), units)
+
+    return tally_in_required_units, tally_std_dev_in_required_units
 
 
 def compute_volume_of_voxels(tally):
-    """Finds the volume of the rectangular voxels that make up a Regular mesh
-    tally."""
+    """Finds the volume of the voxels that make up a mesh tally. The voxels of
+    a Regular mesh all have the same volume, which is returned as a single
+    value. The voxel volumes of Rectilinear and Cylindrical meshes are
+    returned as an array with the volume of each voxel, which
+    expand_voxel_volumes broadcasts to the tally values. The volumes are
+    cached for each tally."""
+
+    return _get_cached_tally_arrays(
+        tally, "voxel_volumes", lambda: _compute_volume_of_voxels(tally)
+    )
+
+
+def _compute_volume_of_voxels(tally):
     if tally.contains_filter(openmc.MeshFilter):
         tally_filter = tally.find_filter(filter_type=openmc.MeshFilter)
 
         mesh = tally_filter.mesh
+        if isinstance(mesh, (openmc.RectilinearMesh, openmc.CylindricalMesh)):
+            return find_volumes_of_mesh_voxels(mesh)
+
         x = abs(mesh.lower_left[0] - mesh.upper_right[0]) / mesh.dimension[0]
         y = abs(mesh.lower_left[1] - mesh.upper_right[1]) / mesh.dimension[1]
         z = abs(mesh.lower_left[2] - mesh.upper_right[2]) / mesh.dimension[2]
@@ -498,32 +745,197 @@ def compute_volume_of_voxels(tally):
         return False
 
 
-def find_fusion_energy_per_reaction(reactants: str) -> float:
+def _find_mesh_filter_axis(tally) -> int:
+    for axis, tally_filter in enumerate(tally.filters):
+        if isinstance(tally_filter, openmc.MeshFilter):
+            return axis
+    raise ValueError(f"MeshFilter was not found in tally {tally.id}")
+
+
+def expand_voxel_volumes(tally, voxel_volumes, shape=None, filter_bins=None):
+    """Broadcasts the volume of each voxel of a mesh tally to the tally values
+    along the mesh filter axis.
+
+    Args:
+        tally: The openmc.Tally object which contains a MeshFilter
+        voxel_volumes: The volume of each voxel from compute_volume_of_voxels.
+            A single volume is returned unchanged.
+        shape: The shape of the tally values. Defaults to the flat tally
+            values.
+        filter_bins: The number of bins of each filter in the layout of the
+            tally values. Defaults to the bins of the tally filters and
+            differs from them when an axis has been rebinned or collapsed, for
+            example the energy axis of spectra folded with dose coefficients.
+
+    Returns:
+        The volume of each tally value with the shape of the tally values
+    """
+
+    if np.ndim(voxel_volumes) == 0:
+        return voxel_volumes
+
+    if filter_bins is None:
+        filter_bins = [tally_filter.num_bins for tally_filter in tally.filters]
+    number_of_bins = int(np.prod(filter_bins))
+    if shape is None:
+        shape = (number_of_bins * len(tally.nuclides) * len(tally.scores),)
+
+    mesh_axis = _find_mesh_filter_axis(tally)
+    # the values of each filter bin vary fastest, for example the nuclides
+    # and scores
+    voxel_shape = [1] * (len(filter_bins) + 1)
+    voxel_shape[mesh_axis] = filter_bins[mesh_axis]
+    values_shape = list(filter_bins) + [int(np.prod(shape)) // number_of_bins]
+
+    return np.broadcast_to(
+        np.reshape(voxel_volumes, voxel_shape), values_shape
+    ).reshape(shape)
+
+
+def get_voxel_index_of_tally_values(tally, start: int = 0, stop: int = None):
+    """Finds the index of the mesh voxel of each tally value in the flat tally
+    order, for a range of values such as a chunk of a streamed tally.
+
+    Args:
+        tally: The openmc.Tally object which contains a MeshFilter
+        start: The index of the first tally value
+        stop: The index after the last tally value. Defaults to the number of
+            tally values.
+
+    Returns:
+        The voxel index of each tally value in the range
+    """
+
+    filter_bins = [tally_filter.num_bins for tally_filter in tally.filters]
+    mesh_axis = _find_mesh_filter_axis(tally)
+
+    # the filters after the mesh filter, the nuclides and the scores vary
+    # faster than the voxels
+    repeats = int(np.prod(filter_bins[mesh_axis + 1 :])) * len(tally.nuclides)
+    repeats *= len(tally.scores)
+    if stop is None:
+        stop = int(np.prod(filter_bins)) * len(tally.nuclides) * len(tally.scores)
+
+    return (np.arange(start, stop) // repeats) % filter_bins[mesh_axis]
+
+
+def find_volumes_of_mesh_voxels(mesh) -> np.ndarray:
+    """Finds the volume of each voxel of a Rectilinear or Cylindrical mesh in
+    cm3. The first mesh index varies fastest, as in the tally results."""
+
+    if isinstance(mesh, openmc.RectilinearMesh):
+        grids = (mesh.x_grid, mesh.y_grid, mesh.z_grid)
+        widths = [np.diff(np.asarray(grid, dtype=float)) for grid in grids]
+    elif isinstance(mesh, openmc.CylindricalMesh):
+        widths = [
+            0.5 * np.diff(np.asarray(mesh.r_grid, dtype=float) ** 2),
+            np.diff(np.asarray(mesh.phi_grid, dtype=float)),
+            np.diff(np.asarray(mesh.z_grid, dtype=float)),
+        ]
+    else:
+        raise ValueError(f"voxel volumes can't be found for a {type(mesh).__name__}")
+
+    return np.multiply.outer(np.multiply.outer(widths[2], widths[1]), widths[0]).ravel()
+
+
+def find_integral_weights(units, quantity: str, voxel_volumes=None) -> tuple:
+    """Finds the weights that integrate converted tally values over the
+    voxels of a mesh. Intensive quantities, such as a flux, dose rate, DPA or
+    heating per volume, are multiplied by the voxel volumes. Extensive
+    quantities, such as the heating deposited in each voxel, are summed.
+
+    Args:
+        units: The units of the converted tally values
+        quantity: "intensive" or "extensive"
+        voxel_volumes: The volume in cm3 of every voxel or of each voxel, for
+            example from compute_volume_of_voxels. Required for intensive
+            quantities.
+
+    Returns:
+        Tuple of the weight of every voxel or of each voxel and the units of
+        the integral
+    """
+
+    if quantity not in QUANTITY_TYPES:
+        msg = (
+            f"quantity must be one of {QUANTITY_TYPES} not {quantity}. Intensive "
+            "quantities are integrated over the voxel volumes and extensive "
+            "quantities are summed"
+        )
+        raise ValueError(msg)
+
+    if quantity == "extensive":
+        return 1.0, ureg.Quantity(1.0, units).units
+
+    if voxel_volumes is None or voxel_volumes is False:
+        msg = "The volume of the voxels is required to integrate intensive quantities"
+        raise ValueError(msg)
+
+    integral_conversion = (
+        ureg.Quantity(1.0, units) * ureg.Quantity(1.0, "centimeter ** 3")
+    ).to_reduced_units()
+    weights = np.asarray(voxel_volumes, dtype=float) * integral_conversion.magnitude
+    return weights, integral_conversion.units
+
+
+def find_number_of_atoms_per_cm3(material) -> float:
+    """Finds the number of atoms per cubic centimeter of an openmc.Material
+    from the mass density and average molar mass of the material. A sequence
+    of materials gives an array with the number of atoms of each material."""
+
+    if isinstance(material, (list, tuple, np.ndarray)):
+        return map_materials(find_number_of_atoms_per_cm3, material)
+
+    atomic_mass_in_g = material.average_molar_mass * 1.66054e-24
+    density_in_g_per_cm3 = material.get_mass_density()
+    return density_in_g_per_cm3 / atomic_mass_in_g
+
+
+def find_fusion_energy_per_reaction(reactants) -> float:
     """Finds the average fusion energy produced per fusion reaction in joules
     from the fuel type.
     Args:
         reactants: the isotopes that are combined in the fusion even. Options
-            are "DD" or "DT"
+            are "DD" or "DT" or the fraction of fusion reactions that are DT
+            with the remaining reactions being DD. An array of fractions can
+            be used to find the energy for many fuel mixtures at once.
     Returns:
         The average energy of a fusion reaction in Joules
     """
 
-    if reactants == "DT":
-        fusion_energy_of_neutron_ev = 14.06 * 1e6
-        fusion_energy_of_alpha_ev = 3.52 * 1e6
+    fusion_energy_of_neutron_ev = 14.06 * 1e6
+    fusion_energy_of_alpha_ev = 3.52 * 1e6
+    dt_fusion_energy_per_reaction_ev = (
+        fusion_energy_of_neutron_ev + fusion_energy_of_alpha_ev
+    )
+
+    fusion_energy_of_trition_ev = 1.01 * 1e6
+    fusion_energy_of_proton_ev = 3.02 * 1e6
+    fusion_energy_of_he3_ev = 0.82 * 1e6
+    fusion_energy_of_neutron_ev = 2.45 * 1e6
+    dd_fusion_energy_per_reaction_ev = (
+        0.5 * (fusion_energy_of_trition_ev + fusion_energy_of_proton_ev)
+    ) + (0.5 * (fusion_energy_of_he3_ev + fusion_energy_of_neutron_ev))
+
+    if isinstance(reactants, str):
+        if reactants == "DT":
+            fusion_energy_per_reaction_ev = dt_fusion_energy_per_reaction_ev
+        elif reactants == "DD":
+            fusion_energy_per_reaction_ev = dd_fusion_energy_per_reaction_ev
+        else:
+            raise ValueError("Only fuel types of DD and DT are currently supported")
+    else:
+        dt_fraction = np.asarray(reactants, dtype=float)
+        if np.any(dt_fraction < 0) or np.any(dt_fraction > 1):
+            msg = (
+                "The fraction of DT reactions must be between 0 and 1. "
+                f"reactants is {reactants}"
+            )
+            raise ValueError(msg)
         fusion_energy_per_reaction_ev = (
-            fusion_energy_of_neutron_ev + fusion_energy_of_alpha_ev
+            dt_fraction * dt_fusion_energy_per_reaction_ev
+            + (1.0 - dt_fraction) * dd_fusion_energy_per_reaction_ev
         )
-    elif reactants == "DD":
-        fusion_energy_of_trition_ev = 1.01 * 1e6
-        fusion_energy_of_proton_ev = 3.02 * 1e6
-        fusion_energy_of_he3_ev = 0.82 * 1e6
-        fusion_energy_of_neutron_ev = 2.45 * 1e6
-        fusion_energy_per_reaction_ev = (
-            0.5 * (fusion_energy_of_trition_ev + fusion_energy_of_proton_ev)
-        ) + (0.5 * (fusion_energy_of_he3_ev + fusion_energy_of_neutron_ev))
-    else:
-        raise ValueError("Only fuel types of DD and DT are currently supported")
 
     fusion_energy_per_reaction_j = fusion_energy_per_reaction_ev * 1.602176487e-19
 
@@ -533,8 +945,24 @@ def find_fusion_energy_per_reaction(reactants: str) -> float:
 def find_source_strength(
     fusion_energy_per_second_or_per_pulse=None, reactants="DT"
 ) -> float:
+    """Finds the source strength from the fusion energy released per second
+    or per pulse.
+    Args:
+        fusion_energy_per_second_or_per_pulse: the fusion power in Watts or
+            fusion energy per pulse in Joules. An array of values can be used
+            to find the source strength for a sweep of fusion powers.
+        reactants: the fuel type, "DD" or "DT", or the fraction of fusion
+            reactions that are DT. Arrays of fractions are broadcast against
+            the fusion energies.
+    Returns:
+        The source strength in particles per second or per pulse
+    """
 
     fusion_energy_per_reaction_j = find_fusion_energy_per_reaction(reactants)
+    if not np.isscalar(fusion_energy_per_second_or_per_pulse):
+        fusion_energy_per_second_or_per_pulse = np.asarray(
+            fusion_energy_per_second_or_per_pulse, dtype=float
+        )
     number_of_neutrons = (
         fusion_energy_per_second_or_per_pulse / fusion_energy_per_reaction_j
     )
@@ -571,6 +999,71 @@ def check_for_energy_filter(tally):
     return False
 
 
+@lru_cache(maxsize=64)
+def _cached_energy_group_edges(filter_id: int, energy_units: str, edges: bytes):
+    energy_base = np.frombuffer(edges) * ureg.electron_volt
+    energy_in_required_units = energy_base.to(energy_units)
+    energy_in_required_units.magnitude.setflags(write=False)
+    return energy_in_required_units
+
+
+def get_energy_group_edges(tally, required_energy_units: str = "eV"):
+    """Finds the energy group edges of the EnergyFilter of a tally in the
+    required energy units. The converted edges are cached for each energy
+    filter and energy unit so repeated calls do not convert the energies
+    again.
+
+    Args:
+        tally: The openmc.Tally object which contains an EnergyFilter
+        required_energy_units: The units to convert the energy group edges
+            into
+
+    Returns:
+        The energy group edges as a read only pint Quantity
+    """
+
+    for filter in tally.filters:
+        if isinstance(filter, openmc.filter.EnergyFilter):
+            edges = np.ascontiguousarray(filter.values, dtype=float)
+            # the edges are part of the key as filter ids are reused between
+            # statepoint files
+            return _cached_energy_group_edges(
+                filter.id, required_energy_units, edges.tobytes()
+            )
+    raise ValueError("EnergyFilter was not found in spectra tally")
+
+
+def get_energy_low_of_tally_values(tally, energy_group_edges):
+    """Finds the lower energy of the group of each value of a tally, in the
+    same order as the flat tally values. This is the energy low column of the
+    tally dataframe.
+
+    Args:
+        tally: The openmc.Tally object which contains an EnergyFilter
+        energy_group_edges: The energy group edges from get_energy_group_edges
+
+    Returns:
+        The lower energy of each tally value in the units of the edges
+    """
+
+    filter_bins = [tally_filter.num_bins for tally_filter in tally.filters]
+    for axis, tally_filter in enumerate(tally.filters):
+        if isinstance(tally_filter, openmc.filter.EnergyFilter):
+            break
+    else:
+        raise ValueError("EnergyFilter was not found in spectra tally")
+
+    shape = [1] * len(filter_bins)
+    shape[axis] = filter_bins[axis]
+    energy_low = np.broadcast_to(
+        np.asarray(energy_group_edges.magnitude)[:-1].reshape(shape), filter_bins
+    ).ravel()
+    # each filter bin has a value for each nuclide and score
+    energy_low = np.repeat(energy_low, np.size(tally.mean) // energy_low.size)
+
+    return energy_low * energy_group_edges.units
+
+
 def check_for_energy_function_filter(tally):
     # check for EnergyFunctionFilter which modify the units of the tally
     for filter in tally.filters:
@@ -628,3 +1121,128 @@ def get_data_frame_columns(data_frame):
     else:
         data_frame_columns = data_frame.columns.to_list()
     return data_frame_columns
+
+
+def _find_number_of_bytes(arrays) -> int:
+    if isinstance(arrays, tuple):
+        return sum(_find_number_of_bytes(array) for array in arrays)
+    return getattr(arrays, "nbytes", 0)
+
+
+def _remove_tally_arrays(key: int):
+    global _tally_array_cache_nbytes
+    with _tally_array_cache_lock:
+        entry = _tally_array_cache.pop(key, None)
+        if entry is not None:
+            _tally_array_cache_nbytes -= entry["nbytes"]
+
+
+def _remove_least_recently_used_tally_arrays():
+    global _tally_array_cache_nbytes
+    while _tally_array_cache and (
+        _tally_array_cache_nbytes > _tally_array_cache_max_bytes
+    ):
+        _, entry = _tally_array_cache.popitem(last=False)
+        _tally_array_cache_nbytes -= entry["nbytes"]
+        entry["finalizer"].detach()
+
+
+def _get_cached_tally_arrays(tally, name: str, find_arrays):
+    """Gets arrays extracted from a tally, calling find_arrays the first time
+    and returning the cached arrays afterwards. The cached arrays are made
+    read only. The entry of a tally is replaced when the tally mean or
+    number of realizations change. The cache can be used from several
+    threads, and find_arrays runs outside the lock so extracting the arrays
+    of one tally does not block other tallies."""
+
+    global _tally_array_cache_nbytes
+    key = id(tally)
+    signature = (id(tally.mean), tally.num_realizations)
+
+    with _tally_array_cache_lock:
+        entry = _tally_array_cache.get(key)
+        if entry is None or entry["signature"] != signature:
+            if entry is not None:
+                entry["finalizer"].detach()
+                _remove_tally_arrays(key)
+            try:
+                finalizer = weakref.finalize(tally, _remove_tally_arrays, key)
+            except TypeError:
+                # objects that can't be weakly referenced are not cached
+                return find_arrays()
+            entry = {
+                "signature": signature,
+                "finalizer": finalizer,
+                "arrays": {},
+                "nbytes": 0,
+            }
+            _tally_array_cache[key] = entry
+        _tally_array_cache.move_to_end(key)
+        if name in entry["arrays"]:
+            return entry["arrays"][name]
+
+    arrays = find_arrays()
+    for array in arrays if isinstance(arrays, tuple) else (arrays,):
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+
+    with _tally_array_cache_lock:
+        # another thread may have cached the arrays or replaced the entry
+        if _tally_array_cache.get(key) is entry and name not in entry["arrays"]:
+            entry["arrays"][name] = arrays
+            number_of_bytes = _find_number_of_bytes(arrays)
+            entry["nbytes"] += number_of_bytes
+            _tally_array_cache_nbytes += number_of_bytes
+            _remove_least_recently_used_tally_arrays()
+
+    return arrays
+
+
+def set_tally_array_cache_size(max_bytes: int):
+    """Sets the maximum size of the arrays extracted from tallies that are
+    kept in memory between process calls. The least recently used tallies
+    are removed from the cache first.
+
+    Args:
+        max_bytes: The maximum size of the cached arrays in bytes. 0 disables
+            the cache.
+    """
+
+    global _tally_array_cache_max_bytes
+    with _tally_array_cache_lock:
+        _tally_array_cache_max_bytes = max_bytes
+        _remove_least_recently_used_tally_arrays()
+
+
+def clear_tally_array_cache():
+    """Removes the arrays extracted from all tallies from the cache"""
+
+    global _tally_array_cache_nbytes
+    with _tally_array_cache_lock:
+        while _tally_array_cache:
+            _, entry = _tally_array_cache.popitem()
+            _tally_array_cache_nbytes -= entry["nbytes"]
+            entry["finalizer"].detach()
+
+
+def get_tally_mean_and_std_dev(tally) -> Tuple[np.ndarray, np.ndarray]:
+    """Gets the flat mean and standard deviation arrays of a tally in the same
+    bin order as the tally pandas dataframe without building the dataframe.
+    The standard deviation is None when the tally has a single realization.
+    The arrays are cached for each tally so repeated conversions of the same
+    tally reuse them, and are read only."""
+
+    return _get_cached_tally_arrays(
+        tally, "mean_and_std_dev", lambda: _get_tally_mean_and_std_dev(tally)
+    )
+
+
+def _get_tally_mean_and_std_dev(tally):
+    tally_mean = np.asarray(tally.mean).ravel()
+
+    if tally.num_realizations > 1:
+        tally_std_dev = np.asarray(tally.std_dev).ravel()
+    else:
+        tally_std_dev = None
+
+    return tally_mean, tally_std_dev
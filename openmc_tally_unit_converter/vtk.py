@@ -0,0 +1,207 @@
+from contextlib import closing
+
+import numpy as np
+import openmc
+
+from .streaming import DEFAULT_CHUNK_SIZE, iter_converted_chunks
+
+# the size in bytes of the UInt64 header before each appended array
+HEADER_SIZE = 8
+
+VTK_FILE_TYPES = {
+    "RegularMesh": ("ImageData", ".vti"),
+    "RectilinearMesh": ("RectilinearGrid", ".vtr"),
+    "CylindricalMesh": ("StructuredGrid", ".vts"),
+}
+
+
+def _find_mesh_extent(mesh) -> str:
+    dimension = tuple(mesh.dimension)
+    if len(dimension) != 3:
+        raise ValueError(f"Only 3D meshes can be written not {dimension}")
+    return " ".join(f"0 {number}" for number in dimension)
+
+
+def _iter_cylindrical_mesh_points(mesh):
+    """Iterates over the points of a CylindricalMesh one z plane at a time,
+    with the r index varying fastest and then the phi index"""
+
+    origin = getattr(mesh, "origin", (0.0, 0.0, 0.0))
+    phi, r = np.meshgrid(mesh.phi_grid, mesh.r_grid, indexing="ij")
+    x = (r * np.cos(phi)).ravel() + origin[0]
+    y = (r * np.sin(phi)).ravel() + origin[1]
+    for z in mesh.z_grid:
+        yield np.column_stack([x, y, np.full(x.size, z + origin[2])])
+
+
+def _find_geometry_arrays(mesh) -> list:
+    """Finds the names and sizes of the appended geometry arrays along with a
+    function that writes them"""
+
+    if isinstance(mesh, openmc.RectilinearMesh):
+        return [
+            (name, len(grid), lambda vtk_file, grid=grid: _write_array(vtk_file, grid))
+            for name, grid in zip("xyz", (mesh.x_grid, mesh.y_grid, mesh.z_grid))
+        ]
+
+    if isinstance(mesh, openmc.CylindricalMesh):
+        number_of_points = len(mesh.r_grid) * len(mesh.phi_grid) * len(mesh.z_grid)
+
+        def write_points(vtk_file):
+            for points in _iter_cylindrical_mesh_points(mesh):
+                _write_array(vtk_file, points)
+
+        return [("points", 3 * number_of_points, write_points)]
+
+    return []
+
+
+def _write_array(vtk_file, values):
+    vtk_file.write(np.ascontiguousarray(values, dtype="<f8").tobytes())
+
+
+def _write_header(vtk_file, mesh, data_arrays: list, geometry_arrays: list):
+    """Writes the XML header with the offsets of the appended arrays"""
+
+    vtk_type, _ = VTK_FILE_TYPES[type(mesh).__name__]
+    extent = _find_mesh_extent(mesh)
+
+    offsets = {}
+    offset = 0
+    for name, number_of_values, _ in data_arrays + geometry_arrays:
+        offsets[name] = offset
+        offset += HEADER_SIZE + 8 * number_of_values
+
+    if isinstance(mesh, openmc.RegularMesh):
+        lower_left = np.asarray(mesh.lower_left, dtype=float)
+        spacing = (np.asarray(mesh.upper_right) - lower_left) / mesh.dimension
+        grid_attributes = (
+            f' Origin="{" ".join(map(str, lower_left))}"'
+            f' Spacing="{" ".join(map(str, spacing))}"'
+        )
+    else:
+        grid_attributes = ""
+
+    lines = [
+        '<?xml version="1.0"?>',
+        f'<VTKFile type="{vtk_type}" version="1.0" byte_order="LittleEndian" '
+        'header_type="UInt64">',
+        f'  <{vtk_type} WholeExtent="{extent}"{grid_attributes}>',
+        f'    <Piece Extent="{extent}">',
+        f'      <CellData Scalars="{data_arrays[0][0]}">',
+    ]
+    for name, _, _ in data_arrays:
+        lines.append(
+            f'        <DataArray type="Float64" Name="{name}" format="appended" '
+            f'offset="{offsets[name]}"/>'
+        )
+    lines.append("      </CellData>")
+
+    if isinstance(mesh, openmc.RectilinearMesh):
+        lines.append("      <Coordinates>")
+        for name, _, _ in geometry_arrays:
+            lines.append(
+                f'        <DataArray type="Float64" Name="{name}" format="appended" '
+                f'offset="{offsets[name]}"/>'
+            )
+        lines.append("      </Coordinates>")
+    elif isinstance(mesh, openmc.CylindricalMesh):
+        lines.append("      <Points>")
+        lines.append(
+            '        <DataArray type="Float64" NumberOfComponents="3" '
+            f'format="appended" offset="{offsets["points"]}"/>'
+        )
+        lines.append("      </Points>")
+
+    lines += [
+        "    </Piece>",
+        f"  </{vtk_type}>",
+        '  <AppendedData encoding="raw">',
+    ]
+    vtk_file.write(("\n".join(lines) + "\n   _").encode())
+
+
+def write_mesh_tally_to_vtk(
+    filename,
+    tally,
+    required_units: str = None,
+    source_strength: float = None,
+    volume: float = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Converts a mesh tally into the required units and writes it to a VTK
+    XML file with the values appended as raw binary. Regular meshes are
+    written as ImageData (.vti), rectilinear meshes as RectilinearGrid (.vtr)
+    and cylindrical meshes as StructuredGrid (.vts). The converted values are
+    streamed into the file one chunk at a time so large meshes are written in
+    bounded memory.
+
+    Args:
+        filename: The path of the VTK file
+        tally: The openmc.Tally object which should have a MeshFilter and no
+            other filters, nuclides or scores that add bins
+        required_units: The units to convert the tally into
+        source_strength: In some cases the source_strength will be required
+            to convert the base units into the required units.
+        volume: In some cases the volume will be required to convert the base
+            units into the required units. The voxel volumes of the mesh are
+            found automatically.
+        chunk_size: The approximate number of tally values in each chunk
+
+    Returns:
+        The names of the cell data arrays written to the file
+    """
+
+    if not tally.contains_filter(openmc.MeshFilter):
+        raise ValueError(f"MeshFilter was not found in tally {tally.id}")
+
+    mesh = tally.find_filter(filter_type=openmc.MeshFilter).mesh
+    if type(mesh).__name__ not in VTK_FILE_TYPES:
+        msg = (
+            f"{type(mesh).__name__} can't be written to VTK. The supported meshes "
+            f"are {list(VTK_FILE_TYPES.keys())}"
+        )
+        raise ValueError(msg)
+
+    number_of_voxels = int(np.prod(mesh.dimension))
+    if int(np.prod(tally.shape)) != number_of_voxels:
+        msg = (
+            f"The tally has {int(np.prod(tally.shape))} values but the mesh has "
+            f"{number_of_voxels} voxels"
+        )
+        raise ValueError(msg)
+
+    def iter_chunks():
+        return iter_converted_chunks(
+            tally, required_units, source_strength, volume, chunk_size
+        )
+
+    # the first chunk gives the units and whether there is a std. dev. The
+    # generator is closed so the statepoint file is not left open.
+    with closing(iter_chunks()) as chunks:
+        _, first_mean, first_std_dev = next(chunks)
+    units = first_mean.units
+
+    def write_values(vtk_file, std_dev=False):
+        for _, tally_mean, tally_std_dev in iter_chunks():
+            _write_array(vtk_file, (tally_std_dev if std_dev else tally_mean).magnitude)
+
+    data_arrays = [(f"mean [{units}]", number_of_voxels, write_values)]
+    if first_std_dev is not None:
+        data_arrays.append(
+            (
+                f"std. dev. [{units}]",
+                number_of_voxels,
+                lambda vtk_file: write_values(vtk_file, std_dev=True),
+            )
+        )
+    geometry_arrays = _find_geometry_arrays(mesh)
+
+    with open(filename, "wb") as vtk_file:
+        _write_header(vtk_file, mesh, data_arrays, geometry_arrays)
+        for _, number_of_values, write in data_arrays + geometry_arrays:
+            vtk_file.write(np.array(8 * number_of_values, dtype="<u8").tobytes())
+            write(vtk_file)
+        vtk_file.write(b"\n  </AppendedData>\n</VTKFile>\n")
+
+    return [name for name, _, _ in data_arrays]
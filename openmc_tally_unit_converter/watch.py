@@ -0,0 +1,261 @@
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+import openmc
+
+from .cache import cached_process_tally
+from .cli import PROCESSORS, parse_tally_options
+from .hdf5 import write_tally_result_to_hdf5
+
+TRENDS_FILENAME = "trends.json"
+
+
+def _find_batch_number(filename) -> int:
+    """Finds the batch number of a statepoint.N.h5 file name, or -1 when
+    the name has no number"""
+
+    numbers = re.findall(r"\d+", Path(filename).stem)
+    return int(numbers[-1]) if numbers else -1
+
+
+def find_relative_error(tally_result) -> np.ndarray:
+    """Finds the relative error of each value of a tally result.
+
+    Args:
+        tally_result: A tuple of the tally mean and std. dev.
+
+    Returns:
+        The std. dev. divided by the magnitude of the mean, which is zero
+        where the mean is zero
+    """
+
+    tally_mean, tally_std_dev = tally_result
+    mean = np.abs(np.ravel(tally_mean.magnitude))
+    std_dev = np.ravel(tally_std_dev.to(tally_mean.units).magnitude)
+    relative_error = np.zeros_like(mean)
+    np.divide(std_dev, mean, out=relative_error, where=mean > 0)
+    return relative_error
+
+
+def _write_json(filename: Path, data):
+    temporary_filename = filename.with_name(f".{filename.name}.tmp")
+    temporary_filename.write_text(json.dumps(data, indent=2))
+    temporary_filename.replace(filename)
+
+
+class StatepointWatcher:
+    """Watches a directory for statepoint files written during a simulation
+    and converts the tallies of a conversion spec as each statepoint is
+    completed. The directory is polled, which also works on the network
+    filesystems where inotify events are not delivered. A statepoint is
+    converted once its size and modification time are unchanged between two
+    polls, and is not converted again unless it changes.
+
+    The latest result of each tally is published to latest_{tally name}.h5
+    in the output directory and the relative error of each converted
+    statepoint is appended to trends.json. Both are replaced atomically so
+    they can be read while the watcher is running. A statepoint that can't be
+    converted, for example a corrupt file or one without a tally of the spec,
+    is recorded in trends.json with the error and the watcher continues.
+
+    Args:
+        directory: The directory the simulation writes statepoints into
+        spec: The conversion spec from load_conversion_spec, mapping tally
+            names to conversion options
+        output_directory: The directory to publish the results into
+        pattern: The glob pattern of the statepoint file names
+        cache_directory: The directory of the conversion cache, so
+            statepoints converted before the watcher was restarted are read
+            from the cache. None converts without a cache.
+    """
+
+    def __init__(
+        self,
+        directory,
+        spec: dict,
+        output_directory,
+        pattern: str = "statepoint.*.h5",
+        cache_directory=None,
+    ):
+        self.directory = Path(directory)
+        self.spec = spec
+        self.output_directory = Path(output_directory)
+        self.pattern = pattern
+        self.cache_directory = cache_directory
+
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+
+        # signatures from the previous poll, used to find finished files
+        self._previous_signatures = {}
+
+        trends_filename = self.output_directory / TRENDS_FILENAME
+        if trends_filename.is_file():
+            state = json.loads(trends_filename.read_text())
+        else:
+            state = {"processed": {}, "latest": {}, "trends": []}
+        self.processed = state["processed"]
+        self.latest = state["latest"]
+        self.trends = state["trends"]
+
+    def _find_signatures(self) -> dict:
+        signatures = {}
+        for filename in self.directory.glob(self.pattern):
+            try:
+                stat = filename.stat()
+            except OSError:
+                continue
+            signatures[str(filename)] = [stat.st_mtime_ns, stat.st_size]
+        return signatures
+
+    def find_new_statepoints(self) -> list:
+        """Finds the statepoints that have been completely written since they
+        were last converted. A statepoint is complete when its signature is
+        unchanged since the previous poll.
+
+        Returns:
+            The statepoint filenames in the order of their batch numbers
+        """
+
+        signatures = self._find_signatures()
+        new_statepoints = [
+            filename
+            for filename, signature in signatures.items()
+            if self._previous_signatures.get(filename) == signature
+            and self.processed.get(filename) != signature
+        ]
+        self._previous_signatures = signatures
+        return sorted(new_statepoints, key=_find_batch_number)
+
+    def _convert_tally(self, tally, options: dict):
+        processor, kwargs = parse_tally_options(options)
+        process_function = PROCESSORS[processor]
+
+        if self.cache_directory is None:
+            return process_function(tally=tally, **kwargs)
+        return cached_process_tally(
+            tally,
+            self.cache_directory,
+            process_function=process_function,
+            **kwargs,
+        )
+
+    def _publish(self, tally_name: str, tally_result, statepoint_filename, tally):
+        safe_tally_name = re.sub(r"[^\w.-]+", "_", tally_name)
+        filename = self.output_directory / f"latest_{safe_tally_name}.h5"
+        temporary_filename = filename.with_name(f".{filename.name}.tmp")
+        temporary_filename.unlink(missing_ok=True)
+        write_tally_result_to_hdf5(
+            temporary_filename,
+            tally_result,
+            group_name=tally_name,
+            statepoint=str(statepoint_filename),
+            realizations=int(tally.num_realizations),
+        )
+        temporary_filename.replace(filename)
+
+    def convert_statepoint(self, statepoint_filename) -> list:
+        """Converts the tallies of the spec in a statepoint, publishes the
+        results and records the relative errors.
+
+        Args:
+            statepoint_filename: The path of the statepoint file
+
+        Returns:
+            The trend entries recorded for the statepoint
+        """
+
+        batch_number = _find_batch_number(statepoint_filename)
+        entries = []
+        with openmc.StatePoint(filepath=str(statepoint_filename)) as statepoint:
+            for tally_name, options in self.spec.items():
+                tally = statepoint.get_tally(name=tally_name)
+                tally_result = self._convert_tally(tally, options)
+
+                entry = {
+                    "statepoint": str(statepoint_filename),
+                    "batch": batch_number,
+                    "tally": tally_name,
+                    "realizations": int(tally.num_realizations),
+                }
+                if isinstance(tally_result, tuple):
+                    relative_error = find_relative_error(tally_result)
+                    non_zero = relative_error[relative_error > 0]
+                    entry["units"] = str(tally_result[0].units)
+                    entry["maximum_relative_error"] = float(relative_error.max())
+                    entry["mean_relative_error"] = (
+                        float(non_zero.mean()) if non_zero.size else 0.0
+                    )
+                entries.append(entry)
+
+                # an earlier batch finishing late does not replace a later one
+                if batch_number >= self.latest.get(tally_name, -1):
+                    self._publish(tally_name, tally_result, statepoint_filename, tally)
+                    self.latest[tally_name] = batch_number
+
+        return entries
+
+    def _write_trends(self):
+        _write_json(
+            self.output_directory / TRENDS_FILENAME,
+            {"processed": self.processed, "latest": self.latest, "trends": self.trends},
+        )
+
+    def poll(self) -> list:
+        """Converts the statepoints that have been completed since the last
+        poll. A statepoint that can't be converted is recorded in the trends
+        with the error and is not converted again unless it changes.
+
+        Returns:
+            The statepoint filenames that were converted
+        """
+
+        converted = []
+        for statepoint_filename in self.find_new_statepoints():
+            try:
+                entries = self.convert_statepoint(statepoint_filename)
+            except Exception as error:
+                entries = [
+                    {
+                        "statepoint": str(statepoint_filename),
+                        "batch": _find_batch_number(statepoint_filename),
+                        "error": f"{type(error).__name__}: {error}",
+                    }
+                ]
+            else:
+                converted.append(statepoint_filename)
+
+            self.trends += entries
+            self.processed[statepoint_filename] = self._previous_signatures[
+                statepoint_filename
+            ]
+            self._write_trends()
+        return converted
+
+    def watch(self, interval: float = 10.0, timeout: float = None, stop_filename=None):
+        """Polls the directory until the timeout or until the stop file is
+        found.
+
+        Args:
+            interval: The time between polls in seconds
+            timeout: The time to watch for in seconds. None watches until the
+                stop file is found or the process is interrupted.
+            stop_filename: A file which stops the watcher when it exists, for
+                example one written by the job script after the simulation
+        """
+
+        start_time = time.monotonic()
+        while True:
+            stopping = stop_filename is not None and os.path.exists(stop_filename)
+            self.poll()
+            if stopping:
+                # a final poll after the file signatures have settled
+                time.sleep(interval)
+                self.poll()
+                return
+            if timeout is not None and time.monotonic() - start_time > timeout:
+                return
+            time.sleep(interval)
@@ -17,14 +17,12 @@ setuptools.setup(
         "Natural Language :: English",
         "Topic :: Scientific/Engineering",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     package_data={
         "openmc_tally_unit_converter": [
             # "requirements.txt",
@@ -34,4 +32,11 @@ setuptools.setup(
         ]
     },
     install_requires=["pint"],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "yaml": ["pyyaml"],
+    },
+    entry_points={
+        "console_scripts": ["otuc=openmc_tally_unit_converter.cli:main"],
+    },
 )
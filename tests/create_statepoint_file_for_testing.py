@@ -150,6 +150,18 @@ tally17 = odw.MeshTally3D(
     tally_type="neutron_effective_dose",
 )
 
+tally18 = odw.MeshTally3D(
+    mesh_resolution=(2, 3, 4),
+    bounding_box=[(-500, -500, 0), (500, 500, 1)],
+    tally_type="heating",
+)
+
+tally19 = odw.MeshTally3D(
+    mesh_resolution=(2, 3, 4),
+    bounding_box=[(-500, -500, 0), (500, 500, 1)],
+    tally_type="neutron_flux",
+)
+
 tallies = openmc.Tallies(
     [
         tally1,
@@ -169,6 +181,8 @@ tallies = openmc.Tallies(
         tally15,
         tally16,
         tally17,
+        tally18,
+        tally19,
     ]
 )
 
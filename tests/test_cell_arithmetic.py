@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally_heat = statepoint.get_tally(name="2_heating")
+        self.my_tally_heat_local = statepoint.get_tally(name="2_heating-local")
+        self.my_flux_tally = statepoint.get_tally(name="2_flux")
+
+        self.heat_in_watts = otuc.process_tally(
+            tally=self.my_tally_heat, required_units="watts", source_strength=1e20
+        )
+        self.heat_local_in_kw = otuc.process_tally(
+            tally=self.my_tally_heat_local,
+            required_units="kW",
+            source_strength=1e20,
+        )
+
+    def test_add_tally_results_with_different_units(self):
+
+        result = otuc.add_tally_results(self.heat_in_watts, self.heat_local_in_kw)
+
+        assert result[0].units == "watt"
+        assert result[1].units == "watt"
+        assert np.allclose(
+            result[0].magnitude,
+            self.heat_in_watts[0].magnitude
+            + self.heat_local_in_kw[0].to("watt").magnitude,
+        )
+        assert np.allclose(
+            result[1].magnitude,
+            np.sqrt(
+                self.heat_in_watts[1].magnitude ** 2
+                + self.heat_local_in_kw[1].to("watt").magnitude ** 2
+            ),
+        )
+
+    def test_sum_of_many_tally_results(self):
+
+        result = otuc.sum_tally_results([self.heat_in_watts] * 10, "kW")
+
+        assert result[0].units == "kilowatt"
+        assert np.allclose(
+            result[0].magnitude, 10 * self.heat_in_watts[0].to("kW").magnitude
+        )
+        assert np.allclose(
+            result[1].magnitude,
+            np.sqrt(10) * self.heat_in_watts[1].to("kW").magnitude,
+        )
+
+    def test_subtract_background(self):
+
+        result = otuc.subtract_tally_results(self.heat_in_watts, self.heat_in_watts)
+
+        assert np.allclose(result[0].magnitude, 0)
+        assert np.allclose(
+            result[1].magnitude, np.sqrt(2) * self.heat_in_watts[1].magnitude
+        )
+
+    def test_ratio_of_tally_results(self):
+
+        result = otuc.divide_tally_results(
+            self.heat_in_watts, self.heat_local_in_kw, "dimensionless"
+        )
+
+        assert result[0].units == "dimensionless"
+        assert np.allclose(
+            result[0].magnitude,
+            self.heat_in_watts[0].magnitude
+            / self.heat_local_in_kw[0].to("watt").magnitude,
+        )
+
+    def test_product_with_quantity(self):
+
+        duration = otuc.ureg.Quantity(3600, "second")
+        result = otuc.multiply_tally_results(self.heat_in_watts, duration, "joule")
+
+        assert result[0].units == "joule"
+        assert np.allclose(result[0].magnitude, self.heat_in_watts[0].magnitude * 3600)
+        assert np.allclose(result[1].magnitude, self.heat_in_watts[1].magnitude * 3600)
+
+    def test_incompatible_units(self):
+
+        flux = otuc.process_tally(
+            tally=self.my_flux_tally, required_units="centimeter / source_particle"
+        )
+
+        with pytest.raises(ValueError):
+            otuc.add_tally_results(self.heat_in_watts, flux)
@@ -0,0 +1,70 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_heating")
+
+    def test_concurrent_conversions_match(self):
+        async def convert():
+            return await asyncio.gather(
+                *[
+                    otuc.process_tally_async(
+                        self.my_tally, required_units=units, source_strength=1e20
+                    )
+                    for units in ["watts", "kW"] * 10
+                ]
+            )
+
+        results = asyncio.run(convert())
+
+        expected = otuc.process_tally(
+            tally=self.my_tally, required_units="watts", source_strength=1e20
+        )
+        assert len(results) == 20
+        assert np.allclose(results[0][0].magnitude, expected[0].magnitude)
+        assert np.allclose(results[1][0].magnitude, 1e-3 * expected[0].magnitude)
+
+    def test_cancelled_conversion_does_not_run(self):
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        calls = []
+
+        def record_call(**kwargs):
+            calls.append(kwargs)
+
+        async def cancel():
+            blocking = asyncio.ensure_future(
+                otuc.run_async(time.sleep, 0.2, executor=executor)
+            )
+            queued = asyncio.ensure_future(
+                otuc.run_async(record_call, executor=executor, tally=self.my_tally)
+            )
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            await blocking
+
+        asyncio.run(cancel())
+        executor.shutdown()
+
+        assert calls == []
+
+    def test_set_executor(self):
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        previous_executor = otuc.set_executor(executor)
+        try:
+            assert otuc.get_executor() is executor
+        finally:
+            otuc.set_executor(previous_executor)
+            executor.shutdown()
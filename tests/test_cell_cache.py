@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_heating")
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.cache_directory = Path(self.temporary_directory.name) / "cache"
+
+        self.number_of_calls = 0
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def counted_process_tally(self, tally, **kwargs):
+        self.number_of_calls += 1
+        return otuc.process_tally(tally=tally, **kwargs)
+
+    def test_warm_cache_skips_conversion(self):
+
+        results = [
+            otuc.cached_process_tally(
+                tally=self.my_tally,
+                cache_directory=self.cache_directory,
+                process_function=self.counted_process_tally,
+                required_units="watts",
+                source_strength=1e20,
+            )
+            for _ in range(2)
+        ]
+
+        assert self.number_of_calls == 1
+        assert results[0][0].units == results[1][0].units
+        assert np.allclose(results[0][0].magnitude, results[1][0].magnitude)
+        assert np.allclose(results[0][1].magnitude, results[1][1].magnitude)
+
+    def test_arguments_change_the_key(self):
+
+        key = otuc.find_cache_key(self.my_tally, required_units="watts")
+
+        assert key == otuc.find_cache_key(self.my_tally, required_units="watts")
+        assert key != otuc.find_cache_key(self.my_tally, required_units="kW")
+        assert key != otuc.find_cache_key(
+            self.my_tally, required_units="watts", hash_statepoint=True
+        )
+
+    def test_least_recently_used_entries_are_evicted(self):
+
+        for required_units in ["watts", "kW"]:
+            otuc.cached_process_tally(
+                tally=self.my_tally,
+                cache_directory=self.cache_directory,
+                max_cache_size=1,
+                required_units=required_units,
+                source_strength=1e20,
+            )
+
+        assert os.listdir(self.cache_directory) == []
+
+        otuc.cached_process_tally(
+            tally=self.my_tally,
+            cache_directory=self.cache_directory,
+            required_units="watts",
+            source_strength=1e20,
+        )
+        assert len(os.listdir(self.cache_directory)) == 1
+
+        otuc.clear_cache(self.cache_directory)
+        assert os.listdir(self.cache_directory) == []
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import openmc_tally_unit_converter as otuc
 import pytest
 import openmc
@@ -262,6 +263,125 @@ class TestUsage(unittest.TestCase):
             == 365.25 * 24 * 60 * 60 * result_second[1].magnitude.sum()
         )
 
+    def test_recombination_fraction_scales_std_dev(self):
+        """the recombination fraction is applied to the result and std. dev."""
+
+        result = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / source_particle",
+            energy_per_displacement=80,
+        )
+        result_recombined = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / source_particle",
+            energy_per_displacement=80,
+            recombination_fraction=0.25,
+        )
+
+        assert np.allclose(0.75 * result[0].magnitude, result_recombined[0].magnitude)
+        assert np.allclose(0.75 * result[1].magnitude, result_recombined[1].magnitude)
+
+    def test_nrt_damage_model(self):
+        """the nrt model uses 2.5 times the displacement energy of the material"""
+
+        my_mat = openmc.Material()
+        my_mat.add_element("Fe", 1)
+        my_mat.set_density("g/cm3", 7.8)
+
+        result = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / atom",
+            damage_model="nrt",
+            volume=5,
+            material=my_mat,
+        )
+        result_energy_per_displacement = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / atom",
+            energy_per_displacement=100,
+            volume=5,
+            material=my_mat,
+        )
+
+        assert result[0].units == "displacements / atom"
+        assert result[1].units == "displacements / atom"
+        assert np.allclose(
+            result[0].magnitude, result_energy_per_displacement[0].magnitude
+        )
+
+    def test_arc_dpa_damage_model(self):
+        """arc-dpa gives fewer displacements than nrt for high recoil energies"""
+
+        my_mat = openmc.Material()
+        my_mat.add_element("W", 1)
+        my_mat.set_density("g/cm3", 19.3)
+
+        result_nrt = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / atom",
+            damage_model="nrt",
+            volume=5,
+            material=my_mat,
+        )
+        result_arc_dpa = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / atom",
+            damage_model="arc-dpa",
+            recoil_damage_energy=20e3,
+            volume=5,
+            material=my_mat,
+        )
+
+        assert result_arc_dpa[0].units == "displacements / atom"
+        assert result_arc_dpa[1].units == "displacements / atom"
+        assert np.all(result_arc_dpa[0].magnitude <= result_nrt[0].magnitude)
+
+    def test_arc_dpa_without_recoil_damage_energy(self):
+
+        my_mat = openmc.Material()
+        my_mat.add_element("Fe", 1)
+        my_mat.set_density("g/cm3", 7.8)
+
+        with pytest.raises(ValueError):
+            otuc.process_damage_energy_tally(
+                tally=self.my_tally,
+                required_units="displacements / atom",
+                damage_model="arc-dpa",
+                volume=5,
+                material=my_mat,
+            )
+
+    def test_damage_model_and_energy_per_displacement(self):
+
+        with pytest.raises(ValueError):
+            otuc.process_damage_energy_tally(
+                tally=self.my_tally,
+                required_units="displacements / source_particle",
+                damage_model="nrt",
+                displacement_energy=40,
+                energy_per_displacement=80,
+            )
+
+    def test_composition_weighted_displacement_energy(self):
+
+        my_mat = openmc.Material()
+        my_mat.add_element("Fe", 0.5, percent_type="ao")
+        my_mat.add_element("W", 0.5, percent_type="ao")
+        my_mat.set_density("g/cm3", 10)
+
+        displacement_energy = otuc.find_displacement_energy(my_mat)
+
+        assert np.isclose(displacement_energy, 0.5 * 40 + 0.5 * 70)
+
+    def test_damage_model_functions(self):
+
+        assert np.allclose(otuc.nrt_displacements([10, 50, 1000], 40), [0, 1, 10])
+        assert np.allclose(
+            otuc.arc_dpa_efficiency([50, 1e10], 40, b=-0.568, c=0.286),
+            [1, 0.286],
+            atol=1e-3,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
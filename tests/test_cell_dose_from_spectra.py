@@ -0,0 +1,89 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_neutron_spectra")
+        self.my_flux_tally = statepoint.get_tally(name="2_flux")
+
+    def test_group_averages_of_linear_function(self):
+
+        result = otuc.find_group_averages(
+            energy=[0, 1, 2], values=[0, 1, 2], energy_edges=[0, 2, 3]
+        )
+
+        # the function is zero outside of the tabulated energies
+        assert np.allclose(result, [1, 0])
+
+    def test_group_dose_coefficients_are_cached(self):
+
+        coefficients_1 = otuc.find_group_dose_coefficients(
+            [1e-3, 1e3, 1e7], particle="neutron", geometry=["AP", "ISO"]
+        )
+        coefficients_2 = otuc.find_group_dose_coefficients(
+            [1e-3, 1e3, 1e7], particle="neutron", geometry=["AP", "ISO"]
+        )
+
+        assert coefficients_1.shape == (2, 2)
+        assert coefficients_1 is coefficients_2
+
+    def test_cell_tally_dose_base_units(self):
+
+        result = otuc.process_dose_from_spectra_tally(tally=self.my_tally)
+
+        assert len(result) == 2
+        assert (
+            result[0].units
+            == "centimeter ** 3 * neutron * picosievert / source_particle"
+        )
+        assert (
+            result[1].units
+            == "centimeter ** 3 * neutron * picosievert / source_particle"
+        )
+
+    def test_cell_tally_dose_per_hour(self):
+
+        result = otuc.process_dose_from_spectra_tally(
+            tally=self.my_tally,
+            geometry="ISO",
+            required_units="sievert / hour",
+            source_strength=1e20,
+            volume=100,
+        )
+
+        assert len(result) == 2
+        assert result[0].units == "sievert / hour"
+        assert result[1].units == "sievert / hour"
+
+    def test_cell_tally_dose_for_several_geometries(self):
+
+        result = otuc.process_dose_from_spectra_tally(
+            tally=self.my_tally,
+            particle="neutron",
+            geometry=["AP", "PA", "ISO"],
+            required_units="picosievert cm ** 3 / source_particle",
+        )
+
+        assert result[0].shape[-1] == 3
+        assert result[1].shape[-1] == 3
+
+        single_result = otuc.process_dose_from_spectra_tally(
+            tally=self.my_tally,
+            particle="neutron",
+            geometry="PA",
+            required_units="picosievert cm ** 3 / source_particle",
+        )
+        assert np.allclose(result[0][..., 1].magnitude, single_result[0].magnitude)
+
+    def test_tally_without_energy_filter(self):
+
+        with pytest.raises(ValueError):
+            otuc.process_dose_from_spectra_tally(tally=self.my_flux_tally)
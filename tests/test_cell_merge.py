@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally_heat = statepoint.get_tally(name="2_heating")
+
+    def test_merge_single_statepoint(self):
+
+        merged_tally = otuc.merge_statepoint_tallies(
+            ["statepoint.2.h5"], tally_name="2_heating"
+        )
+
+        assert merged_tally.num_realizations == self.my_tally_heat.num_realizations
+        assert np.allclose(merged_tally.mean, self.my_tally_heat.mean)
+        assert np.allclose(merged_tally.std_dev, self.my_tally_heat.std_dev)
+
+    def test_merge_repeated_statepoints(self):
+
+        merged_tally = otuc.merge_statepoint_tallies(
+            ["statepoint.2.h5"] * 3, tally_name="2_heating"
+        )
+
+        assert merged_tally.num_realizations == 3 * self.my_tally_heat.num_realizations
+        assert np.allclose(merged_tally.mean, self.my_tally_heat.mean)
+        assert np.all(merged_tally.std_dev <= self.my_tally_heat.std_dev)
+
+    def test_merged_sums(self):
+        """the sums of the realizations of each statepoint are added"""
+
+        merged_tally = otuc.merge_statepoint_tallies(
+            ["statepoint.2.h5"] * 3, tally_name="2_heating"
+        )
+
+        assert merged_tally.sum is not None
+        assert merged_tally.sum_sq is not None
+        assert np.allclose(merged_tally.sum, 3 * self.my_tally_heat.sum)
+        assert np.allclose(merged_tally.sum_sq, 3 * self.my_tally_heat.sum_sq)
+
+    def test_process_merged_tally(self):
+
+        result = otuc.process_merged_tally(
+            (filename for filename in ["statepoint.2.h5"] * 2),
+            tally_name="2_heating",
+            required_units="watts",
+            source_strength=1e20,
+        )
+
+        single_result = otuc.process_tally(
+            tally=self.my_tally_heat, required_units="watts", source_strength=1e20
+        )
+
+        assert result[0].units == "watt"
+        assert result[1].units == "watt"
+        assert np.allclose(result[0].magnitude, single_result[0].magnitude)
+
+    def test_merge_without_statepoints(self):
+
+        with pytest.raises(ValueError):
+            otuc.merge_statepoint_tallies([], tally_name="2_heating")
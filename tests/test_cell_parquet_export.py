@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+import pyarrow
+import pyarrow.parquet
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_neutron_spectra")
+
+        self.result = otuc.process_tally(
+            tally=self.my_tally, required_units="centimeter / source_particle"
+        )
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.filename = Path(self.temporary_directory.name) / "spectra.parquet"
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_arrow_table(self):
+
+        table = otuc.tally_to_arrow_table(
+            tally=self.my_tally, required_units="centimeter / source_particle"
+        )
+
+        assert table.num_rows == self.result[0].size
+        assert pyarrow.types.is_dictionary(table.schema.field("cell").type)
+        assert pyarrow.types.is_dictionary(table.schema.field("energy low [eV]").type)
+        assert (
+            table.schema.field("mean").metadata[b"units"]
+            == b"centimeter / source_particle"
+        )
+        assert np.allclose(
+            table.column("mean").to_numpy(), self.result[0].magnitude.ravel()
+        )
+
+    def test_energy_columns_match_dataframe(self):
+
+        table = otuc.tally_to_arrow_table(
+            tally=self.my_tally, required_units="centimeter / source_particle"
+        )
+        data_frame = self.my_tally.get_pandas_dataframe()
+
+        assert np.allclose(
+            table.column("energy low [eV]").to_pandas().astype(float),
+            data_frame["energy low [eV]"],
+        )
+
+    def test_write_parquet_in_row_groups(self):
+
+        otuc.write_tally_to_parquet(
+            filename=self.filename,
+            tally=self.my_tally,
+            required_units="centimeter / source_particle",
+            row_group_size=100,
+        )
+
+        parquet_file = pyarrow.parquet.ParquetFile(self.filename)
+
+        assert parquet_file.num_row_groups == int(np.ceil(self.result[0].size / 100))
+        assert np.allclose(
+            parquet_file.read().column("std. dev.").to_numpy(),
+            self.result[1].magnitude.ravel(),
+        )
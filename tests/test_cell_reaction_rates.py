@@ -0,0 +1,104 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_neutron_spectra")
+
+        energy_filter = self.my_tally.find_filter(openmc.EnergyFilter)
+        self.number_of_groups = energy_filter.num_bins
+
+        self.my_mat = openmc.Material()
+        self.my_mat.add_element("Li", 1)
+        self.my_mat.set_density("g/cm3", 0.5)
+
+    def test_reaction_rates_base_units(self):
+
+        result = otuc.process_reaction_rate_tally(
+            tally=self.my_tally,
+            cross_sections={
+                "(n,Xt)": np.full(self.number_of_groups, 0.1),
+                "(n,Xa)": np.full(self.number_of_groups, 0.2),
+            },
+        )
+
+        assert list(result.keys()) == ["(n,Xt)", "(n,Xa)"]
+        assert result["(n,Xt)"][0].units == "reaction / source_particle"
+        assert result["(n,Xt)"][1].units == "reaction / source_particle"
+        assert np.allclose(
+            2 * result["(n,Xt)"][0].magnitude, result["(n,Xa)"][0].magnitude
+        )
+
+    def test_reaction_rates_per_second_per_volume(self):
+
+        result = otuc.process_reaction_rate_tally(
+            tally=self.my_tally,
+            cross_sections={
+                "(n,Xt)": np.full(self.number_of_groups, 0.1) * otuc.ureg.barn
+            },
+            required_units="reactions / second / cm ** 3",
+            source_strength=1e20,
+            volume=100,
+            material=self.my_mat,
+        )
+
+        assert result["(n,Xt)"][0].units == "reaction / centimeter ** 3 / second"
+        assert result["(n,Xt)"][1].units == "reaction / centimeter ** 3 / second"
+
+    def test_reaction_rates_of_fusion_power_sweep(self):
+        """each reaction rate has a row for each source strength"""
+
+        source_strengths = np.array([1e18, 1e19, 1e20])
+        result = otuc.process_reaction_rate_tally(
+            tally=self.my_tally,
+            cross_sections={
+                "(n,Xt)": np.full(self.number_of_groups, 0.1),
+                "(n,Xa)": np.full(self.number_of_groups, 0.2),
+            },
+            required_units="reactions / second",
+            source_strength=source_strengths,
+        )
+        result_of_one_power = otuc.process_reaction_rate_tally(
+            tally=self.my_tally,
+            cross_sections={
+                "(n,Xt)": np.full(self.number_of_groups, 0.1),
+                "(n,Xa)": np.full(self.number_of_groups, 0.2),
+            },
+            required_units="reactions / second",
+            source_strength=1e20,
+        )
+
+        number_of_bins = len(result_of_one_power["(n,Xt)"][0])
+        for reaction in ["(n,Xt)", "(n,Xa)"]:
+            assert result[reaction][0].shape == (len(source_strengths), number_of_bins)
+            assert result[reaction][1].shape == (len(source_strengths), number_of_bins)
+            assert np.allclose(
+                result[reaction][0][-1].magnitude,
+                result_of_one_power[reaction][0].magnitude,
+            )
+
+    def test_microscopic_cross_sections_without_material(self):
+
+        with pytest.raises(ValueError):
+            otuc.process_reaction_rate_tally(
+                tally=self.my_tally,
+                cross_sections={
+                    "(n,Xt)": np.full(self.number_of_groups, 0.1) * otuc.ureg.barn
+                },
+            )
+
+    def test_cross_sections_with_wrong_number_of_groups(self):
+
+        with pytest.raises(ValueError):
+            otuc.process_reaction_rate_tally(
+                tally=self.my_tally,
+                cross_sections={"(n,Xt)": np.ones(self.number_of_groups + 1)},
+            )
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_flux_tally = statepoint.get_tally(name="2_flux")
+        self.my_damage_tally = statepoint.get_tally(name="2_damage-energy")
+
+        self.my_mat = openmc.Material()
+        self.my_mat.add_element("Fe", 1)
+        self.my_mat.set_density("g/cm3", 7.8)
+
+        # 1000 pulses of 400 seconds with 1200 seconds between pulses
+        self.scenario = otuc.IrradiationScenario(
+            source_strengths=np.full(1000, 1e20),
+            durations=400,
+            dwell_times=1200,
+            availability=0.5,
+        )
+
+    def test_scenario_properties(self):
+
+        assert self.scenario.number_of_pulses == 1000
+        assert np.isclose(self.scenario.total_source_particles, 1000 * 400 * 1e20 * 0.5)
+        assert np.allclose(self.scenario.pulse_end_times[:3], [400, 2000, 3600])
+        assert np.isclose(
+            self.scenario.find_full_power_years(source_strength=2e20),
+            1000 * 400 * 0.25 / (365.25 * 24 * 60 * 60),
+        )
+
+    def test_scenario_fluence(self):
+
+        result = otuc.process_scenario_tally(
+            tally=self.my_flux_tally,
+            scenario=self.scenario,
+            required_units="neutron / cm ** 2",
+            volume=100,
+        )
+
+        assert result[0].units == "neutron / centimeter ** 2"
+        assert result[1].units == "neutron / centimeter ** 2"
+
+        result_per_second = otuc.process_tally(
+            tally=self.my_flux_tally,
+            required_units="neutron / cm ** 2 / second",
+            source_strength=1e20,
+            volume=100,
+        )
+        assert np.allclose(
+            result[0].magnitude, result_per_second[0].magnitude * 1000 * 400 * 0.5
+        )
+
+    def test_scenario_dpa_time_series(self):
+
+        result = otuc.process_scenario_tally(
+            tally=self.my_damage_tally,
+            scenario=self.scenario,
+            required_units="displacements / atom",
+            time_series=True,
+            process_function=otuc.process_damage_energy_tally,
+            damage_model="nrt",
+            volume=5,
+            material=self.my_mat,
+        )
+
+        assert result[0].units == "displacements / atom"
+        assert result[0].shape[0] == 1000
+        assert np.all(np.diff(result[0].magnitude, axis=0) >= 0)
+
+    def test_scenario_with_time_units(self):
+
+        with pytest.raises(ValueError):
+            otuc.process_scenario_tally(
+                tally=self.my_flux_tally,
+                scenario=self.scenario,
+                required_units="neutron / cm ** 2 / second",
+                volume=100,
+            )
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import openmc_tally_unit_converter as otuc
 import pytest
 import openmc
@@ -68,3 +69,41 @@ class TestUsage(unittest.TestCase):
         assert result[0].units == "megaelectron_volt"
         # units for flux
         assert result[1].units == "centimeter / pulse"
+
+    def test_cell_tally_spectra_energy_group_edges(self):
+        """the energy axis is the group edges of the EnergyFilter"""
+
+        energy_filter = self.my_tally.find_filter(openmc.EnergyFilter)
+
+        result = otuc.process_spectra_tally(
+            tally=self.my_tally, required_energy_units="MeV", energy_group_edges=True
+        )
+
+        assert len(result[0]) == energy_filter.num_bins + 1
+        assert np.allclose(result[0].magnitude, energy_filter.values * 1e-6)
+
+    def test_cell_tally_spectra_energy_group_edges_are_cached(self):
+
+        result_1 = otuc.process_spectra_tally(
+            tally=self.my_tally, required_energy_units="keV", energy_group_edges=True
+        )
+        result_2 = otuc.process_spectra_tally(
+            tally=self.my_tally, required_energy_units="keV", energy_group_edges=True
+        )
+
+        assert result_1[0] is result_2[0]
+
+    def test_cell_tally_spectra_energy_low_of_each_value(self):
+        """by default the energy axis is the energy low column of the tally
+        dataframe"""
+
+        data_frame = self.my_tally.get_pandas_dataframe()
+
+        result = otuc.process_spectra_tally(
+            tally=self.my_tally, required_energy_units="MeV"
+        )
+
+        assert len(result[0]) == len(result[1])
+        assert np.allclose(
+            result[0].magnitude, np.array(data_frame["energy low [eV]"]) * 1e-6
+        )
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_neutron_spectra")
+
+    def test_rebinning_matrix_fractions(self):
+        """checks the overlap fractions of a simple pair of group structures"""
+
+        matrix = otuc.find_rebinning_matrix([0, 1, 2, 3], [0, 1.5, 3])
+
+        assert matrix.shape == (2, 3)
+        assert np.allclose(matrix.toarray(), [[1, 0.5, 0], [0, 0.5, 1]])
+
+    def test_rebinning_matrix_is_cached(self):
+
+        matrix_1 = otuc.find_rebinning_matrix([0, 1, 2, 3], [0, 1.5, 3])
+        matrix_2 = otuc.find_rebinning_matrix([0, 1, 2, 3], [0, 1.5, 3])
+
+        assert matrix_1 is matrix_2
+
+    def test_rebin_spectra_std_dev_propagation(self):
+
+        values, std_dev = otuc.rebin_spectra(
+            values=np.array([[1.0, 2.0, 3.0]]),
+            source_edges=[0, 1, 2, 3],
+            target_edges=[0, 3],
+            std_dev=np.array([[3.0, 0.0, 4.0]]),
+        )
+
+        assert np.allclose(values, [[6.0]])
+        assert np.allclose(std_dev, [[5.0]])
+
+    def test_invalid_group_structure_name(self):
+
+        with pytest.raises(ValueError):
+            otuc.find_group_structure("not-a-group-structure")
+
+    def test_cell_tally_spectra_rebinning_base_units(self):
+
+        result = otuc.rebin_spectra_tally(
+            tally=self.my_tally, group_structure="VITAMIN-J-175"
+        )
+
+        assert len(result) == 3
+        assert result[0].units == "electron_volt"
+        assert result[1].units == "centimeter * neutron / source_particle"
+        assert result[2].units == "centimeter * neutron / source_particle"
+        assert len(result[0]) == 176
+        assert len(result[1]) == 175
+        assert len(result[2]) == 175
+
+    def test_cell_tally_spectra_rebinning_preserves_total(self):
+
+        spectra = otuc.process_spectra_tally(tally=self.my_tally)
+        energy_filter = self.my_tally.find_filter(openmc.EnergyFilter)
+
+        result = otuc.rebin_spectra_tally(
+            tally=self.my_tally,
+            group_structure=[energy_filter.values[0], energy_filter.values[-1]],
+        )
+
+        assert np.isclose(result[1].magnitude.sum(), spectra[1].magnitude.sum())
+
+    def test_cell_tally_spectra_rebinning_pulse_processing(self):
+
+        result = otuc.rebin_spectra_tally(
+            tally=self.my_tally,
+            group_structure="VITAMIN-J-175",
+            required_units="centimeter / pulse",
+            required_energy_units="MeV",
+            source_strength=1.3e6,
+        )
+
+        assert result[0].units == "megaelectron_volt"
+        assert result[1].units == "centimeter / pulse"
+        assert result[2].units == "centimeter / pulse"
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_heating")
+
+    def tearDown(self):
+        otuc.set_tally_array_cache_size(2**30)
+        otuc.clear_tally_array_cache()
+
+    def test_arrays_are_reused(self):
+
+        tally_mean, tally_std_dev = otuc.get_tally_mean_and_std_dev(self.my_tally)
+
+        assert otuc.get_tally_mean_and_std_dev(self.my_tally)[0] is tally_mean
+        assert not tally_mean.flags.writeable
+        assert not tally_std_dev.flags.writeable
+
+    def test_repeated_conversions_match(self):
+
+        result_watts = otuc.process_tally(
+            tally=self.my_tally, required_units="watts", source_strength=1e20
+        )
+        result_kw = otuc.process_tally(
+            tally=self.my_tally, required_units="kW", source_strength=1e20
+        )
+
+        assert np.allclose(result_watts[0].magnitude, 1e3 * result_kw[0].magnitude)
+        assert np.allclose(result_watts[1].magnitude, 1e3 * result_kw[1].magnitude)
+
+    def test_cache_size_of_zero(self):
+
+        otuc.set_tally_array_cache_size(0)
+
+        tally_mean, _ = otuc.get_tally_mean_and_std_dev(self.my_tally)
+
+        assert otuc.get_tally_mean_and_std_dev(self.my_tally)[0] is not tally_mean
+        assert np.array_equal(
+            otuc.get_tally_mean_and_std_dev(self.my_tally)[0], tally_mean
+        )
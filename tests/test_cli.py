@@ -0,0 +1,139 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+import pytest
+from openmc_tally_unit_converter import cli
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_heating")
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temporary_directory.name)
+
+        self.spec_filename = self.directory / "spec.json"
+        self.spec_filename.write_text(
+            json.dumps(
+                {
+                    "2_heating": {
+                        "required_units": "watts",
+                        "source_strength": 1e20,
+                    },
+                    "heating_on_3D_mesh": {
+                        "required_units": "W / m ** 3",
+                        "source_strength": "1e20",
+                        "format": "vtk",
+                    },
+                }
+            )
+        )
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_command_writes_each_tally(self):
+
+        exit_code = cli.main(
+            [
+                "statepoint.2.h5",
+                "--spec",
+                str(self.spec_filename),
+                "--output-directory",
+                str(self.directory / "results"),
+                "--workers",
+                "2",
+            ]
+        )
+
+        assert exit_code == 0
+        assert (
+            self.directory / "results" / "statepoint.2_heating_on_3D_mesh.vti"
+        ).is_file()
+
+        result, attributes = otuc.read_tally_from_hdf5(
+            self.directory / "results" / "statepoint.2_2_heating.h5", "2_heating"
+        )
+        expected = otuc.process_tally(
+            tally=self.my_tally, required_units="watts", source_strength=1e20
+        )
+        assert attributes["units"] == "watt"
+        assert np.allclose(result[0].magnitude, expected[0].magnitude)
+
+    def test_missing_tally_is_reported(self):
+
+        self.spec_filename.write_text(json.dumps({"not_a_tally": {}}))
+
+        exit_code = cli.main(
+            [
+                "statepoint.2.h5",
+                "--spec",
+                str(self.spec_filename),
+                "--output-directory",
+                str(self.directory / "results"),
+            ]
+        )
+
+        assert exit_code == 1
+
+    def test_yaml_spec(self):
+
+        yaml_spec_filename = self.directory / "spec.yaml"
+        yaml_spec_filename.write_text(
+            "2_heating:\n"
+            "  required_units: watts\n"
+            "  source_strength: 1e20\n"
+            "2_damage-energy:\n"
+            "  processor: damage_energy\n"
+            "  required_units: displacements / atom / second\n"
+            "  source_strength: 1.0e+20\n"
+            "  volume: 100\n"
+            "  energy_per_displacement: 40\n"
+            "  material:\n"
+            "    elements: {Fe: 1.0}\n"
+            "    density: 7.8\n"
+        )
+
+        spec = cli.load_conversion_spec(yaml_spec_filename)
+
+        assert list(spec.keys()) == ["2_heating", "2_damage-energy"]
+        processor, kwargs = cli.parse_tally_options(spec["2_heating"])
+        assert processor == "tally"
+        # YAML reads 1e20 without a decimal point as a string
+        assert kwargs == {"required_units": "watts", "source_strength": 1e20}
+        processor, kwargs = cli.parse_tally_options(spec["2_damage-energy"])
+        assert processor == "damage_energy"
+        assert isinstance(kwargs["material"], openmc.Material)
+
+        exit_code = cli.main(
+            [
+                "statepoint.2.h5",
+                "--spec",
+                str(yaml_spec_filename),
+                "--output-directory",
+                str(self.directory / "results"),
+            ]
+        )
+
+        assert exit_code == 0
+        assert (self.directory / "results" / "statepoint.2_2_heating.h5").is_file()
+        assert (
+            self.directory / "results" / "statepoint.2_2_damage-energy.h5"
+        ).is_file()
+
+    def test_unsupported_processor(self):
+
+        self.spec_filename.write_text(
+            json.dumps({"2_heating": {"processor": "not_a_processor"}})
+        )
+
+        with pytest.raises(ValueError):
+            cli.load_conversion_spec(self.spec_filename)
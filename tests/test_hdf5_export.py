@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+
+        self.result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.filename = Path(self.temporary_directory.name) / "results.h5"
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_write_and_read_compressed_tally(self):
+
+        group_name = otuc.write_tally_to_hdf5(
+            filename=self.filename,
+            tally=self.my_tally,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            chunk_size=5,
+        )
+
+        result, attributes = otuc.read_tally_from_hdf5(self.filename, group_name)
+
+        assert group_name == "heating_on_3D_mesh"
+        assert attributes["units"] == "watt / meter ** 3"
+        assert attributes["source_strength"] == 1e20
+        assert result[0].units == "watt / meter ** 3"
+        assert np.allclose(result[0].magnitude, self.result[0].magnitude)
+        assert np.allclose(result[1].magnitude, self.result[1].magnitude)
+
+    def test_read_uncompressed_tally_is_memory_mapped(self):
+
+        otuc.write_tally_to_hdf5(
+            filename=self.filename,
+            tally=self.my_tally,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            group_name="heating",
+            compression=None,
+        )
+
+        result, _ = otuc.read_tally_from_hdf5(self.filename, "heating")
+
+        assert isinstance(result[0].magnitude, np.memmap)
+        assert np.allclose(result[0].magnitude, self.result[0].magnitude)
+
+    def test_write_and_read_sparse_result(self):
+
+        sparse_result = otuc.process_sparse_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+        otuc.write_tally_result_to_hdf5(
+            self.filename, sparse_result, "sparse_heating", source_strength=1e20
+        )
+        result, attributes = otuc.read_tally_from_hdf5(self.filename, "sparse_heating")
+
+        assert isinstance(result, otuc.SparseTallyResult)
+        assert attributes["source_strength"] == 1e20
+        assert np.allclose(result.to_dense()[0].magnitude, self.result[0].magnitude)
@@ -0,0 +1,159 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+        self.flux_tally = statepoint.get_tally(name="neutron_flux_on_3D_mesh")
+        self.dose_tally = statepoint.get_tally(name="neutron_effective_dose_on_3D_mesh")
+
+    def test_coarsen_per_volume_result(self):
+
+        result, coarse_mesh = otuc.coarsen_mesh_tally(
+            tally=self.my_tally,
+            factor=(2, 1, 2),
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            quantity="intensive",
+        )
+        fine_result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+        assert tuple(coarse_mesh.dimension) == (1, 3, 2)
+        assert result[0].units == "watt / meter ** 3"
+        assert result[0].shape == (6,)
+        # the average of the per volume values conserves the integral
+        assert np.isclose(result[0].magnitude.sum() * 4, fine_result[0].magnitude.sum())
+
+    def test_coarsen_extensive_result(self):
+
+        result, coarse_mesh = otuc.coarsen_mesh_tally(
+            tally=self.my_tally,
+            factor=(2, 3, 4),
+            required_units="W",
+            source_strength=1e20,
+            quantity="extensive",
+        )
+        fine_result = otuc.process_tally(
+            tally=self.my_tally, required_units="W", source_strength=1e20
+        )
+
+        assert tuple(coarse_mesh.dimension) == (1, 1, 1)
+        assert np.isclose(result[0].magnitude[0], fine_result[0].magnitude.sum())
+        assert np.isclose(
+            result[1].magnitude[0], np.sqrt(np.sum(fine_result[1].magnitude ** 2))
+        )
+
+    def test_coarsen_with_indivisible_factor(self):
+
+        with pytest.raises(ValueError):
+            otuc.coarsen_mesh_tally(
+                tally=self.my_tally,
+                factor=3,
+                required_units="W",
+                source_strength=1e20,
+                quantity="extensive",
+            )
+
+    def test_coarsen_without_quantity(self):
+
+        with pytest.raises(TypeError):
+            otuc.coarsen_mesh_tally(
+                tally=self.my_tally,
+                factor=2,
+                required_units="W",
+                source_strength=1e20,
+            )
+
+    def test_coarsen_flux_result(self):
+        """a flux is averaged over the voxels of each block, not summed"""
+
+        result, coarse_mesh = otuc.coarsen_mesh_tally(
+            tally=self.flux_tally,
+            factor=(2, 3, 4),
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+            quantity="intensive",
+        )
+        fine_result = otuc.process_tally(
+            tally=self.flux_tally,
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+        )
+
+        assert tuple(coarse_mesh.dimension) == (1, 1, 1)
+        assert result[0].units == "neutron / centimeter ** 2 / second"
+        assert np.isclose(result[0].magnitude[0], fine_result[0].magnitude.mean())
+        assert np.isclose(
+            result[1].magnitude[0],
+            np.sqrt(np.sum(fine_result[1].magnitude ** 2)) / 24,
+        )
+
+    def test_coarsen_dose_result(self):
+        """a dose rate is averaged over the voxels of each block, not summed"""
+
+        result, coarse_mesh = otuc.coarsen_mesh_tally(
+            tally=self.dose_tally,
+            factor=(2, 3, 4),
+            process_function=otuc.process_dose_tally,
+            required_units="Sv / hour",
+            source_strength=1e20,
+            quantity="intensive",
+        )
+        fine_result = otuc.process_dose_tally(
+            tally=self.dose_tally, required_units="Sv / hour", source_strength=1e20
+        )
+
+        assert tuple(coarse_mesh.dimension) == (1, 1, 1)
+        assert result[0].units == "sievert / hour"
+        assert np.isclose(result[0].magnitude[0], fine_result[0].magnitude.mean())
+
+    def test_coarsen_rectilinear_mesh_result(self):
+        """the voxels of a rectilinear mesh are averaged weighted by their
+        volumes"""
+
+        # the results are read before the mesh filter is replaced with a
+        # rectilinear mesh filter with the same number of voxels
+        self.flux_tally.mean
+        self.flux_tally.std_dev
+        mesh_filter = self.flux_tally.find_filter(openmc.MeshFilter)
+
+        mesh = openmc.RectilinearMesh()
+        mesh.x_grid = [0, 1, 3]
+        mesh.y_grid = [0, 1, 2, 5]
+        mesh.z_grid = [0, 1, 2, 4, 8]
+
+        filters = list(self.flux_tally.filters)
+        filters[filters.index(mesh_filter)] = openmc.MeshFilter(mesh)
+        self.flux_tally.filters = filters
+
+        result, coarse_mesh = otuc.coarsen_mesh_tally(
+            tally=self.flux_tally,
+            factor=(2, 1, 2),
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+            quantity="intensive",
+        )
+        fine_result = otuc.process_tally(
+            tally=self.flux_tally,
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+        )
+
+        assert isinstance(coarse_mesh, openmc.RectilinearMesh)
+        assert list(coarse_mesh.x_grid) == [0, 3]
+        assert list(coarse_mesh.z_grid) == [0, 2, 8]
+        # the volume weighted average conserves the integral
+        assert np.isclose(
+            np.sum(result[0].magnitude * otuc.find_volumes_of_mesh_voxels(coarse_mesh)),
+            np.sum(fine_result[0].magnitude * otuc.find_volumes_of_mesh_voxels(mesh)),
+        )
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies. The mesh tally is
+        # used for its eV / source_particle base units
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+
+        self.steel = openmc.Material()
+        self.steel.add_element("Fe", 1)
+        self.steel.set_density("g/cm3", 7.8)
+
+        self.tungsten = openmc.Material()
+        self.tungsten.add_element("W", 1)
+        self.tungsten.set_density("g/cm3", 19.3)
+
+        # the first 12 voxels are steel and the rest are tungsten
+        self.materials = [self.steel] * 12 + [self.tungsten] * 12
+
+    def test_two_material_mesh_dpa(self):
+        """each voxel is converted with its own material"""
+
+        result = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / atom / second",
+            source_strength=1e20,
+            damage_model="nrt",
+            material=self.materials,
+        )
+
+        for material, voxels in [
+            (self.steel, slice(0, 12)),
+            (self.tungsten, slice(12, 24)),
+        ]:
+            result_of_material = otuc.process_damage_energy_tally(
+                tally=self.my_tally,
+                required_units="displacements / atom / second",
+                source_strength=1e20,
+                damage_model="nrt",
+                material=material,
+            )
+            assert np.allclose(
+                result[0].magnitude[voxels], result_of_material[0].magnitude[voxels]
+            )
+            assert np.allclose(
+                result[1].magnitude[voxels], result_of_material[1].magnitude[voxels]
+            )
+
+    def test_two_material_mesh_energy_per_displacement(self):
+        """an array of energies per displacement is applied to each voxel"""
+
+        energy_per_displacement = np.array([100.0] * 12 + [175.0] * 12)
+
+        result = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / source_particle",
+            energy_per_displacement=energy_per_displacement,
+        )
+        result_steel = otuc.process_damage_energy_tally(
+            tally=self.my_tally,
+            required_units="displacements / source_particle",
+            energy_per_displacement=100,
+        )
+
+        assert np.allclose(result[0].magnitude[:12], result_steel[0].magnitude[:12])
+        assert np.allclose(
+            result[0].magnitude[12:], result_steel[0].magnitude[12:] * 100 / 175
+        )
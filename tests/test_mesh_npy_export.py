@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+
+        self.result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temporary_directory.name) / "heating"
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_write_and_reopen_as_memory_map(self):
+
+        otuc.write_tally_to_npy(
+            directory=self.directory,
+            tally=self.my_tally,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            chunk_size=5,
+        )
+
+        result, metadata = otuc.read_tally_from_npy(self.directory)
+
+        assert metadata["units"] == "watt / meter ** 3"
+        assert metadata["source_strength"] == 1e20
+        assert isinstance(result[0].magnitude, np.memmap)
+        assert np.allclose(result[0].magnitude, self.result[0].magnitude)
+        assert np.allclose(result[1].magnitude, self.result[1].magnitude)
+
+        # the reopened result can be used like the processed result
+        total = otuc.add_tally_results(result, self.result)
+        assert np.allclose(total[0].magnitude, 2 * self.result[0].magnitude)
+
+    def test_write_converted_result(self):
+
+        otuc.write_tally_result_to_npy(self.directory, self.result[0], volume=5)
+
+        result, metadata = otuc.read_tally_from_npy(self.directory, mmap_mode=None)
+
+        assert metadata["volume"] == 5
+        assert np.allclose(result.magnitude, self.result[0].magnitude)
+
+    def test_write_converted_result_with_volume_array(self):
+        """an array of volumes is written to the metadata as a list"""
+
+        volumes = np.full(self.result[0].size, 5.0)
+        otuc.write_tally_result_to_npy(self.directory, self.result, volume=volumes)
+
+        result, metadata = otuc.read_tally_from_npy(self.directory)
+
+        assert metadata["volume"] == volumes.tolist()
+        assert np.allclose(result[0].magnitude, self.result[0].magnitude)
+
+    def test_incomplete_result(self):
+
+        with pytest.raises(FileNotFoundError):
+            otuc.read_tally_from_npy(self.directory)
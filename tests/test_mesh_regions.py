@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+        self.mesh = self.my_tally.find_filter(openmc.MeshFilter).mesh
+
+        self.regions = {
+            "left": {
+                "type": "box",
+                "lower_left": (-500, -500, 0),
+                "upper_right": (0, 500, 1),
+            },
+            "everything_else": {"type": "cylinder", "radius": 1000},
+        }
+
+    def test_region_index_from_boxes_and_cylinders(self):
+
+        region_index, region_names = otuc.find_region_index(self.mesh, self.regions)
+
+        assert region_names == ["left", "everything_else"]
+        assert region_index.shape == (24,)
+        # x varies fastest so voxels alternate between the regions
+        assert np.array_equal(region_index[:4], [0, 1, 0, 1])
+
+    def test_region_integrals_match_total(self):
+
+        regions = otuc.process_mesh_tally_regions(
+            tally=self.my_tally,
+            regions=self.regions,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            quantity="intensive",
+        )
+
+        total = otuc.process_tally(
+            tally=self.my_tally, required_units="W", source_strength=1e20
+        )
+
+        integral = sum(region["integral"][0] for region in regions.values())
+
+        assert integral.units == "watt"
+        assert np.isclose(integral.magnitude, total[0].magnitude.sum())
+
+    def test_region_maxima_from_labels(self):
+
+        labels = np.zeros((2, 3, 4), dtype=int)
+        labels[1] = 5
+
+        regions = otuc.process_mesh_tally_regions(
+            tally=self.my_tally,
+            labels=labels,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            quantity="intensive",
+        )
+        result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+        assert list(regions.keys()) == [0, 5]
+        assert np.isclose(
+            regions[5]["maximum"][0].magnitude, result[0].magnitude[1::2].max()
+        )
+        assert np.isclose(regions[5]["volume"].magnitude, 12 * 500 * (1000 / 3) * 0.25)
+
+    def test_extensive_region_integrals_are_summed(self):
+
+        regions = otuc.process_mesh_tally_regions(
+            tally=self.my_tally,
+            regions=self.regions,
+            required_units="W",
+            source_strength=1e20,
+            quantity="extensive",
+        )
+
+        total = otuc.process_tally(
+            tally=self.my_tally, required_units="W", source_strength=1e20
+        )
+
+        integral = sum(region["integral"][0] for region in regions.values())
+
+        assert integral.units == "watt"
+        assert np.isclose(integral.magnitude, total[0].magnitude.sum())
+
+    def test_region_statistics_need_the_quantity(self):
+
+        with pytest.raises(TypeError):
+            otuc.process_mesh_tally_regions(
+                tally=self.my_tally,
+                regions=self.regions,
+                required_units="W / m ** 3",
+                source_strength=1e20,
+            )
+
+    def test_labels_with_wrong_shape(self):
+
+        with pytest.raises(ValueError):
+            otuc.find_region_index(self.mesh, labels=np.zeros(5, dtype=int))
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+        self.mesh = self.my_tally.find_filter(openmc.MeshFilter).mesh
+
+        self.result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+    def test_voxel_indices(self):
+
+        points = [[-499, -499, 0.1], [499, -499, 0.1], [0, 0, 5]]
+
+        voxel_indices = otuc.find_voxel_indices(self.mesh, points)
+
+        assert np.array_equal(voxel_indices, [0, 1, -1])
+
+    def test_nearest_sampling_at_voxel_centres(self):
+
+        voxel_centres = otuc.find_voxel_centres(self.mesh)
+
+        sampled = otuc.sample_mesh_tally(
+            tally=self.my_tally,
+            points=voxel_centres,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+        )
+
+        assert sampled[0].units == "watt / meter ** 3"
+        assert np.allclose(sampled[0].magnitude, self.result[0].magnitude)
+        assert np.allclose(sampled[1].magnitude, self.result[1].magnitude)
+
+    def test_linear_sampling_at_voxel_centres(self):
+
+        voxel_centres = otuc.find_voxel_centres(self.mesh)
+
+        sampled = otuc.sample_mesh_tally_result(
+            self.result, self.mesh, voxel_centres, interpolation="linear"
+        )
+
+        assert np.allclose(sampled[0].magnitude, self.result[0].magnitude)
+
+    def test_line_profile(self):
+
+        distances, points = otuc.find_line_points(
+            start=(0, 0, 0.5), end=(600, 0, 0.5), number_of_points=7
+        )
+
+        sampled = otuc.sample_mesh_tally_result(
+            self.result, self.mesh, points, interpolation="linear"
+        )
+
+        assert np.isclose(distances[-1], 600)
+        assert sampled[0].shape == (7,)
+        assert np.all(np.isfinite(sampled[0].magnitude[:6]))
+        # the last point is outside the mesh
+        assert np.isnan(sampled[0].magnitude[-1])
+
+    def test_invalid_interpolation(self):
+
+        with pytest.raises(ValueError):
+            otuc.sample_mesh_tally_result(
+                self.result, self.mesh, [[0, 0, 0.5]], interpolation="cubic"
+            )
@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+import pytest
+from multiprocessing import shared_memory
+from unittest import mock
+
+from openmc_tally_unit_converter import shared
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+
+        self.result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+    def test_parallel_results_use_shared_memory(self):
+
+        shared_results = otuc.process_tallies_with_shared_memory(
+            ["statepoint.2.h5"],
+            {
+                "heating_on_3D_mesh": {
+                    "required_units": "W / m ** 3",
+                    "source_strength": 1e20,
+                }
+            },
+            workers=2,
+        )
+
+        shared_result = shared_results[("statepoint.2.h5", "heating_on_3D_mesh")]
+        handle = shared_result.handles[0]
+        assert handle.units == "watt / meter ** 3"
+        assert handle.shape == self.result[0].shape
+
+        tally_mean, tally_std_dev = shared_result.result
+        assert np.allclose(tally_mean.magnitude, self.result[0].magnitude)
+        assert np.allclose(tally_std_dev.magnitude, self.result[1].magnitude)
+
+        shared_result.release()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle.name)
+
+    def test_share_sparse_result(self):
+
+        sparse_result = otuc.process_sparse_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+        handles = otuc.share_tally_result(sparse_result)
+
+        with otuc.SharedTallyResult(handles) as shared_result:
+            assert np.array_equal(shared_result.result.indices, sparse_result.indices)
+            assert np.allclose(
+                shared_result.result.to_dense()[0].magnitude,
+                self.result[0].magnitude,
+            )
+
+    def test_failed_share_removes_created_blocks(self):
+        """the blocks shared before an array fails are unlinked"""
+
+        class Unshareable:
+            def __array__(self, *args, **kwargs):
+                raise ValueError("can't be converted to an array")
+
+        handles = []
+        original_share_array = shared._share_array
+
+        def share_array(values):
+            handle = original_share_array(values)
+            handles.append(handle)
+            return handle
+
+        with mock.patch.object(shared, "_share_array", side_effect=share_array):
+            with pytest.raises(ValueError):
+                otuc.share_tally_result((self.result[0], Unshareable()))
+
+        assert len(handles) == 1
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handles[0].name)
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+
+        self.result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+    def test_sparsity(self):
+
+        sparsity = otuc.find_tally_sparsity(self.my_tally)
+
+        assert np.isclose(sparsity, np.mean(self.result[0].magnitude == 0))
+
+    def test_sparse_result_matches_dense_result(self):
+
+        sparse_result = otuc.process_sparse_tally(
+            tally=self.my_tally,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            chunk_size=5,
+        )
+
+        assert sparse_result.size == 24
+        assert sparse_result.units == "watt / meter ** 3"
+        assert np.all(sparse_result.mean.magnitude != 0)
+
+        dense_result = sparse_result.to_dense()
+        assert np.allclose(dense_result[0].magnitude, self.result[0].magnitude)
+        assert np.allclose(dense_result[1].magnitude, self.result[1].magnitude)
+
+        csr = sparse_result.to_csr()
+        assert csr.shape == (1, 24)
+        assert np.allclose(csr.toarray()[0], self.result[0].magnitude)
+
+    def test_sparse_region_statistics(self):
+
+        sparse_result = otuc.process_sparse_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+        mesh = self.my_tally.find_filter(openmc.MeshFilter).mesh
+        labels = np.zeros((2, 3, 4), dtype=int)
+        labels[1] = 1
+        region_index, region_names = otuc.find_region_index(mesh, labels=labels)
+        voxel_volume = otuc.compute_volume_of_voxels(self.my_tally)
+
+        sparse_statistics = otuc.find_region_statistics(
+            sparse_result, region_index, region_names, voxel_volume, "intensive"
+        )
+        dense_statistics = otuc.find_region_statistics(
+            self.result, region_index, region_names, voxel_volume, "intensive"
+        )
+
+        for region_name in region_names:
+            for statistic in ["integral", "maximum"]:
+                assert np.isclose(
+                    sparse_statistics[region_name][statistic][0].magnitude,
+                    dense_statistics[region_name][statistic][0].magnitude,
+                )
@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_neutron_spectra")
+
+        # the results are read before the cell filter is replaced with a
+        # rectilinear mesh filter with the same number of bins
+        self.my_tally.mean
+        self.my_tally.std_dev
+        cell_filter = self.my_tally.find_filter(openmc.CellFilter)
+
+        self.mesh = openmc.RectilinearMesh()
+        self.mesh.x_grid = np.linspace(0, 2, cell_filter.num_bins + 1)
+        self.mesh.y_grid = [0, 3]
+        self.mesh.z_grid = [0, 5]
+        self.voxel_volume = 2 * 3 * 5 / cell_filter.num_bins
+
+        filters = list(self.my_tally.filters)
+        filters[filters.index(cell_filter)] = openmc.MeshFilter(self.mesh)
+        self.my_tally.filters = filters
+
+    def test_rectilinear_mesh_spectra_per_volume(self):
+
+        result = otuc.process_spectra_tally(
+            tally=self.my_tally,
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+        )
+        result_with_volume = otuc.process_spectra_tally(
+            tally=self.my_tally,
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+            volume=self.voxel_volume,
+        )
+
+        assert np.allclose(result[1].magnitude, result_with_volume[1].magnitude)
+        assert np.allclose(result[2].magnitude, result_with_volume[2].magnitude)
+
+    def test_rectilinear_mesh_spectra_rebinning_per_volume(self):
+        """the voxel volumes are broadcast to the rebinned energy groups"""
+
+        result = otuc.rebin_spectra_tally(
+            tally=self.my_tally,
+            group_structure="VITAMIN-J-175",
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+        )
+        result_with_volume = otuc.rebin_spectra_tally(
+            tally=self.my_tally,
+            group_structure="VITAMIN-J-175",
+            required_units="neutron / cm ** 2 / s",
+            source_strength=1e20,
+            volume=self.voxel_volume,
+        )
+
+        assert len(result[1]) == 175 * self.mesh.dimension[0]
+        assert np.allclose(result[1].magnitude, result_with_volume[1].magnitude)
+
+    def test_rectilinear_mesh_dose_from_spectra_per_volume(self):
+        """the voxel volumes are broadcast to the collapsed energy axis"""
+
+        result = otuc.process_dose_from_spectra_tally(
+            tally=self.my_tally,
+            required_units="Sv / hour",
+            source_strength=1e20,
+        )
+        result_with_volume = otuc.process_dose_from_spectra_tally(
+            tally=self.my_tally,
+            required_units="Sv / hour",
+            source_strength=1e20,
+            volume=self.voxel_volume,
+        )
+
+        assert len(result[0]) == self.mesh.dimension[0]
+        assert np.allclose(result[0].magnitude, result_with_volume[0].magnitude)
@@ -0,0 +1,117 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+
+        self.result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+    def test_chunks_match_processed_tally(self):
+
+        chunks = list(
+            otuc.iter_converted_chunks(
+                tally=self.my_tally,
+                required_units="W / m ** 3",
+                source_strength=1e20,
+                chunk_size=5,
+            )
+        )
+
+        assert len(chunks) > 1
+        assert np.allclose(
+            np.concatenate([chunk[1].magnitude for chunk in chunks]),
+            self.result[0].magnitude,
+        )
+        assert np.allclose(
+            np.concatenate([chunk[2].magnitude for chunk in chunks]),
+            self.result[1].magnitude,
+        )
+
+    def test_streaming_peak_and_integral(self):
+
+        statistics = otuc.find_streaming_statistics(
+            tally=self.my_tally,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            chunk_size=5,
+            quantity="intensive",
+        )
+
+        peak_index = np.argmax(self.result[0].magnitude)
+
+        assert statistics["maximum_index"] == peak_index
+        assert np.isclose(
+            statistics["maximum"][0].magnitude, self.result[0].magnitude[peak_index]
+        )
+        assert np.isclose(
+            statistics["maximum"][1].magnitude, self.result[1].magnitude[peak_index]
+        )
+
+        total = otuc.process_tally(
+            tally=self.my_tally, required_units="W", source_strength=1e20
+        )
+        assert statistics["integral"][0].units == "watt"
+        assert np.isclose(statistics["integral"][0].magnitude, total[0].magnitude.sum())
+
+    def test_streaming_extensive_integral(self):
+
+        statistics = otuc.find_streaming_statistics(
+            tally=self.my_tally,
+            required_units="W",
+            source_strength=1e20,
+            chunk_size=5,
+            quantity="extensive",
+        )
+
+        total = otuc.process_tally(
+            tally=self.my_tally, required_units="W", source_strength=1e20
+        )
+        assert statistics["integral"][0].units == "watt"
+        assert np.isclose(statistics["integral"][0].magnitude, total[0].magnitude.sum())
+
+    def test_streaming_percentiles(self):
+
+        statistics = otuc.find_streaming_statistics(
+            tally=self.my_tally,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            percentiles=[100],
+            quantity="intensive",
+        )
+
+        assert np.isclose(
+            statistics["percentiles"][100].magnitude,
+            self.result[0].magnitude.max(),
+            rtol=0.05,
+        )
+
+    def test_invalid_percentile(self):
+
+        with pytest.raises(ValueError):
+            otuc.find_streaming_statistics(
+                tally=self.my_tally,
+                required_units="W / m ** 3",
+                source_strength=1e20,
+                percentiles=[101],
+                quantity="intensive",
+            )
+
+    def test_streaming_statistics_need_the_quantity(self):
+
+        with pytest.raises(TypeError):
+            otuc.find_streaming_statistics(
+                tally=self.my_tally,
+                required_units="W / m ** 3",
+                source_strength=1e20,
+            )
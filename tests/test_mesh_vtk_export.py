@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="heating_on_3D_mesh")
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.filename = Path(self.temporary_directory.name) / "heating.vti"
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def read_appended_array(self, name):
+        """Reads an appended array from the VTK file using the offset in the
+        XML header"""
+
+        data = self.filename.read_bytes()
+        appended_start = data.index(b"_", data.index(b"<AppendedData")) + 1
+        header = data[:appended_start].decode()
+
+        name_start = header.index(f'Name="{name}"')
+        offset_start = header.index('offset="', name_start) + len('offset="')
+        offset = int(header[offset_start : header.index('"', offset_start)])
+
+        start = appended_start + offset
+        number_of_bytes = int(np.frombuffer(data[start : start + 8], "<u8")[0])
+        return np.frombuffer(data[start + 8 : start + 8 + number_of_bytes], "<f8")
+
+    def test_write_regular_mesh_to_vtk(self):
+
+        array_names = otuc.write_mesh_tally_to_vtk(
+            filename=self.filename,
+            tally=self.my_tally,
+            required_units="W / m ** 3",
+            source_strength=1e20,
+            chunk_size=5,
+        )
+        result = otuc.process_tally(
+            tally=self.my_tally, required_units="W / m ** 3", source_strength=1e20
+        )
+
+        assert array_names == [
+            "mean [watt / meter ** 3]",
+            "std. dev. [watt / meter ** 3]",
+        ]
+        assert b'<VTKFile type="ImageData"' in self.filename.read_bytes()
+        assert np.allclose(
+            self.read_appended_array(array_names[0]), result[0].magnitude
+        )
+        assert np.allclose(
+            self.read_appended_array(array_names[1]), result[1].magnitude
+        )
+
+    def test_volume_of_rectilinear_mesh_voxels(self):
+
+        mesh = openmc.RectilinearMesh()
+        mesh.x_grid = [0, 1, 3]
+        mesh.y_grid = [0, 2]
+        mesh.z_grid = [0, 1, 5]
+
+        tally = openmc.Tally()
+        tally.filters = [openmc.MeshFilter(mesh)]
+        tally.scores = ["heating"]
+
+        assert np.allclose(otuc.compute_volume_of_voxels(tally), [2, 4, 8, 16])
+
+    def test_volume_of_cylindrical_mesh_voxels(self):
+
+        mesh = openmc.CylindricalMesh(
+            r_grid=[0, 1, 2], phi_grid=[0, np.pi, 2 * np.pi], z_grid=[0, 3]
+        )
+
+        assert np.allclose(
+            otuc.find_volumes_of_mesh_voxels(mesh),
+            [1.5 * np.pi, 4.5 * np.pi, 1.5 * np.pi, 4.5 * np.pi],
+        )
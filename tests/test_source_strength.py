@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import pytest
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally_heat = statepoint.get_tally(name="2_heating")
+
+    def test_fuel_mixture_energy_per_reaction(self):
+
+        dt_energy = otuc.find_fusion_energy_per_reaction("DT")
+        dd_energy = otuc.find_fusion_energy_per_reaction("DD")
+
+        assert otuc.find_fusion_energy_per_reaction(1.0) == dt_energy
+        assert otuc.find_fusion_energy_per_reaction(0.0) == dd_energy
+        assert np.allclose(
+            otuc.find_fusion_energy_per_reaction([0.25, 0.5]),
+            [0.25 * dt_energy + 0.75 * dd_energy, 0.5 * dt_energy + 0.5 * dd_energy],
+        )
+
+    def test_invalid_fuel_mixture(self):
+
+        with pytest.raises(ValueError):
+            otuc.find_fusion_energy_per_reaction(1.5)
+
+        with pytest.raises(ValueError):
+            otuc.find_fusion_energy_per_reaction("DHe3")
+
+    def test_source_strength_sweep(self):
+        """powers and fuel mixtures are broadcast against each other"""
+
+        fusion_powers = np.linspace(1e8, 3e9, 100)
+        dt_fractions = np.array([1.0, 0.9, 0.5])
+
+        source_strengths = otuc.find_source_strength(
+            fusion_energy_per_second_or_per_pulse=fusion_powers[:, np.newaxis],
+            reactants=dt_fractions[np.newaxis, :],
+        )
+
+        assert source_strengths.shape == (100, 3)
+        assert np.isclose(
+            source_strengths[-1, 0], otuc.find_source_strength(3e9, reactants="DT")
+        )
+
+    def test_cell_tally_heating_power_sweep(self):
+
+        fusion_powers = np.linspace(1e8, 3e9, 100)
+        source_strengths = otuc.find_source_strength(fusion_powers)
+
+        result = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts",
+            source_strength=source_strengths,
+        )
+
+        assert result[0].units == "watt"
+        assert result[1].units == "watt"
+        assert result[0].shape[0] == 100
+        assert result[1].shape[0] == 100
+
+        single_result = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts",
+            source_strength=source_strengths[10],
+        )
+        assert np.allclose(result[0][10].magnitude, single_result[0].magnitude)
@@ -0,0 +1,121 @@
+import unittest
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+import pytest
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally_heat = statepoint.get_tally(name="2_heating")
+        self.my_damage_tally = statepoint.get_tally(name="2_damage-energy")
+
+        self.my_mat = openmc.Material()
+        self.my_mat.add_element("Fe", 1)
+        self.my_mat.set_density("g/cm3", 7.8)
+
+    def test_no_input_std_dev_is_unchanged(self):
+
+        result = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts / cm ** 3",
+            source_strength=1e9,
+            volume=5,
+        )
+
+        result_with_zero_std_dev = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts / cm ** 3",
+            source_strength=1e9,
+            volume=5,
+            source_strength_std_dev=0,
+            volume_std_dev=0,
+        )
+
+        assert np.allclose(result[0].magnitude, result_with_zero_std_dev[0].magnitude)
+        assert np.allclose(result[1].magnitude, result_with_zero_std_dev[1].magnitude)
+
+    def test_input_std_devs_combine_in_quadrature(self):
+
+        result = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts / cm ** 3",
+            source_strength=1e9,
+            volume=5,
+        )
+
+        result_with_std_dev = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts / cm ** 3",
+            source_strength=1e9,
+            volume=5,
+            source_strength_std_dev=1e8,
+            volume_std_dev=0.5,
+        )
+
+        expected_std_dev = np.sqrt(
+            result[1].magnitude ** 2 + result[0].magnitude ** 2 * (0.1**2 + 0.1**2)
+        )
+
+        assert np.allclose(result_with_std_dev[0].magnitude, result[0].magnitude)
+        assert np.allclose(result_with_std_dev[1].magnitude, expected_std_dev)
+
+    def test_unused_input_std_dev_is_ignored(self):
+        """the volume is not used when converting to watts"""
+
+        result = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts",
+            source_strength=1e9,
+        )
+
+        result_with_std_dev = otuc.process_tally(
+            tally=self.my_tally_heat,
+            required_units="watts",
+            source_strength=1e9,
+            volume=5,
+            volume_std_dev=0.5,
+        )
+
+        assert np.allclose(result_with_std_dev[1].magnitude, result[1].magnitude)
+
+    def test_damage_density_std_dev(self):
+
+        result = otuc.process_damage_energy_tally(
+            tally=self.my_damage_tally,
+            required_units="displacements / atom",
+            energy_per_displacement=40,
+            volume=5,
+            material=self.my_mat,
+        )
+
+        result_with_std_dev = otuc.process_damage_energy_tally(
+            tally=self.my_damage_tally,
+            required_units="displacements / atom",
+            energy_per_displacement=40,
+            volume=5,
+            material=self.my_mat,
+            density_std_dev=0.078,
+            energy_per_displacement_std_dev=4,
+        )
+
+        expected_std_dev = np.sqrt(
+            result[1].magnitude ** 2 + result[0].magnitude ** 2 * (0.01**2 + 0.1**2)
+        )
+
+        assert np.allclose(result_with_std_dev[1].magnitude, expected_std_dev)
+
+    def test_unsupported_time_dimensionality(self):
+        """only one power of time can be scaled with the source strength"""
+
+        with pytest.raises(ValueError):
+            otuc.process_tally(
+                tally=self.my_tally_heat,
+                required_units="watts / second",
+                source_strength=1e9,
+                source_strength_std_dev=1e7,
+            )
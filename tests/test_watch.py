@@ -0,0 +1,87 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmc_tally_unit_converter as otuc
+import openmc
+
+
+class TestUsage(unittest.TestCase):
+    def setUp(self):
+
+        # loads in the statepoint file containing tallies
+        statepoint = openmc.StatePoint(filepath="statepoint.2.h5")
+        self.my_tally = statepoint.get_tally(name="2_heating")
+
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temporary_directory.name)
+        (self.directory / "run").mkdir()
+
+        self.spec = {"2_heating": {"required_units": "watts", "source_strength": 1e20}}
+        self.watcher = otuc.StatepointWatcher(
+            directory=self.directory / "run",
+            spec=self.spec,
+            output_directory=self.directory / "results",
+        )
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_statepoints_are_converted_once(self):
+
+        shutil.copy("statepoint.2.h5", self.directory / "run" / "statepoint.2.h5")
+
+        # the statepoint is converted once it is unchanged between two polls
+        assert self.watcher.poll() == []
+        assert len(self.watcher.poll()) == 1
+        assert self.watcher.poll() == []
+
+        result, attributes = otuc.read_tally_from_hdf5(
+            self.directory / "results" / "latest_2_heating.h5", "2_heating"
+        )
+        expected = otuc.process_tally(
+            tally=self.my_tally, required_units="watts", source_strength=1e20
+        )
+        assert np.allclose(result[0].magnitude, expected[0].magnitude)
+
+        trends = json.loads((self.directory / "results" / "trends.json").read_text())
+        assert len(trends["trends"]) == 1
+        assert trends["trends"][0]["batch"] == 2
+        assert trends["trends"][0]["maximum_relative_error"] == max(
+            otuc.find_relative_error(expected)
+        )
+
+    def test_restarted_watcher_skips_converted_statepoints(self):
+
+        shutil.copy("statepoint.2.h5", self.directory / "run" / "statepoint.2.h5")
+        self.watcher.poll()
+        self.watcher.poll()
+
+        watcher = otuc.StatepointWatcher(
+            directory=self.directory / "run",
+            spec=self.spec,
+            output_directory=self.directory / "results",
+        )
+
+        assert watcher.poll() == []
+        assert watcher.poll() == []
+
+    def test_statepoint_that_fails_is_recorded(self):
+
+        (self.directory / "run" / "statepoint.1.h5").write_bytes(b"not a statepoint")
+        shutil.copy("statepoint.2.h5", self.directory / "run" / "statepoint.2.h5")
+
+        self.watcher.poll()
+        # the corrupt statepoint does not stop the other statepoint converting
+        assert self.watcher.poll() == [str(self.directory / "run" / "statepoint.2.h5")]
+        assert self.watcher.poll() == []
+
+        trends = json.loads((self.directory / "results" / "trends.json").read_text())
+        assert len(trends["trends"]) == 2
+        assert trends["trends"][0]["batch"] == 1
+        assert "error" in trends["trends"][0]
+        assert "error" not in trends["trends"][1]
+        assert len(trends["processed"]) == 2